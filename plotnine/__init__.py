@@ -86,6 +86,7 @@ from .ggplot import (
     ggplot,
     ggsave,
     save_as_pdf_pages,
+    save_many,
 )
 from .guides import (
     guide_colorbar,
@@ -368,6 +369,7 @@ __all__ = (
     "position_stack",
     "qplot",
     "save_as_pdf_pages",
+    "save_many",
     "scale_alpha",
     "scale_alpha_continuous",
     "scale_alpha_datetime",
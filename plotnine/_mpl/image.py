@@ -0,0 +1,190 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from matplotlib.image import AxesImage
+
+if TYPE_CHECKING:
+    from typing import Any, Optional
+
+    from matplotlib.axes import Axes
+    from matplotlib.backend_bases import RendererBase
+
+    from plotnine.typing import FloatArray, IntArray
+
+
+class AggregateImage(AxesImage):
+    """
+    An image of points (or paths) aggregated onto the pixels of an axes
+
+    The image has one pixel for every pixel of the axes. It is created
+    when the axes is drawn, so it is always at the final size & dpi of
+    the figure. The color of a pixel is the mean of the colors that
+    land on it, and the alpha is that of the colors composited on top
+    of each other.
+
+    Parameters
+    ----------
+    ax :
+        Axes onto which to draw.
+    x, y :
+        Locations (in data coordinates) of the points.
+    rgba :
+        `(n, 4)` array of the colors of the points.
+    group :
+        If given, the points are the vertices of paths; each
+        consecutive pair of points in the same group is a line.
+        The points of a group must be contiguous.
+    kwargs :
+        Passed on to `AxesImage`.
+    """
+
+    def __init__(
+        self,
+        ax: Axes,
+        x: FloatArray,
+        y: FloatArray,
+        rgba: FloatArray,
+        group: Optional[IntArray] = None,
+        **kwargs: Any,
+    ):
+        super().__init__(ax, interpolation="nearest", origin="lower", **kwargs)
+        self._xy = np.column_stack([x, y]).astype(float)
+        self._rgba = rgba
+        self._group = group
+        self.set_data(np.zeros((1, 1, 4)))
+
+    def make_image(
+        self,
+        renderer: RendererBase,
+        magnification: float = 1.0,
+        unsampled: bool = False,
+    ):
+        self._aggregate(magnification)
+        return super().make_image(renderer, magnification, unsampled)
+
+    def _aggregate(self, magnification: float = 1.0):
+        """
+        Create the image at the current size of the axes
+
+        Parameters
+        ----------
+        magnification :
+            Ratio of the resolution of the image to that of the
+            renderer. The vector backends (pdf, svg, ...) measure the
+            axes at 72 dpi, and magnify the images to the dpi with
+            which the figure is saved.
+        """
+        ax = self.axes
+        bbox = ax.bbox
+        width = max(int(np.ceil(bbox.width * magnification)), 1)
+        height = max(int(np.ceil(bbox.height * magnification)), 1)
+
+        pixels = ax.transData.transform(self._xy)
+        pixels -= (bbox.x0, bbox.y0)
+        pixels *= magnification
+        px, py, rgba = pixels[:, 0], pixels[:, 1], self._rgba
+        if self._group is not None:
+            px, py, rgba = rasterize_segments(px, py, rgba, self._group)
+
+        self.set_data(aggregate(px, py, rgba, width, height))
+        x0, x1 = ax.get_xlim()
+        y0, y1 = ax.get_ylim()
+        self.set_extent((x0, x1, y0, y1))
+
+
+def aggregate(
+    px: FloatArray,
+    py: FloatArray,
+    rgba: FloatArray,
+    width: int,
+    height: int,
+) -> FloatArray:
+    """
+    Accumulate colored points onto a grid of pixels
+
+    Parameters
+    ----------
+    px, py :
+        Locations of the points in pixels. Points outside the grid
+        are ignored.
+    rgba :
+        `(n, 4)` array of the colors of the points.
+    width, height :
+        Size of the grid.
+
+    Returns
+    -------
+    out :
+        `(height, width, 4)` image.
+    """
+    inside = (px >= 0) & (px < width) & (py >= 0) & (py < height)
+    ix = px[inside].astype(np.intp)
+    iy = py[inside].astype(np.intp)
+    idx = iy * width + ix
+    rgba = rgba[inside]
+    alpha = rgba[:, 3]
+    size = width * height
+
+    # Mean color (weighted by alpha) & the alpha of stacking all the
+    # colors i.e. 1 - (1-a1)(1-a2)...(1-an)
+    total_alpha = np.bincount(idx, alpha, size)
+    log_transparency = np.bincount(
+        idx, np.log1p(-np.minimum(alpha, 1 - 1e-12)), size
+    )
+    image = np.zeros((size, 4))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        for i in range(3):
+            image[:, i] = np.bincount(idx, rgba[:, i] * alpha, size)
+            image[:, i] /= total_alpha
+    image[:, :3] = np.nan_to_num(image[:, :3])
+    image[:, 3] = -np.expm1(log_transparency)
+    return image.reshape(height, width, 4)
+
+
+def rasterize_segments(
+    px: FloatArray,
+    py: FloatArray,
+    rgba: FloatArray,
+    group: IntArray,
+) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """
+    Sample the lines between consecutive points at every pixel
+
+    The end point of each line is left out, it is the start of the
+    next line in the path.
+
+    Parameters
+    ----------
+    px, py :
+        Locations of the vertices in pixels.
+    rgba :
+        Colors of the vertices. A line gets the color of its
+        start vertex.
+    group :
+        Path to which each vertex belongs.
+
+    Returns
+    -------
+    px, py, rgba :
+        Locations and colors of the points along the lines.
+    """
+    start = np.flatnonzero(group[:-1] == group[1:])
+    dx, dy = px[start + 1] - px[start], py[start + 1] - py[start]
+
+    # Missing values break the paths
+    finite = np.isfinite(dx) & np.isfinite(dy)
+    start, dx, dy = start[finite], dx[finite], dy[finite]
+    x0, y0 = px[start], py[start]
+    n = np.maximum(np.ceil(np.maximum(np.abs(dx), np.abs(dy))), 1)
+    n = n.astype(np.intp)
+
+    line = np.repeat(np.arange(len(start)), n)
+    offsets = np.repeat(np.cumsum(n) - n, n)
+    t = (np.arange(len(line)) - offsets) / n[line]
+    return (
+        x0[line] + t * dx[line],
+        y0[line] + t * dy[line],
+        rgba[start][line],
+    )
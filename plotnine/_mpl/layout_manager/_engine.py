@@ -36,13 +36,16 @@ class PlotnineLayoutEngine(LayoutEngine):
         from contextlib import nullcontext
 
         from plotnine import ggplot
+        from plotnine._utils.profile import profile_stage, resume_profiling
 
         item = self.item
         renderer = fig._get_renderer()  # pyright: ignore[reportAttributeAccessIssue]
 
         with getattr(renderer, "_draw_disabled", nullcontext)():
             if isinstance(item, ggplot):
-                item._sidespaces = PlotSideSpaces(item)
+                with resume_profiling(item), profile_stage("layout_engine"):
+                    item._sidespaces = PlotSideSpaces(item)
+                    item._sidespaces.arrange()
             else:
                 item._sidespaces = CompositionSideSpaces(item)
-            item._sidespaces.arrange()
+                item._sidespaces.arrange()
@@ -31,10 +31,12 @@ if TYPE_CHECKING:
 
     from plotnine.typing import (
         AnyArrayLike,
+        DataFrameConvertible,
         DataLike,
         FloatArray,
         FloatArrayLike,
         HorizontalJustification,
+        IntArray,
         Side,
         VerticalJustification,
     )
@@ -61,6 +63,64 @@ BOX_LOCATIONS: dict[str, tuple[float, float]] = {
 to_rgba = color_utils.to_rgba
 
 
+def to_rgba_array(
+    colors: pd.Series | Sequence[Any], alpha: pd.Series | Sequence[float]
+) -> FloatArray:
+    """
+    Convert colors to an array of rgba values
+
+    The result is the same as that of `to_rgba`, but as an `(n, 4)`
+    array of floats that matplotlib does not have to parse. Each
+    distinct color & alpha pair is converted only once.
+
+    Parameters
+    ----------
+    colors :
+        Colors to convert.
+    alpha :
+        Alpha values, one for each color.
+    """
+    from matplotlib.colors import to_rgba_array as mpl_to_rgba_array
+
+    try:
+        color_codes, color_uniques = pd.factorize(
+            np.asarray(colors, dtype=object)
+        )
+    except TypeError:
+        # Unhashable colors e.g. lists
+        return mpl_to_rgba_array(to_rgba(list(colors), alpha))
+
+    # Missing colors are None, to_rgba makes them "none"
+    color_codes[color_codes < 0] = len(color_uniques)
+    color_uniques = np.append(color_uniques, None)
+
+    alpha_codes, alpha_uniques = pd.factorize(
+        np.asarray(alpha), use_na_sentinel=False
+    )
+    pair_codes = color_codes * len(alpha_uniques) + alpha_codes
+    upairs, inverse = np.unique(pair_codes, return_inverse=True)
+    ucolors = color_uniques[upairs // len(alpha_uniques)]
+    ualpha = alpha_uniques[upairs % len(alpha_uniques)]
+    rgba = mpl_to_rgba_array(
+        [to_rgba(c, a) for c, a in zip(ucolors, ualpha.tolist())]
+    )
+    return rgba[inverse.ravel()]
+
+
+def collapse_constant(arr: Any) -> Any:
+    """
+    Reduce an array whose values (rows) are all equal to one value
+
+    Matplotlib does less work for a collection if a property
+    is the same for all the items.
+    """
+    if arr is None or len(arr) < 2:
+        return arr
+    elif (arr == arr[0]).all():
+        return arr[:1] if arr.ndim == 2 else arr[0]
+    return arr
+
+
 def side_artists(side: str) -> tuple[str, str]:
     """
     Return the `(tickline, label)` tick-attribute names for an axis side
@@ -301,7 +361,7 @@ def add_margins(
     return merged
 
 
-def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
+def ninteraction(df: pd.DataFrame, drop: bool = False) -> IntArray:
     """
     Compute a unique numeric id for each unique row in
     a data frame. The ids start at 1 -- in the spirit
@@ -317,7 +377,7 @@ def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
 
     Returns
     -------
-    out : list
+    out : array
         Row assignments.
 
     Notes
@@ -326,26 +386,29 @@ def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
     of categorical variables.
     """
     if len(df) == 0:
-        return []
+        return np.array([], dtype=np.int64)
 
     # Special case for single variable
     if len(df.columns) == 1:
-        return _id_var(df[df.columns[0]], drop)
-
-    # Calculate individual ids
-    ids = df.apply(_id_var, axis=0, drop=drop)
-    ids = ids.reindex(columns=list(reversed(ids.columns)))
-
-    # Calculate dimensions
-    def len_unique(x):
-        return len(np.unique(x))
-
-    ndistinct = ids.apply(len_unique, axis=0).to_numpy()
-
-    combs = np.array(np.hstack([1, np.cumprod(ndistinct[:-1])]))
-    mat = np.array(ids)
-    _res = (mat - 1) @ combs.T + 1
-    res: list[int] = np.array(_res).flatten().tolist()
+        return _id_var(df.iloc[:, 0], drop)
+
+    # Combine the ids of the columns into a mixed-radix number
+    # where the first column is the most significant digit.
+    # When the number may not fit in an int64, the ids computed
+    # so far are made contiguous, which keeps the order.
+    res = np.zeros(len(df), dtype=np.int64)
+    size = 1
+    for i in range(len(df.columns)):
+        ids = _id_var(df.iloc[:, i], drop)
+        n = int(ids.max())
+        if size * n > np.iinfo(np.int64).max:
+            res = _id_var(res, drop=True) - 1
+            size = int(res.max()) + 1
+            if size * n > np.iinfo(np.int64).max:
+                raise PlotnineError("Too many unique rows to assign ids.")
+        res = res * n + (ids - 1)
+        size *= n
+    res += 1
 
     if drop:
         return _id_var(res, drop)
@@ -353,13 +416,12 @@ def ninteraction(df: pd.DataFrame, drop: bool = False) -> list[int]:
         return res
 
 
-def _id_var(x: AnyArrayLike, drop: bool = False) -> list[int]:
+def _id_var(x: AnyArrayLike | Sequence[Any], drop: bool = False) -> IntArray:
     """
     Assign ids to items in x
 
     If two items are the same, they get the same id.
-    The ids start at 1 and, for categorical data, NaNs
-    get the highest id.
+    The ids start at 1 and NaNs get the highest id.
 
     Parameters
     ----------
@@ -371,10 +433,10 @@ def _id_var(x: AnyArrayLike, drop: bool = False) -> list[int]:
     Returns
     -------
     ids:
-        List of ids
+        Array of ids
     """
     if len(x) == 0:
-        return []
+        return np.array([], dtype=np.int64)
 
     if isinstance(x, pd.Series) and array_kind.categorical(x):
         # The ids are a "re-coding" of the categorical codes/levels
@@ -382,26 +444,27 @@ def _id_var(x: AnyArrayLike, drop: bool = False) -> list[int]:
         if drop:
             x = x.cat.remove_unused_categories()
 
-        codes = x.cat.codes
-
-        # We want our list to start at 1.
-        # But NaNs are -1, and if we have them, we want them to have
-        # the highest code, i.e. to be ordered last.
-        ids = list(codes + 1)
-        has_nan = (codes == -1).any()
-        if has_nan:
-            # The NaNs now have an id of 0
-            highest_id = max(ids) + 1
-            ids = [highest_id if i == 0 else i for i in ids]
+        codes = x.cat.codes.to_numpy()
     else:
+        if not hasattr(x, "dtype"):
+            x = pd.Series(x, dtype=object)
+
         try:
-            levels = sorted(set(x))
+            codes, _ = pd.factorize(x, sort=True)
         except TypeError:
-            # x probably has NANs
-            levels = multitype_sort(list(set(x)))
-
-        ids = list(match(x, levels, start=1))
-
+            # Values of types that cannot be compared
+            codes, uniques = pd.factorize(x)
+            lookup = {v: i for i, v in enumerate(multitype_sort(uniques))}
+            order = np.array([lookup[v] for v in uniques], dtype=np.int64)
+            codes = np.where(codes == -1, -1, order[codes])
+
+    # We want our ids to start at 1.
+    # But NaNs are -1, and if we have them, we want them to have
+    # the highest id, i.e. to be ordered last.
+    ids = codes.astype(np.int64) + 1
+    nan = ids == 0
+    if nan.any():
+        ids[nan] = ids.max() + 1
     return ids
 
 
@@ -459,6 +522,103 @@ def uniquecols(data):
     return data
 
 
+def group_bounds(*arrays: AnyArrayLike) -> IntArray:
+    """
+    Return the boundaries of the runs of equal values in sorted arrays
+
+    Parameters
+    ----------
+    *arrays :
+        Arrays of the same length, sorted so that equal (combinations
+        of) values are next to each other.
+
+    Returns
+    -------
+    out :
+        Array of size `ngroups + 1`. The rows of group `i` are
+        `bounds[i]:bounds[i+1]`.
+    """
+    n = len(arrays[0])
+    if n == 0:
+        return np.array([0])
+
+    changed = np.zeros(n - 1, dtype=bool)
+    for arr in arrays:
+        arr = np.asarray(arr)
+        changed |= arr[1:] != arr[:-1]
+
+    return np.hstack([0, np.flatnonzero(changed) + 1, n])
+
+
+def _value_changes(x: pd.Series) -> npt.NDArray[np.bool_]:
+    """
+    Return whether each value differs from the one before it
+
+    Missing values are equal to each other. The result has one
+    item less than x.
+    """
+    if isinstance(x.dtype, pd.CategoricalDtype):
+        arr = x.cat.codes.to_numpy()
+    else:
+        arr = x.to_numpy()
+
+    na = pd.isna(arr)
+    changed = np.asarray(arr[1:] != arr[:-1], dtype=bool)
+    if na.any():
+        changed &= ~(na[1:] & na[:-1])
+    return changed
+
+
+def group_uniquecols(data: pd.DataFrame, bounds: IntArray) -> pd.DataFrame:
+    """
+    Return the columns that are constant within the groups of data
+
+    This is the vectorised equivalent of calling
+    [](`~plotnine._utils.uniquecols`) on each group. A column that is
+    constant in some groups but not in others is kept, with missing
+    values for the groups in which it varies.
+
+    Parameters
+    ----------
+    data :
+        Data with the rows of each group next to each other.
+    bounds :
+        Boundaries of the groups in data. See
+        [](`~plotnine._utils.group_bounds`).
+
+    Returns
+    -------
+    out :
+        Dataframe with a row for each group.
+    """
+    sizes = np.diff(bounds)
+    ngroups = len(sizes)
+
+    # A column is constant within a group if no value in the group
+    # differs from the one before it. That only needs a comparison
+    # of neighbouring values and no hashing of the values.
+    pair_group = np.repeat(np.arange(ngroups), sizes)[1:]
+    within = np.ones(max(len(data) - 1, 0), dtype=bool)
+    within[bounds[1:-1] - 1] = False
+    constant = np.ones((ngroups, len(data.columns)), dtype=bool)
+    for i, (_, col) in enumerate(data.items()):
+        changed = _value_changes(col) & within
+        if changed.any():
+            constant[:, i] = (
+                np.bincount(pair_group[changed], minlength=ngroups) == 0
+            )
+
+    first = data.iloc[bounds[:-1]].reset_index(drop=True)
+
+    keep = constant.any(axis=0)
+    first = first.loc[:, keep]
+    constant = constant[:, keep]
+    for i, col in enumerate(first.columns):
+        if not constant[:, i].all():
+            first[col] = first[col].where(constant[:, i])
+    return first
+
+
 def jitter(x, factor=1, amount=None, random_state=None):
     """
     Add a small amount of noise to values in an array_like
@@ -867,6 +1027,46 @@ def is_data_like(obj: Any) -> TypeGuard[DataLike]:
     )
 
 
+def to_pandas(
+    data: DataFrameConvertible, columns: Iterable[str] | None = None
+) -> pd.DataFrame:
+    """
+    Convert data to a pandas dataframe
+
+    Parameters
+    ----------
+    data :
+        Object with a `to_pandas` method, e.g. a polars dataframe
+        or an Arrow table.
+    columns :
+        Names of the columns to convert. Names that are not in the
+        data are ignored. If `None`, all the columns are converted.
+        Only polars & Arrow data is projected, for any other kind of
+        data all the columns are converted.
+
+    Returns
+    -------
+    out :
+        Dataframe with the same number of rows as the data.
+    """
+    package = type(data).__module__.split(".")[0]
+    if package not in ("polars", "pyarrow"):
+        return data.to_pandas()
+
+    # Select the columns before converting them, and let the numeric
+    # columns share their memory with the arrow buffers.
+    if columns is not None:
+        # polars has .columns and Arrow has .column_names
+        names = getattr(data, "column_names", None) or data.columns  # pyright: ignore[reportAttributeAccessIssue]
+        columns = set(columns)
+        selected = [name for name in names if name in columns]
+        if not selected:
+            return pd.DataFrame(index=pd.RangeIndex(len(data)))  # pyright: ignore[reportArgumentType]
+        elif len(selected) < len(names):
+            data = data.select(selected)  # pyright: ignore[reportAttributeAccessIssue]
+    return data.to_pandas(split_blocks=True)  # pyright: ignore[reportCallIssue]
+
+
 def interleave(*arrays):
     """
     Interleave arrays
@@ -0,0 +1,128 @@
+"""
+Caches of (expensive) computations that are reused across plot builds
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from typing import Callable, Hashable, Optional
+
+    import pandas as pd
+
+T = TypeVar("T")
+
+
+class LRUCache(Generic[T]):
+    """
+    A mapping that keeps the most recently used items
+
+    Parameters
+    ----------
+    maxsize :
+        Maximum number of items to keep. When a new item is added
+        to a full cache, the least recently used item is evicted.
+        If `None`, the number of items is not limited.
+    maxbytes :
+        Maximum total size of the items. If given, the least
+        recently used items are also evicted to keep the items
+        within this size.
+    sizeof :
+        Function that returns the size (in bytes) of an item.
+        Required if `maxbytes` is given.
+    """
+
+    def __init__(
+        self,
+        maxsize: Optional[int] = 128,
+        maxbytes: Optional[int] = None,
+        sizeof: Optional[Callable[[T], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self._sizeof = sizeof
+        self._items: OrderedDict[Hashable, T] = OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._items
+
+    def get(self, key: Hashable) -> Optional[T]:
+        """
+        Return item and mark it as the most recently used
+
+        Returns `None` if there is no item with the key.
+        """
+        try:
+            value = self._items[key]
+        except KeyError:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key: Hashable, value: T):
+        """
+        Add an item, evicting the least recently used items if full
+        """
+        if key in self._items:
+            self._remove(key)
+
+        self._items[key] = value
+        if self._sizeof is not None:
+            self._sizes[key] = self._sizeof(value)
+            self.nbytes += self._sizes[key]
+
+        while self._items and self._is_full():
+            self._remove(next(iter(self._items)))
+
+    def _is_full(self) -> bool:
+        """
+        Return True if the cache holds more than it may
+        """
+        return (self.maxsize is not None and len(self) > self.maxsize) or (
+            self.maxbytes is not None and self.nbytes > self.maxbytes
+        )
+
+    def _remove(self, key: Hashable):
+        """
+        Remove an item
+        """
+        del self._items[key]
+        self.nbytes -= self._sizes.pop(key, 0)
+
+    def clear(self):
+        """
+        Remove all items and reset the hit/miss counts
+        """
+        self._items.clear()
+        self._sizes.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+
+
+def _dataframe_nbytes(df: pd.DataFrame) -> int:
+    """
+    Return the memory used by a dataframe
+    """
+    return int(df.memory_usage(deep=True).sum())
+
+
+# Built plot states, see ggplot._build
+BUILD_CACHE: LRUCache = LRUCache()
+
+# Predictions of the smoothing methods, see stat_smooth.compute_group
+SMOOTH_CACHE: LRUCache[pd.DataFrame] = LRUCache(
+    maxsize=None, maxbytes=0, sizeof=_dataframe_nbytes
+)
@@ -0,0 +1,120 @@
+"""
+Rendering plots in worker processes
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+from collections import deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Iterable, Iterator, Optional, TypeVar
+
+    T = TypeVar("T")
+    R = TypeVar("R")
+
+
+def options_snapshot() -> dict[str, Any]:
+    """
+    Return the values of all the plotnine options
+    """
+    from .. import options
+
+    return {name: options.get_option(name) for name in options.__annotations__}
+
+
+def _init_worker(opts: dict[str, Any]):
+    """
+    Prepare a worker process for drawing plots
+
+    The worker gets the options of the parent process, and it draws
+    with a non-interactive backend so that no windows are opened.
+    """
+    import matplotlib as mpl
+
+    from .. import options
+
+    mpl.use("Agg")
+    for name, value in opts.items():
+        options.set_option(name, value)
+
+
+def _call_pickled(func: Callable[[T], R], payload: bytes) -> R:
+    """
+    Call func on an item that was pickled in the parent process
+    """
+    return func(pickle.loads(payload))
+
+
+def ordered_map(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    workers: Optional[int] = 1,
+) -> Iterator[R]:
+    """
+    Lazily map func over items, possibly in worker processes
+
+    Parameters
+    ----------
+    func :
+        Function to apply to each item. When `workers > 1`, the
+        function, the items and the results must be picklable.
+    items :
+        Items to process. They are consumed lazily, at most
+        `2 * workers` of them are in flight at any time. So
+        a generator is never materialized all at once.
+    workers :
+        Number of worker processes. If `1`, the items are processed
+        in the current process. If `None`, the number of CPUs is
+        used.
+
+    Returns
+    -------
+    out :
+        Results, in the same order as the items.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+
+    if workers <= 1:
+        yield from map(func, items)
+        return
+
+    import multiprocessing as mp
+    from concurrent.futures import ProcessPoolExecutor
+
+    from ..exceptions import PlotnineError
+
+    # Forking a process that has matplotlib (and maybe a GUI event
+    # loop or threads) going is not safe, we start fresh processes.
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=mp.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(options_snapshot(),),
+    )
+    max_pending = 2 * workers
+    pending = deque()
+    try:
+        for item in items:
+            # Pickle the item here and not in the executor, an object
+            # that cannot be pickled then fails early and without
+            # breaking the pool.
+            try:
+                payload = pickle.dumps(item)
+            except Exception as err:
+                msg = (
+                    "Cannot send the item to a worker process, "
+                    "it is not picklable. Use workers=1."
+                )
+                raise PlotnineError(msg) from err
+            pending.append(executor.submit(_call_pickled, func, payload))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,240 @@
+"""
+Opt-in timing and memory instrumentation of the plot pipeline
+
+When the option `plotnine.options.profile` is `True`, every stage of
+building and drawing a plot is timed and the peak memory allocated
+during the stage is recorded. The report is available as
+[](:attr:`~plotnine.ggplot.profile`).
+"""
+
+from __future__ import annotations
+
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import ContextManager, Iterator, Optional
+
+    import pandas as pd
+
+    from plotnine import ggplot
+
+# The profiler that the stages are recorded into
+_ACTIVE: Optional[Profiler] = None
+
+_NULL_CONTEXT = nullcontext()
+
+
+@dataclass
+class stage_timing:
+    """
+    Timing of a single stage
+    """
+
+    stage: str
+    """Name of the stage e.g. compute_statistic, draw_layers"""
+
+    seconds: float
+    """Wall time spent in the stage"""
+
+    peak_memory: int
+    """Peak memory (in bytes) allocated above that at the start"""
+
+    layer: Optional[int] = None
+    """Index of the layer, if the stage is specific to a layer"""
+
+    panel: Optional[int] = None
+    """Panel number, if the stage is specific to a panel"""
+
+
+@dataclass
+class profile_report:
+    """
+    Timings of all the stages of building & drawing a plot
+
+    The stages are nested; the timing for a stage includes the time
+    of the per-layer and per-panel stages within it.
+    """
+
+    timings: list[stage_timing] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.timings)
+
+    def to_frame(self) -> pd.DataFrame:
+        """
+        Return the timings as a dataframe
+
+        There is a row for each stage, and columns
+        `stage`, `layer`, `panel`, `seconds` and `peak_memory`.
+        """
+        import pandas as pd
+
+        columns = ["stage", "layer", "panel", "seconds", "peak_memory"]
+        return pd.DataFrame(
+            [[getattr(t, c) for c in columns] for t in self.timings],
+            columns=columns,
+        ).astype({"layer": "Int64", "panel": "Int64"})
+
+    def total(self, stage: str) -> float:
+        """
+        Return the total time spent in the top-level of a stage
+
+        Parameters
+        ----------
+        stage :
+            Name of the stage
+        """
+        return sum(
+            t.seconds
+            for t in self.timings
+            if t.stage == stage and t.layer is None and t.panel is None
+        )
+
+
+@dataclass
+class _frame:
+    """
+    A stage that is being recorded
+    """
+
+    stage: str
+    layer: Optional[int]
+    panel: Optional[int]
+    start_time: float
+    start_memory: int
+    peak_memory: int
+
+
+class Profiler:
+    """
+    Record the timings of (nested) stages into a report
+    """
+
+    def __init__(self):
+        self.report = profile_report()
+        self._stack: list[_frame] = []
+
+    @contextmanager
+    def stage(
+        self,
+        name: str,
+        layer: Optional[int] = None,
+        panel: Optional[int] = None,
+    ) -> Iterator[None]:
+        """
+        Record the time & memory of the enclosed code as a stage
+
+        A stage that does not specify the layer or panel inherits
+        them from the stage that encloses it.
+        """
+        if self._stack:
+            outer = self._stack[-1]
+            layer = outer.layer if layer is None else layer
+            panel = outer.panel if panel is None else panel
+
+        # The peak is reset for each stage, so the enclosing stages
+        # have to take note of the peak so far
+        current, peak = tracemalloc.get_traced_memory()
+        for f in self._stack:
+            f.peak_memory = max(f.peak_memory, peak)
+        tracemalloc.reset_peak()
+
+        frame = _frame(name, layer, panel, perf_counter(), current, current)
+        self._stack.append(frame)
+        try:
+            yield
+        finally:
+            seconds = perf_counter() - frame.start_time
+            _, peak = tracemalloc.get_traced_memory()
+            frame.peak_memory = max(frame.peak_memory, peak)
+            self._stack.pop()
+            if self._stack:
+                outer = self._stack[-1]
+                outer.peak_memory = max(outer.peak_memory, frame.peak_memory)
+
+            self.report.timings.append(
+                stage_timing(
+                    stage=name,
+                    seconds=seconds,
+                    peak_memory=frame.peak_memory - frame.start_memory,
+                    layer=layer,
+                    panel=panel,
+                )
+            )
+
+    @contextmanager
+    def activate(self) -> Iterator[Profiler]:
+        """
+        Make this the profiler into which stages are recorded
+        """
+        global _ACTIVE
+
+        previous = _ACTIVE
+        started = not tracemalloc.is_tracing()
+        if started:
+            tracemalloc.start()
+
+        _ACTIVE = self
+        try:
+            yield self
+        finally:
+            _ACTIVE = previous
+            if started:
+                tracemalloc.stop()
+
+
+def profile_stage(
+    name: str,
+    layer: Optional[int] = None,
+    panel: Optional[int] = None,
+) -> ContextManager[None]:
+    """
+    Record a stage if profiling, otherwise do nothing
+
+    Parameters
+    ----------
+    name :
+        Name of the stage
+    layer :
+        Index of the layer for which the stage is being run
+    panel :
+        Panel number for which the stage is being run
+    """
+    if _ACTIVE is None:
+        return _NULL_CONTEXT
+    return _ACTIVE.stage(name, layer, panel)
+
+
+@contextmanager
+def profiling(plot: ggplot) -> Iterator[Optional[Profiler]]:
+    """
+    Profile the plot if the `profile` option is set
+
+    The profiler is kept with the build objects of the plot so that
+    the stages that run after the plot is drawn (e.g. the layout
+    engine) can be added to the same report.
+    """
+    from ..options import get_option
+
+    if not get_option("profile"):
+        plot._build_objs.profiler = None
+        yield None
+        return
+
+    profiler = plot._build_objs.profiler = Profiler()
+    with profiler.activate():
+        yield profiler
+
+
+def resume_profiling(plot: ggplot) -> ContextManager:
+    """
+    Resume recording into the profiler of a plot that was profiled
+    """
+    profiler: Optional[Profiler] = getattr(plot._build_objs, "profiler", None)
+    if profiler is None or profiler is _ACTIVE:
+        return _NULL_CONTEXT
+    return profiler.activate()
@@ -9,9 +9,10 @@ import numpy as np
 from .._utils import OPPOSITE_SIDE
 from ..iapi import panel_ranges
 from ..mapping.aes import POSITION_AESTHETICS
+from ..options import get_option
 
 if typing.TYPE_CHECKING:
-    from typing import Any, Sequence
+    from typing import Any, Optional, Sequence
 
     import numpy.typing as npt
     import pandas as pd
@@ -385,7 +386,7 @@ class coord:
         dist[bool_idx] = np.nan
 
         # Munch
-        munched = munch_data(data, dist)
+        munched = munch_data(data, dist, get_option("munch_limit"))
         return munched
 
 
@@ -400,51 +401,65 @@ def dist_euclidean(x: FloatArrayLike, y: FloatArrayLike) -> FloatArray:
     )
 
 
-def interp(start: int, end: int, n: int) -> FloatArray:
-    """
-    Interpolate
-    """
-    return np.linspace(start, end, n, endpoint=False)
-
-
-def munch_data(data: pd.DataFrame, dist: FloatArray) -> pd.DataFrame:
+def munch_data(
+    data: pd.DataFrame,
+    dist: FloatArray,
+    max_points: Optional[int] = None,
+) -> pd.DataFrame:
     """
     Subdivide path segments and interpolate their position aesthetics
+
+    Parameters
+    ----------
+    data :
+        Vertices of the paths.
+    dist :
+        Distance between consecutive vertices, `nan` where the
+        vertices are not of the same path.
+    max_points :
+        Maximum number of points to create. If the segments would be
+        subdivided into more points, they are subdivided more coarsely.
+        `None`{.py} means no limit.
     """
     segment_length = 0.01
 
     # Count new points per segment, excluding the final endpoint.
-    dist[np.isnan(dist)] = 1
+    # The gap between two paths is not a segment, it is not subdivided.
+    dist[np.isnan(dist)] = 0
     extra = np.maximum(np.floor(dist / segment_length), 1)
+    if max_points is not None and extra.sum() + 1 > max_points:
+        # After one point per segment, share what is left of the
+        # points in proportion to the lengths of the segments
+        available = max_points - 1 - len(extra)
+        segment_length = dist.sum() / available if available > 0 else np.inf
+        extra = np.maximum(np.floor(dist / segment_length), 1)
     extra = extra.astype(int)
 
+    # The segment of each new point and its position in the segment,
+    # the final endpoint is the last point of the last segment
+    n = len(data)
+    segment = np.repeat(np.arange(n - 1), extra)
+    step = np.arange(len(segment)) - np.repeat(np.cumsum(extra) - extra, extra)
+    idx = np.append(segment, n - 1)
+
     # Every position aesthetic defines path geometry. Replicating `ymin` and
     # `ymax`, for example, would turn curved ribbon edges into steps.
     position_columns = [c for c in data.columns if c in POSITION_AESTHETICS]
 
-    # Append the final endpoint after interpolating each segment.
-    interpolated = {}
-    for col in position_columns:
-        values = data[col].to_numpy()
-        pieces = [
-            interp(start, end, n)
-            for start, end, n in zip(values[:-1], values[1:], extra)
-        ]
-        pieces.append(values[-1:])
-        interpolated[col] = np.hstack(pieces)
-
     # Hold non-position aesthetics at each segment's starting value, then
     # append the final observation.
-    idx = np.hstack(
-        [
-            np.repeat(data.index[:-1], extra),
-            len(data) - 1,
-        ]
-    )
+    other_columns = list(data.columns.difference(position_columns))
+    munched = data[other_columns].take(idx)
 
-    munched = data.loc[idx, list(data.columns.difference(position_columns))]
-    for col, values in interpolated.items():
-        munched[col] = values
+    # Interpolate within the segments, the same way as
+    # np.linspace(start, end, extra, endpoint=False), then append the
+    # final endpoint.
+    for col in position_columns:
+        values = data[col].to_numpy(dtype=float)
+        delta = (values[1:] - values[:-1]) / extra
+        munched[col] = np.append(
+            step * delta[segment] + values[segment], values[-1:]
+        )
     munched.reset_index(drop=True, inplace=True)
 
     return munched
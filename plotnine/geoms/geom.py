@@ -12,6 +12,7 @@ from .._utils import (
     data_mapping_as_kwargs,
     remove_missing,
 )
+from .._utils.profile import profile_stage
 from .._utils.registry import Register, _MergedDefaultParams
 from ..exceptions import PlotnineError
 from ..layer import layer
@@ -291,7 +292,8 @@ class geom(ABC, metaclass=Register):
             ploc = pdata["PANEL"].iloc[0] - 1
             panel_params = layout.panel_params[ploc]
             ax = layout.axs[ploc]
-            self.draw_panel(pdata, panel_params, coord, ax)
+            with profile_stage("draw_panel", panel=int(ploc) + 1):
+                self.draw_panel(pdata, panel_params, coord, ax)
 
     def draw_panel(
         self,
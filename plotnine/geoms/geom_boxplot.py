@@ -11,6 +11,7 @@ from .._utils import (
     copy_missing_columns,
     resolution,
     to_rgba,
+    to_rgba_array,
 )
 from ..doctools import document
 from ..exceptions import PlotnineWarning
@@ -180,6 +181,29 @@ class geom_boxplot(geom):
 
         return data
 
+    def draw_panel(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Plot all the boxes in the panel
+
+        In a linear coordinate system, the outliers of all the boxes
+        are one scatter collection, the boxes are one polygon collection
+        and the whiskers & middle lines are one line collection.
+        Otherwise, the boxes are drawn one at a time.
+        """
+        if not coord.is_linear:
+            super().draw_panel(data, panel_params, coord, ax)
+            return
+
+        params = self.params
+        _draw_outliers(data, panel_params, coord, ax, params)
+        _draw_boxes(data, panel_params, coord, ax, params)
+
     @staticmethod
     def draw_group(
         data: pd.DataFrame,
@@ -324,3 +348,151 @@ class geom_boxplot(geom):
         )
         da.add_artist(bottom)
         return da
+
+
+def _draw_outliers(
+    data: pd.DataFrame,
+    panel_params: panel_view,
+    coord: coord,
+    ax: Axes,
+    params: dict[str, Any],
+):
+    """
+    Draw the outliers of all the boxes
+    """
+    sizes = np.array([len(lst) for lst in data["outliers"]], dtype=int)
+    if not sizes.sum():
+        return
+
+    outliers = pd.DataFrame(
+        {
+            "y": np.hstack([lst for lst in data["outliers"] if len(lst)]),
+            "x": np.repeat(data["x"].to_numpy(), sizes),
+            "fill": None,
+        }
+    )
+    for param in ("alpha", "color", "shape", "size", "stroke"):
+        value = params[f"outlier_{param}"]
+        if value is None:
+            value = np.repeat(data[param].to_numpy(), sizes)
+        outliers[param] = value
+
+    geom_point.draw_group(outliers, panel_params, coord, ax, params)
+
+
+def _draw_boxes(
+    data: pd.DataFrame,
+    panel_params: panel_view,
+    coord: coord,
+    ax: Axes,
+    params: dict[str, Any],
+):
+    """
+    Draw the boxes, whiskers & middle lines of all the boxes
+    """
+    from matplotlib.collections import LineCollection, PolyCollection
+
+    x = data["x"].to_numpy()
+    xmin = data["xmin"].to_numpy()
+    xmax = data["xmax"].to_numpy()
+    lower = data["lower"].to_numpy()
+    middle = data["middle"].to_numpy()
+    upper = data["upper"].to_numpy()
+
+    # Vertices of the boxes, a row for each box
+    if params["notch"]:
+        notchlower = data["notchlower"].to_numpy()
+        notchupper = data["notchupper"].to_numpy()
+        if (notchlower < lower).any() or (notchupper > upper).any():
+            warn(
+                "Notch went outside the hinges. Try setting notch=False.",
+                PlotnineWarning,
+            )
+
+        indent = (1 - params["notchwidth"]) * (xmax - xmin) / 2
+        vx = [
+            xmin,
+            xmin,
+            xmin + indent,
+            xmin,
+            xmin,
+            xmax,
+            xmax,
+            xmax - indent,
+            xmax,
+            xmax,
+            xmin,
+        ]
+        vy = [
+            upper,
+            notchupper,
+            middle,
+            notchlower,
+            lower,
+            lower,
+            notchlower,
+            middle,
+            notchupper,
+            upper,
+            upper,
+        ]
+    else:
+        indent = 0
+        vx = [xmin, xmin, xmax, xmax, xmin]
+        vy = [upper, upper, upper, lower, lower]
+
+    verts = coord.transform(
+        pd.DataFrame(
+            {
+                "x": np.column_stack(vx).ravel(),
+                "y": np.column_stack(vy).ravel(),
+            }
+        ),
+        panel_params,
+    )
+    verts = verts[["x", "y"]].to_numpy().reshape(len(data), len(vx), 2)
+
+    # The upper whiskers, the lower whiskers and the middle lines
+    segments = coord.transform(
+        pd.DataFrame(
+            {
+                "x": np.hstack([x, x, xmin + indent]),
+                "y": np.hstack([upper, lower, middle]),
+                "xend": np.hstack([x, x, xmax - indent]),
+                "yend": np.hstack([data["ymax"], data["ymin"], middle]),
+            }
+        ),
+        panel_params,
+    )
+    segments = np.stack(
+        [
+            segments[["x", "y"]].to_numpy(),
+            segments[["xend", "yend"]].to_numpy(),
+        ],
+        axis=1,
+    )
+
+    linewidth = data["size"].to_numpy() * SIZE_FACTOR
+    linetype = list(data["linetype"])
+    color = to_rgba_array(data["color"], np.ones(len(data)))
+    boxes = PolyCollection(
+        list(verts),
+        facecolors=to_rgba_array(data["fill"], data["alpha"]),
+        edgecolors=color,
+        linestyles=linetype,
+        linewidths=linewidth,
+        zorder=params["zorder"],
+        rasterized=params["raster"],
+    )
+    lines = LineCollection(
+        list(segments),
+        edgecolor=np.tile(color, (3, 1)),
+        linewidth=np.hstack(
+            [linewidth, linewidth, linewidth * params["fatten"]]
+        ),
+        linestyle=linetype * 3,
+        zorder=params["zorder"],
+        rasterized=params["raster"],
+    )
+    ax.add_collection(boxes)
+    ax.add_collection(lines)
@@ -1,13 +1,19 @@
 from __future__ import annotations
 
-from collections import Counter
 from contextlib import suppress
 from typing import TYPE_CHECKING
 from warnings import warn
 
 import numpy as np
-
-from .._utils import SIZE_FACTOR, make_line_segments, match, to_rgba
+import pandas as pd
+
+from .._utils import (
+    SIZE_FACTOR,
+    collapse_constant,
+    match,
+    to_rgba,
+    to_rgba_array,
+)
 from ..doctools import document
 from ..exceptions import PlotnineWarning
 from .geom import geom
@@ -16,7 +22,6 @@ if TYPE_CHECKING:
     from typing import Any, Literal, Sequence
 
     import numpy.typing as npt
-    import pandas as pd
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
     from matplotlib.path import Path
@@ -43,6 +48,16 @@ class geom_path(geom):
         Line join style. This option is applied for solid linetypes.
     arrow : ~plotnine.geoms.geom_path.arrow, default=None
         Arrow specification. Default is no arrow.
+    aggregate : bool, default=False
+        If `True`, do not draw the individual lines. Instead, count
+        the lines that pass through each pixel of the panel and draw
+        the result as an image. The color of a pixel is the mean of
+        the colors of the lines in it, and the more lines there are
+        the more opaque it is. The lines are one pixel wide, the
+        `size` & `linetype` are ignored. Use it for layers with
+        millions of points, the time it takes to draw and the size
+        of the file depend on the size of the image and not on the
+        number of points.
 
     See Also
     --------
@@ -61,6 +76,7 @@ class geom_path(geom):
         "lineend": "butt",
         "linejoin": "round",
         "arrow": None,
+        "aggregate": False,
     }
 
     def handle_na(self, data: pd.DataFrame) -> pd.DataFrame:
@@ -116,9 +132,10 @@ class geom_path(geom):
             )
 
         # drop lines with less than two points
-        c = Counter(data["group"])
-        counts = np.array([c[v] for v in data["group"]])
-        data = data[counts >= 2]
+        _, inverse, counts = np.unique(
+            data["group"].to_numpy(), return_inverse=True, return_counts=True
+        )
+        data = data[counts[inverse] >= 2]
 
         if len(data) < 2:
             return
@@ -127,6 +144,10 @@ class geom_path(geom):
         data = data.sort_values("group", kind="mergesort")
         data.reset_index(drop=True, inplace=True)
 
+        if self.params["aggregate"]:
+            self.draw_aggregate(data, panel_params, coord, ax)
+            return
+
         # When the parameters of the path are not constant
         # with in the group, then the lines that make the paths
         # can be drawn as separate segments
@@ -145,6 +166,30 @@ class geom_path(geom):
                 gdata.reset_index(inplace=True, drop=True)
                 self.draw_group(gdata, panel_params, coord, ax, self.params)
 
+    def draw_aggregate(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Draw the paths as an image of their counts per pixel
+        """
+        from .._mpl.image import AggregateImage
+
+        data = coord.transform(data, panel_params, munch=True)
+        im = AggregateImage(
+            ax,
+            data["x"].to_numpy(),
+            data["y"].to_numpy(),
+            to_rgba_array(data["color"], data["alpha"]),
+            group=data["group"].to_numpy(),
+            zorder=self.params["zorder"],
+            rasterized=self.params["raster"],
+        )
+        ax.add_image(im)
+
     @staticmethod
     def draw_group(
         data: pd.DataFrame,
@@ -458,30 +503,31 @@ def _draw_segments(data: pd.DataFrame, ax: Axes, params: dict[str, Any]):
     """
     from matplotlib.collections import LineCollection
 
-    color = to_rgba(data["color"], data["alpha"])
     # All we do is line-up all the points in a group
-    # into segments, all in a single list.
-    # Along the way the other parameters are put in
-    # sequences accordingly
-    indices: list[int] = []  # for attributes of starting point of each segment
-    _segments = []
-    for _, df in data.groupby("group"):
-        idx = df.index
-        indices.extend(idx[:-1].to_list())  # One line from two points
-        x = data["x"].iloc[idx]
-        y = data["y"].iloc[idx]
-        _segments.append(make_line_segments(x, y, ispath=True))
-
-    segments = np.vstack(_segments).tolist()
-
-    edgecolor = color if color is None else [color[i] for i in indices]
-    linewidth = data.loc[indices, "linewidth"]
-    linestyle = data.loc[indices, "linetype"]
-
+    # into segments, all in a single array. A segment
+    # gets the parameters of its starting point.
+    group = data["group"].to_numpy()
+    order = np.argsort(group, kind="stable")
+    group = group[order]
+    idx = np.flatnonzero(group[:-1] == group[1:])
+    start, end = order[idx], order[idx + 1]
+    xy = np.column_stack([data["x"], data["y"]])
+    segments = np.stack([xy[start], xy[end]], axis=1)
+
+    # The linetypes may be dash patterns (tuples) which cannot be
+    # compared as numpy arrays
+    linetype = data["linetype"].iloc[start]
+    try:
+        _, linetypes = pd.factorize(linetype)
+    except TypeError:
+        linetypes = list(linetype)
+    linestyle = linetypes[0] if len(linetypes) == 1 else list(linetype)
+
+    color = to_rgba_array(data["color"], data["alpha"])
     coll = LineCollection(
-        segments,
-        edgecolor=edgecolor,
-        linewidth=linewidth,
+        segments,  # pyright: ignore[reportArgumentType]
+        edgecolor=collapse_constant(color[start]),
+        linewidth=collapse_constant(data["linewidth"].to_numpy()[start]),
         linestyle=linestyle,
         capstyle=params.get("lineend"),
         zorder=params["zorder"],
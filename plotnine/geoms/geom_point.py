@@ -3,8 +3,14 @@ from __future__ import annotations
 import typing
 
 import numpy as np
+import pandas as pd
 
-from .._utils import SIZE_FACTOR, to_rgba
+from .._utils import (
+    SIZE_FACTOR,
+    collapse_constant,
+    to_rgba,
+    to_rgba_array,
+)
 from ..doctools import document
 from ..scales.scale_shape import FILLED_SHAPES
 from .geom import geom
@@ -12,13 +18,13 @@ from .geom import geom
 if typing.TYPE_CHECKING:
     from typing import Any
 
-    import pandas as pd
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
 
     from plotnine.coords.coord import coord
     from plotnine.iapi import panel_view
     from plotnine.layer import layer
+    from plotnine.typing import IntArray
 
 
 @document
@@ -31,6 +37,15 @@ class geom_point(geom):
     Parameters
     ----------
     {common_parameters}
+    aggregate : bool, default=False
+        If `True`, do not draw the individual points. Instead, count
+        the points onto the pixels of the panel and draw the result
+        as an image. The color of a pixel is the mean of the colors
+        (or fills) of the points in it, and the more points there are
+        the more opaque it is. The `shape`, `size` & `stroke` of the
+        points are ignored. Use it for layers with millions of points,
+        the time it takes to draw and the size of the file depend on
+        the size of the image and not on the number of points.
     """
 
     DEFAULT_AES = {
@@ -43,6 +58,7 @@ class geom_point(geom):
     }
     REQUIRED_AES = {"x", "y"}
     NON_MISSING_AES = {"color", "shape", "size"}
+    DEFAULT_PARAMS = {"aggregate": False}
 
     def draw_panel(
         self,
@@ -54,7 +70,40 @@ class geom_point(geom):
         """
         Plot all groups
         """
-        self.draw_group(data, panel_params, coord, ax, self.params)
+        if self.params["aggregate"]:
+            self.draw_aggregate(data, panel_params, coord, ax)
+        else:
+            self.draw_group(data, panel_params, coord, ax, self.params)
+
+    def draw_aggregate(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Draw the points as an image of their counts per pixel
+        """
+        from .._mpl.image import AggregateImage
+
+        data = coord.transform(data, panel_params)
+        rgba = to_rgba_array(data["color"], data["alpha"])
+        has_fill = data["fill"].notna().to_numpy()
+        if has_fill.any():
+            rgba[has_fill] = to_rgba_array(
+                data["fill"][has_fill], data["alpha"][has_fill]
+            )
+
+        im = AggregateImage(
+            ax,
+            data["x"].to_numpy(),
+            data["y"].to_numpy(),
+            rgba,
+            zorder=self.params["zorder"],
+            rasterized=self.params["raster"],
+        )
+        ax.add_image(im)
 
     @staticmethod
     def draw_group(
@@ -65,10 +114,18 @@ class geom_point(geom):
         params: dict[str, Any],
     ):
         data = coord.transform(data, panel_params)
-        units = "shape"
-        for _, udata in data.groupby(units, dropna=False):
-            udata.reset_index(inplace=True, drop=True)
-            geom_point.draw_unit(udata, panel_params, coord, ax, params)
+        points = _point_arrays(data)
+
+        # One collection per shape, the colors & sizes are computed
+        # once for all the points in the panel
+        codes, shapes = pd.factorize(data["shape"], sort=True)
+        if len(shapes) == 1:
+            _draw_points(points, None, shapes[0], ax, params)
+            return
+
+        for i, shape in enumerate(shapes):
+            idx = np.flatnonzero(codes == i)
+            _draw_points(points, idx, shape, ax, params)
 
     @staticmethod
     def draw_unit(
@@ -78,40 +135,9 @@ class geom_point(geom):
         ax: Axes,
         params: dict[str, Any],
     ):
-        # Our size is in 'points' while scatter wants
-        # 'points^2'. The stroke is outside. And pi
-        # gives a large enough scaling factor
-        # All other sizes for which the MPL units should
-        # be in points must scaled using sqrt(pi)
-        size = ((data["size"] + data["stroke"]) ** 2) * np.pi
-        linewidth = data["stroke"] * SIZE_FACTOR
-        color = to_rgba(data["color"], data["alpha"])
+        points = _point_arrays(data)
         shape = data["shape"].iloc[0]
-
-        # It is common to forget that scatter points are
-        # filled and slip-up by manually assigning to the
-        # color instead of the fill. We forgive.
-        if shape in FILLED_SHAPES:
-            if all(c is None for c in data["fill"]):
-                fill = color
-            else:
-                fill = to_rgba(data["fill"], data["alpha"])
-        else:
-            # Assume unfilled
-            fill = color
-            color = None
-
-        ax.scatter(
-            x=data["x"],
-            y=data["y"],
-            s=size,
-            facecolor=fill,
-            edgecolor=color,
-            linewidth=linewidth,
-            marker=shape,
-            zorder=params["zorder"],
-            rasterized=params["raster"],
-        )
+        _draw_points(points, None, shape, ax, params)
 
     @staticmethod
     def draw_legend(
@@ -168,3 +194,84 @@ class geom_point(geom):
             w = max(w, _w + pad_w)
             h = max(h, _h + pad_h)
         return w, h
+
+
+def _point_arrays(data: pd.DataFrame) -> dict[str, Any]:
+    """
+    Compute the values of the points in a form fit for ax.scatter
+    """
+    # Our size is in 'points' while scatter wants
+    # 'points^2'. The stroke is outside. And pi
+    # gives a large enough scaling factor
+    # All other sizes for which the MPL units should
+    # be in points must scaled using sqrt(pi)
+    stroke = data["stroke"].to_numpy(dtype=float)
+    fill = data["fill"]
+    fill_missing = fill.isna().to_numpy()
+    return {
+        "x": data["x"].to_numpy(),
+        "y": data["y"].to_numpy(),
+        "size": ((data["size"].to_numpy(dtype=float) + stroke) ** 2) * np.pi,
+        "linewidth": stroke * SIZE_FACTOR,
+        "color": to_rgba_array(data["color"], data["alpha"]),
+        "fill": (
+            None if fill_missing.all() else to_rgba_array(fill, data["alpha"])
+        ),
+        "fill_missing": fill_missing,
+    }
+
+
+def _draw_points(
+    points: dict[str, Any],
+    idx: IntArray | None,
+    shape: Any,
+    ax: Axes,
+    params: dict[str, Any],
+):
+    """
+    Draw points of the same shape as a single collection
+
+    Parameters
+    ----------
+    points :
+        Values of all the points, as created by `_point_arrays`.
+    idx :
+        The indices of the points to draw. If None, draw all
+        the points.
+    shape :
+        The shape of the points
+    """
+
+    def get(name):
+        value = points[name]
+        return value if idx is None else value[idx]
+
+    color = get("color")
+
+    # It is common to forget that scatter points are
+    # filled and slip-up by manually assigning to the
+    # color instead of the fill. We forgive.
+    if shape in FILLED_SHAPES:
+        if points["fill"] is None or get("fill_missing").all():
+            fill = color
+        else:
+            fill = get("fill")
+    else:
+        # Assume unfilled
+        fill = color
+        color = None
+
+    # The sizes are not collapsed. With a single size, matplotlib
+    # stamps the same rasterized marker at pixel-snapped locations
+    # which looks different.
+    ax.scatter(
+        x=get("x"),
+        y=get("y"),
+        s=get("size"),
+        facecolor=collapse_constant(fill),
+        edgecolor=collapse_constant(color),
+        linewidth=collapse_constant(get("linewidth")),
+        marker=shape,
+        zorder=params["zorder"],
+        rasterized=params["raster"],
+    )
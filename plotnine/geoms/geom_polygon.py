@@ -3,8 +3,9 @@ from __future__ import annotations
 import typing
 
 import numpy as np
+import pandas as pd
 
-from .._utils import SIZE_FACTOR, to_rgba
+from .._utils import SIZE_FACTOR, to_rgba, to_rgba_array
 from ..doctools import document
 from .geom import geom
 from .geom_path import geom_path
@@ -12,13 +13,14 @@ from .geom_path import geom_path
 if typing.TYPE_CHECKING:
     from typing import Any
 
-    import pandas as pd
+    import numpy.typing as npt
     from matplotlib.axes import Axes
     from matplotlib.offsetbox import DrawingArea
 
     from plotnine.coords.coord import coord
     from plotnine.iapi import panel_view
     from plotnine.layer import layer
+    from plotnine.typing import IntArray
 
 
 @document
@@ -73,6 +75,17 @@ class geom_polygon(geom):
     ):
         from matplotlib.collections import PolyCollection
 
+        if not len(data):
+            return
+
+        # Some stats may order the data in ways that prevent
+        # objects from occluding other objects. We do not want
+        # to undo that order, the polygons are in the order in
+        # which the groups first appear.
+        codes, _ = pd.factorize(data["group"])
+        order = np.argsort(codes, kind="stable")
+        starts = _group_starts(codes[order])
+
         # A polygon is a closed ring, but the vertices only trace it open.
         # In a non-linear coord the closing edge must be munched like any
         # other, or it stays a straight chord across a curved boundary (e.g.
@@ -80,41 +93,23 @@ class geom_polygon(geom):
         # munch subdivides that edge too; a linear coord closes it straight,
         # which is already correct, so leave it untouched there.
         if not coord.is_linear:
-            indices = data.groupby("group", sort=False).indices
-            order = np.concatenate(
-                [np.append(idx, idx[0]) for idx in indices.values()]
-            )
-            data = data.iloc[order].reset_index(drop=True)
+            ends = np.append(starts[1:], len(order))
+            order = np.insert(order, ends, order[starts])
 
+        data = data.iloc[order].reset_index(drop=True)
         data = coord.transform(data, panel_params, munch=True)
-        data["linewidth"] = data["size"] * SIZE_FACTOR
 
         # Each group is a polygon with a single facecolor
         # with potentially an edgecolor for every edge.
-        verts = []
-        facecolor = []
-        edgecolor = []
-        linestyle = []
-        linewidth = []
-
-        # Some stats may order the data in ways that prevent
-        # objects from occluding other objects. We do not want
-        # to undo that order.
-        grouper = data.groupby("group", sort=False)
-        for group, df in grouper:
-            fill = to_rgba(df["fill"].iloc[0], df["alpha"].iloc[0])
-            verts.append(tuple(zip(df["x"], df["y"])))
-            facecolor.append("none" if fill is None else fill)
-            edgecolor.append(df["color"].iloc[0] or "none")
-            linestyle.append(df["linetype"].iloc[0])
-            linewidth.append(df["linewidth"].iloc[0])
-
+        starts = _group_starts(data["group"].to_numpy())
+        first = data.iloc[starts]
+        xy = np.column_stack([data["x"], data["y"]])
         col = PolyCollection(
-            verts,
-            facecolors=facecolor,
-            edgecolors=edgecolor,
-            linestyles=linestyle,
-            linewidths=linewidth,
+            np.split(xy, starts[1:]),
+            facecolors=to_rgba_array(first["fill"], first["alpha"]),
+            edgecolors=[c or "none" for c in first["color"]],
+            linestyles=list(first["linetype"]),
+            linewidths=first["size"].to_numpy() * SIZE_FACTOR,
             zorder=params["zorder"],
             rasterized=params["raster"],
         )
@@ -167,3 +162,11 @@ class geom_polygon(geom):
         )
         da.add_artist(rect)
         return da
+
+
+def _group_starts(group: npt.ArrayLike) -> IntArray:
+    """
+    Return the positions at which the contiguous groups start
+    """
+    group = np.asarray(group)
+    return np.flatnonzero(np.append(True, group[1:] != group[:-1]))
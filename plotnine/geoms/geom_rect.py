@@ -59,11 +59,7 @@ class geom_rect(geom):
             # open path, and coord.munch would then bend the join between
             # consecutive rectangles into a spurious spike.
             data["group"] = np.repeat(np.arange(len(data) // 4), 4)
-            for _, gdata in data.groupby("group"):
-                gdata.reset_index(inplace=True, drop=True)
-                geom_polygon.draw_group(
-                    gdata, panel_params, coord, ax, self.params
-                )
+            geom_polygon.draw_group(data, panel_params, coord, ax, self.params)
         else:
             self.draw_group(data, panel_params, coord, ax, self.params)
 
@@ -80,9 +76,18 @@ class geom_rect(geom):
         data = coord.transform(data, panel_params, munch=True)
         linewidth = data["size"] * SIZE_FACTOR
 
-        limits = zip(data["xmin"], data["xmax"], data["ymin"], data["ymax"])
-
-        verts = [[(l, b), (l, t), (r, t), (r, b)] for (l, r, b, t) in limits]
+        # The corners of the rectangles, an (n, 4, 2) array
+        left, right = data["xmin"].to_numpy(), data["xmax"].to_numpy()
+        bottom, top = data["ymin"].to_numpy(), data["ymax"].to_numpy()
+        verts = np.stack(
+            [
+                np.column_stack([left, bottom]),
+                np.column_stack([left, top]),
+                np.column_stack([right, top]),
+                np.column_stack([right, bottom]),
+            ],
+            axis=1,
+        )
 
         fill = to_rgba(data["fill"], data["alpha"])
         color = data["color"]
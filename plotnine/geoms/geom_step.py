@@ -42,7 +42,29 @@ class geom_step(geom_path):
 
     DEFAULT_PARAMS = {"direction": "hv"}
 
-    draw_panel = geom.draw_panel
+    def draw_panel(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Plot all groups
+        """
+        if not self.params["aggregate"]:
+            geom.draw_panel(self, data, panel_params, coord, ax)
+            return
+
+        direction = self.params["direction"]
+        data = pd.concat(
+            [
+                _step_path(gdata, direction)
+                for _, gdata in data.groupby("group", sort=True)
+            ],
+            ignore_index=True,
+        )
+        self.draw_aggregate(data, panel_params, coord, ax)
 
     @staticmethod
     def draw_group(
@@ -52,32 +74,39 @@ class geom_step(geom_path):
         ax: Axes,
         params: dict[str, Any],
     ):
-        direction = params["direction"]
-        n = len(data)
-        data = data.sort_values("x", kind="mergesort")
-        x = data["x"].to_numpy()
-        y = data["y"].to_numpy()
-
-        if direction == "vh":
-            # create stepped path -- interleave x with
-            # itself and y with itself
-            xidx = np.repeat(range(n), 2)[:-1]
-            yidx = np.repeat(range(n), 2)[1:]
-            new_x, new_y = x[xidx], y[yidx]
-        elif direction == "hv":
-            xidx = np.repeat(range(n), 2)[1:]
-            yidx = np.repeat(range(n), 2)[:-1]
-            new_x, new_y = x[xidx], y[yidx]
-        elif direction == "mid":
-            xidx = np.repeat(range(n - 1), 2)
-            yidx = np.repeat(range(n), 2)
-            diff = x[1::] - x[:-1:]
-            mid_x = x[:-1:] + diff / 2
-            new_x = np.hstack([x[0], mid_x[xidx], x[-1]])
-            new_y = y[yidx]
-        else:
-            raise PlotnineError(f"Invalid direction `{direction}`")
-
-        path_data = pd.DataFrame({"x": new_x, "y": new_y})
-        copy_missing_columns(path_data, data)
+        path_data = _step_path(data, params["direction"])
         geom_path.draw_group(path_data, panel_params, coord, ax, params)
+
+
+def _step_path(data: pd.DataFrame, direction: str) -> pd.DataFrame:
+    """
+    Return the vertices of the stepped path through the points
+    """
+    n = len(data)
+    data = data.sort_values("x", kind="mergesort")
+    x = data["x"].to_numpy()
+    y = data["y"].to_numpy()
+
+    if direction == "vh":
+        # create stepped path -- interleave x with
+        # itself and y with itself
+        xidx = np.repeat(range(n), 2)[:-1]
+        yidx = np.repeat(range(n), 2)[1:]
+        new_x, new_y = x[xidx], y[yidx]
+    elif direction == "hv":
+        xidx = np.repeat(range(n), 2)[1:]
+        yidx = np.repeat(range(n), 2)[:-1]
+        new_x, new_y = x[xidx], y[yidx]
+    elif direction == "mid":
+        xidx = np.repeat(range(n - 1), 2)
+        yidx = np.repeat(range(n), 2)
+        diff = x[1::] - x[:-1:]
+        mid_x = x[:-1:] + diff / 2
+        new_x = np.hstack([x[0], mid_x[xidx], x[-1]])
+        new_y = y[yidx]
+    else:
+        raise PlotnineError(f"Invalid direction `{direction}`")
+
+    path_data = pd.DataFrame({"x": new_x, "y": new_y})
+    copy_missing_columns(path_data, data)
+    return path_data
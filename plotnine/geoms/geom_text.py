@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from contextlib import suppress
-from typing import TYPE_CHECKING, cast
+from typing import TYPE_CHECKING
 from warnings import warn
 
 import numpy as np
 
-from .._utils import order_as_data_mapping, to_rgba
+from .._utils import order_as_data_mapping, to_rgba, to_rgba_array
 from ..doctools import document
 from ..exceptions import PlotnineError, PlotnineWarning
 from ..positions import position_nudge
@@ -24,7 +24,7 @@ if TYPE_CHECKING:
     from plotnine.coords.coord import coord
     from plotnine.iapi import panel_view
     from plotnine.layer import layer
-    from plotnine.typing import DataLike
+    from plotnine.typing import AnyArray, DataLike
 
 
 # Note: hjust & vjust are parameters instead of aesthetics
@@ -222,62 +222,84 @@ class geom_text(geom):
         ax: Axes,
         params: dict[str, Any],
     ):
+        from matplotlib.text import Text
+        from matplotlib.transforms import TransformedPatchPath
+
         data = coord.transform(data, panel_params)
         zorder = params["zorder"]
 
         # Bind color and alpha
-        color = to_rgba(data["color"], data["alpha"])
+        color = to_rgba_array(data["color"], data["alpha"])
+
+        # The properties of the texts, as accepted by matplotlib.
+        # Those that are the same for all texts are set once, and
+        # the rest are extracted into lists. All the texts share
+        # one clip path, matplotlib would create one for each text.
+        common: dict[str, Any] = {
+            "zorder": zorder,
+            "rasterized": params["raster"],
+            "clip_on": True,
+            "transform": ax.transData,
+            "clip_path": TransformedPatchPath(ax.patch),
+        }
+        varying: dict[str, AnyArray | list[Any]] = {}
 
-        # Create a dataframe for the plotting data required
-        # by ax.text
-        ae_names = list(set(geom_text.DEFAULT_AES) | geom_text.REQUIRED_AES)
-        plot_data = data[ae_names]
-        plot_data.rename(
-            {
-                "label": "s",
-                "angle": "rotation",
-                "lineheight": "linespacing",
-            },
-            axis=1,
-            inplace=True,
-        )
-        plot_data["color"] = color  # pyright: ignore[reportCallIssue,reportArgumentType]
-        plot_data["zorder"] = zorder
-        plot_data["rasterized"] = params["raster"]
-        plot_data["clip_on"] = True
+        def add(name: str, values: AnyArray):
+            if _is_constant(values):
+                common[name] = values[0]
+            else:
+                varying[name] = values
+
+        for ae, name in TEXT_PROPERTIES.items():
+            add(name, data[ae].to_numpy())
+        add("color", color)
 
         # 'boxstyle' indicates geom_label so we need an MPL bbox
         draw_label = "boxstyle" in params
         if draw_label:
-            fill = to_rgba(data.pop("fill"), data["alpha"])
-            if isinstance(fill, tuple):
-                fill = [list(fill)] * len(data["x"])
-            plot_data["facecolor"] = fill  # pyright: ignore[reportCallIssue,reportArgumentType]
-
+            fill = to_rgba_array(data["fill"], data["alpha"])
             tokens = [params["boxstyle"], f"pad={params['label_padding']}"]
             if params["boxstyle"] in {"round", "round4"}:
                 tokens.append(f"rounding_size={params['label_r']}")
             elif params["boxstyle"] in ("roundtooth", "sawtooth"):
                 tokens.append(f"tooth_size={params['tooth_size']}")
 
-            boxstyle = ",".join(tokens)
-            bbox = {"linewidth": params["label_size"], "boxstyle": boxstyle}
-        else:
-            bbox = {}
-
+            bbox = {
+                "linewidth": params["label_size"],
+                "boxstyle": ",".join(tokens),
+            }
+            boxcolor = params["boxcolor"]
+            if (boxcolor or _is_constant(color)) and _is_constant(fill):
+                # The same box for all the labels
+                common["bbox"] = {
+                    **bbox,
+                    "edgecolor": boxcolor or tuple(color[0]),
+                    "facecolor": tuple(fill[0]),
+                }
+            else:
+                edgecolor = [boxcolor] * len(data) if boxcolor else color
+                varying["bbox"] = [
+                    {**bbox, "edgecolor": ec, "facecolor": fc}
+                    for ec, fc in zip(edgecolor, fill)
+                ]
+
+        if params["path_effects"]:
+            common["path_effects"] = params["path_effects"]
+
+        x = data["x"].to_numpy()
+        y = data["y"].to_numpy()
+        labels = data["label"].to_numpy()
         texts: Sequence[Text] = []
-
-        # For labels add a bbox
         for i in range(len(data)):
-            kw = cast("dict[str, Any]", plot_data.iloc[i].to_dict())
-            if draw_label:
-                kw["bbox"] = bbox
-                kw["bbox"]["edgecolor"] = params["boxcolor"] or kw["color"]
-                kw["bbox"]["facecolor"] = kw.pop("facecolor")
-            text_elem = ax.text(**kw)
+            text_elem = Text(
+                x[i],
+                y[i],
+                labels[i],
+                **common,
+                **{name: values[i] for name, values in varying.items()},
+            )
+            ax.add_artist(text_elem)
             texts.append(text_elem)
-            if params["path_effects"]:
-                text_elem.set_path_effects(params["path_effects"])
 
         # TODO: Do adjust text per panel
         if params["adjust_text"] is not None:
@@ -291,7 +313,7 @@ class geom_text(geom):
                 texts,
                 ax,
                 params["adjust_text"],
-                color[0],
+                tuple(color[0]),
                 float(data["size"].mean()),
                 zorder,
             )
@@ -346,6 +368,35 @@ class geom_text(geom):
         return w, h
 
 
+# The aesthetics of geom_text and the matplotlib text properties
+# that they map to.
+TEXT_PROPERTIES = {
+    "size": "size",
+    "angle": "rotation",
+    "lineheight": "linespacing",
+    "ha": "ha",
+    "va": "va",
+    "family": "family",
+    "fontweight": "fontweight",
+    "fontstyle": "fontstyle",
+    "fontvariant": "fontvariant",
+}
+
+
+def _is_constant(values: AnyArray) -> bool:
+    """
+    Return True if all the values (rows) are the same
+    """
+    if not len(values):
+        return False
+
+    try:
+        return bool((values == values[0]).all())
+    except (ValueError, TypeError):
+        # e.g. values that are sequences
+        return False
+
+
 def check_adjust_text():
     try:
         pass
@@ -1,13 +1,28 @@
 from __future__ import annotations
 
 import typing
+from warnings import warn
 
-from .._utils import resolution
+import numpy as np
+
+from .._utils import resolution, to_rgba_array
 from ..doctools import document
+from ..exceptions import PlotnineWarning
 from .geom_rect import geom_rect
 
 if typing.TYPE_CHECKING:
+    from typing import Optional
+
     import pandas as pd
+    from matplotlib.axes import Axes
+
+    from plotnine.coords.coord import coord
+    from plotnine.iapi import panel_view
+    from plotnine.typing import IntArray
+
+# Fewest tiles in a panel for them to be drawn as an image when the
+# image parameter is None
+IMAGE_MIN_TILES = 10_000
 
 
 @document
@@ -20,10 +35,21 @@ class geom_tile(geom_rect):
     Parameters
     ----------
     {common_parameters}
+    image : bool, default=None
+        Whether to draw the tiles of a panel as a single image, with a
+        pixel for every tile. It is much faster than drawing thousands
+        of rectangles and looks the same as
+        [](:class:`~plotnine.geom_raster`). The tiles must have the
+        same width and height, and be laid out on a grid in a linear
+        coordinate system. If `None`{.py}, the image is used when there
+        are many tiles (at least 10,000) and they have no borders. If
+        `True`{.py}, the image is used whenever the tiles allow it, and
+        the borders (`color`) of the tiles are not drawn.
 
     See Also
     --------
     plotnine.geom_rect
+    plotnine.geom_raster
     """
 
     DEFAULT_AES = {
@@ -36,6 +62,7 @@ class geom_tile(geom_rect):
         "height": None,
     }
     REQUIRED_AES = {"x", "y"}
+    DEFAULT_PARAMS = {"image": None}
 
     def setup_data(self, data: pd.DataFrame) -> pd.DataFrame:
         try:
@@ -59,3 +86,118 @@ class geom_tile(geom_rect):
         data["ymin"] = data["y"] - height / 2
         data["ymax"] = data["y"] + height / 2
         return data
+
+    def draw_panel(
+        self,
+        data: pd.DataFrame,
+        panel_params: panel_view,
+        coord: coord,
+        ax: Axes,
+    ):
+        """
+        Plot all groups
+        """
+        image = self.params["image"]
+        if image is None:
+            image = (
+                len(data) >= IMAGE_MIN_TILES
+                and coord.is_linear
+                and data["color"].isna().all()
+            )
+
+        if image:
+            if coord.is_linear:
+                tdata = coord.transform(data, panel_params)
+                grid = _tile_grid(tdata)
+                if grid is not None:
+                    _draw_image(tdata, grid, ax, self.params)
+                    return
+
+            if self.params["image"]:
+                warn(
+                    "Cannot draw the tiles as an image. The tiles must "
+                    "have the same width & height, be on a grid and the "
+                    "coordinate system must be linear.",
+                    PlotnineWarning,
+                )
+
+        super().draw_panel(data, panel_params, coord, ax)
+
+
+class _Grid(typing.NamedTuple):
+    """
+    Location of the tiles on a grid
+    """
+
+    col: IntArray
+    row: IntArray
+    ncol: int
+    nrow: int
+    extent: tuple[float, float, float, float]
+
+
+def _tile_grid(data: pd.DataFrame) -> Optional[_Grid]:
+    """
+    Return the grid of the tiles, if they make one
+
+    The tiles make a grid if they have the same width & height, they
+    are offset by multiples of the width & height and do not overlap.
+    Most of the cells of the grid must be filled with tiles.
+    """
+    xmin, xmax = data["xmin"].to_numpy(), data["xmax"].to_numpy()
+    ymin, ymax = data["ymin"].to_numpy(), data["ymax"].to_numpy()
+    w, h = xmax - xmin, ymax - ymin
+    if not len(data) or not (np.isfinite(w).all() and np.isfinite(h).all()):
+        return None
+
+    # Tolerances as fractions of a tile
+    tol = 1e-3
+    width, height = w[0], h[0]
+    if (
+        width <= 0
+        or height <= 0
+        or np.any(np.abs(w - width) > tol * width)
+        or np.any(np.abs(h - height) > tol * height)
+    ):
+        return None
+
+    x0, y0 = xmin.min(), ymin.min()
+    col_pos = (xmin - x0) / width
+    row_pos = (ymin - y0) / height
+    col, row = np.rint(col_pos), np.rint(row_pos)
+    if np.any(np.abs(col_pos - col) > tol) or np.any(
+        np.abs(row_pos - row) > tol
+    ):
+        return None
+
+    col, row = col.astype(np.intp), row.astype(np.intp)
+    ncol, nrow = int(col.max()) + 1, int(row.max()) + 1
+    if ncol * nrow > 4 * len(data):
+        return None
+
+    cell = row * ncol + col
+    if len(np.unique(cell)) != len(cell):
+        return None
+
+    extent = (x0, x0 + ncol * width, y0, y0 + nrow * height)
+    return _Grid(col, row, ncol, nrow, extent)
+
+
+def _draw_image(data: pd.DataFrame, grid: _Grid, ax: Axes, params):
+    """
+    Draw the tiles as an image with a pixel for each tile
+    """
+    from matplotlib.image import AxesImage
+
+    X = np.zeros((grid.nrow, grid.ncol, 4))
+    X[grid.row, grid.col] = to_rgba_array(data["fill"], data["alpha"])
+    im = AxesImage(
+        ax,
+        data=X,
+        interpolation="nearest",
+        origin="lower",
+        extent=grid.extent,
+        zorder=params["zorder"],
+        rasterized=params["raster"],
+    )
+    ax.add_image(im)
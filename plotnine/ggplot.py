@@ -3,7 +3,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 from copy import copy, deepcopy
 from io import BytesIO
-from itertools import chain
+from itertools import chain, count
 from pathlib import Path
 from types import SimpleNamespace as NS
 from typing import (
@@ -24,12 +24,15 @@ from ._utils import (
     to_inches,
     ungroup,
 )
+from ._utils.cache import BUILD_CACHE
 from ._utils.context import plot_context
 from ._utils.ipython import (
     get_ipython,
     get_mimebundle,
     is_inline_backend,
 )
+from ._utils.parallel import ordered_map
+from ._utils.profile import profile_stage, profiling
 from ._utils.quarto import is_knitr_engine, is_quarto_environment
 from .coords import coord_cartesian
 from .exceptions import PlotnineError, PlotnineWarning
@@ -56,6 +59,7 @@ if TYPE_CHECKING:
     from plotnine._mpl.figure import p9Figure
     from plotnine._mpl.gridspec import p9GridSpec
     from plotnine._mpl.layout_manager._plot_side_space import PlotSideSpaces
+    from plotnine._utils.profile import profile_report
     from plotnine.composition import Compose
     from plotnine.coords.coord import coord
     from plotnine.facets.facet import facet
@@ -83,7 +87,11 @@ if TYPE_CHECKING:
             ...
 
 
-__all__ = ("ggplot", "ggsave", "save_as_pdf_pages")
+__all__ = ("ggplot", "ggsave", "save_as_pdf_pages", "save_many")
+
+# Identifies the state of the components of a plot that affect the
+# building. Any change to the components gets a new token.
+_build_tokens = count()
 
 
 class ggplot:
@@ -163,6 +171,7 @@ class ggplot:
 
         # build artefacts
         self._build_objs = NS(meta={})
+        self._build_token = next(_build_tokens)
 
     def __str__(self) -> str:
         """
@@ -226,6 +235,27 @@ class ggplot:
         else:
             self.draw(show=True)
 
+    @property
+    def profile(self) -> Optional[profile_report]:
+        """
+        Timings of the stages of the last build & draw of the plot
+
+        It is `None` unless the option `plotnine.options.profile`
+        was `True` when the plot was drawn.
+
+        Examples
+        --------
+        ```python
+        from plotnine.options import set_option
+
+        set_option("profile", True)
+        p.save("plot.png")
+        p.profile.to_frame()
+        ```
+        """
+        profiler = getattr(self._build_objs, "profiler", None)
+        return profiler and profiler.report
+
     def __deepcopy__(self, memo: dict[Any, Any]) -> Self:
         """
         Deep copy without copying the dataframe and environment
@@ -247,6 +277,17 @@ class ggplot:
 
         return result
 
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Return state without the objects of the last build
+
+        They hold on to the matplotlib figure of the last draw,
+        and that may not be picklable.
+        """
+        state = self.__dict__.copy()
+        state["_build_objs"] = NS(meta={})
+        return state
+
     def __iadd__(self, other: PlotAddable | list[PlotAddable] | None) -> Self:
         """
         Add other to ggplot object
@@ -260,10 +301,29 @@ class ggplot:
         if isinstance(other, Sequence):
             for item in other:
                 item.__radd__(self)
+                self._invalidate_build(item)
         elif other is not None:
             other.__radd__(self)
+            self._invalidate_build(other)
         return self
 
+    def _invalidate_build(self, other: PlotAddable):
+        """
+        Mark the built state of the plot as out of date
+
+        This is necessary if the added object affects the building
+        of the plot. Objects that only affect the rendering (theme,
+        labels, guides, watermarks & insets) do not.
+        """
+        from .composition._inset_element import inset_element
+        from .labels import labs
+        from .watermark import watermark
+
+        if not isinstance(
+            other, (theme, labs, guides, watermark, inset_element)
+        ):
+            self._build_token = next(_build_tokens)
+
     @overload
     def __add__(
         self,
@@ -358,6 +418,7 @@ class ggplot:
         if is_data_like(other):
             if self.data is None:
                 self.data = other
+                self._build_token = next(_build_tokens)
             else:
                 raise PlotnineError("`>>` failed, ggplot object has data.")
         else:
@@ -379,28 +440,38 @@ class ggplot:
         :
             Matplotlib figure
         """
-        with plot_context(self, show=show):
-            figure = self._setup()
-            self._build()
+        with plot_context(self, show=show), profiling(self):
+            with profile_stage("setup"):
+                figure = self._setup()
+
+            with profile_stage("build"):
+                self._build()
 
             # setup
-            self.guides._setup(self)
-            self.theme._setup(self)
+            with profile_stage("guides_setup"):
+                self.guides._setup(self)
+            with profile_stage("theme_setup"):
+                self.theme._setup(self)
 
             # Drawing (order matters)
             self._draw_plot_background()
             self._insets.draw(which="below")
 
-            self._sub_gridspec, self.axs = self.facet.setup(self)
-            self._draw_layers()
+            with profile_stage("facet_setup"):
+                self._sub_gridspec, self.axs = self.facet.setup(self)
+            with profile_stage("draw_layers"):
+                self._draw_layers()
             self._draw_panel_borders()
-            self._draw_breaks_and_labels()
-            self.guides.draw()
+            with profile_stage("draw_breaks_and_labels"):
+                self._draw_breaks_and_labels()
+            with profile_stage("guides_draw"):
+                self.guides.draw()
             self._draw_figure_texts()
             self._draw_watermarks()
 
             # Artist object theming
-            self.theme.apply()
+            with profile_stage("theme_apply"):
+                self.theme.apply()
 
             self._insets.draw(which="above")
 
@@ -443,6 +514,17 @@ class ggplot:
         responsible for making a copy and using that to make
         the method call.
         """
+        cache_key = None
+        if get_option("build_cache"):
+            BUILD_CACHE.maxsize = get_option("build_cache")
+            cache_key = self._build_token
+            # The cached state holds on to the data it was built from,
+            # and the data may have been replaced since.
+            cached = BUILD_CACHE.get(cache_key)
+            if cached is not None and cached[0] is self.data:
+                self._restore_build(cached[1])
+                return
+
         if not self.layers:
             self += geom_blank()
 
@@ -455,62 +537,127 @@ class ggplot:
 
         # Give each layer a copy of the data, the mappings and
         # the execution environment
-        layers.setup(self)
+        with profile_stage("layers_setup"):
+            layers.setup(self)
 
         # Initialise panels, add extra data for margins & missing
         # facetting variables, and add on a PANEL variable to data
-        layout.setup(layers, self)
+        with profile_stage("layout_setup"):
+            layout.setup(layers, self)
 
         # Compute aesthetics to produce data with generalised
         # variable names
-        layers.compute_aesthetics(self)
+        with profile_stage("compute_aesthetics"):
+            layers.compute_aesthetics(self)
 
         # Transform data using all scales
-        layers.transform(scales)
+        with profile_stage("transform"):
+            layers.transform(scales)
 
         # Make sure missing (but required) aesthetics are added
         scales.add_missing(("x", "y"))
 
         # Map and train positions so that statistics have access
         # to ranges and all positions are numeric
-        layout.train_position(layers, scales)
-        layout.map_position(layers)
+        with profile_stage("train_position"):
+            layout.train_position(layers, scales)
+        with profile_stage("map_position"):
+            layout.map_position(layers)
 
         # Apply and map statistics
-        layers.compute_statistic(layout)
-        layers.map_statistic(self)
+        with profile_stage("compute_statistic"):
+            layers.compute_statistic(layout)
+        with profile_stage("map_statistic"):
+            layers.map_statistic(self)
 
         # Prepare data in geoms
         # e.g. from y and width to ymin and ymax
-        layers.setup_data()
+        with profile_stage("setup_data"):
+            layers.setup_data()
 
         # Apply position adjustments
-        layers.compute_position(layout)
+        with profile_stage("compute_position"):
+            layers.compute_position(layout)
 
         # Reset position scales, then re-train and map.  This
         # ensures that facets have control over the range of
         # a plot.
         layout.reset_position_scales()
-        layout.train_position(layers, scales)
-        layout.map_position(layers)
+        with profile_stage("train_position"):
+            layout.train_position(layers, scales)
+        with profile_stage("map_position"):
+            layout.map_position(layers)
 
         # Train and map non-position scales
         npscales = scales.non_position_scales()
         if len(npscales):
-            layers.train(npscales)
-            layers.map(npscales)
+            with profile_stage("train_non_position"):
+                layers.train(npscales)
+            with profile_stage("map_non_position"):
+                layers.map(npscales)
 
         # Train coordinate system
-        layout.setup_panel_params(self.coordinates)
+        with profile_stage("setup_panel_params"):
+            layout.setup_panel_params(self.coordinates)
 
         # fill in the defaults
-        layers.use_defaults_after_scale(scales)
+        with profile_stage("use_defaults_after_scale"):
+            layers.use_defaults_after_scale(scales)
 
         # Allow stats to modify the layer data
-        layers.finish_statistics()
+        with profile_stage("finish_statistics"):
+            layers.finish_statistics()
 
         # Allow layout to modify data before rendering
-        layout.finish_data(layers)
+        with profile_stage("finish_data"):
+            layout.finish_data(layers)
+
+        if cache_key is not None:
+            BUILD_CACHE.put(cache_key, (self.data, self._built_state()))
+
+    def _built_state(self) -> tuple[Any, ...]:
+        """
+        Return a copy of the components that are modified by the build
+        """
+        state = deepcopy(
+            (
+                self.layers,
+                self.scales,
+                self.layout,
+                self.facet,
+                self.coordinates,
+            )
+        )
+        for l in state[0]:
+            l.data = l.data.copy()
+        return state
+
+    def _restore_build(self, state: tuple[Any, ...]):
+        """
+        Restore the components of the plot from a previous build
+
+        Parameters
+        ----------
+        state :
+            Built state created by `_built_state`.
+        """
+        (
+            self.layers,
+            self.scales,
+            self.layout,
+            self.facet,
+            self.coordinates,
+        ) = deepcopy(state)
+
+        # The layer data is shared with the cached state, drawing
+        # must not modify it.
+        for l in self.layers:
+            l.data = l.data.copy()
+
+        self._build_objs.layers = self.layers
+        self._build_objs.scales = self.scales
+        self._build_objs.layout = self.layout
+        self.layers.update_labels(self)
 
     def _draw_panel_borders(self):
         """
@@ -827,6 +974,7 @@ def save_as_pdf_pages(
     filename: Optional[str | Path] = None,
     path: str | None = None,
     verbose: bool = True,
+    workers: Optional[int] = 1,
     **kwargs: Any,
 ):
     """
@@ -860,6 +1008,13 @@ def save_as_pdf_pages(
         not filename).
     verbose :
         If `True`, print the saving information.
+    workers :
+        Number of worker processes in which to build, draw and lay
+        out the plots. If `None`, use as many as there are CPUs.
+        With more than one worker, the plots must be picklable.
+        The pages are rendered into the file by the calling process,
+        one after the other. Matplotlib cannot put pages rendered in
+        other processes into the same pdf file.
     kwargs :
         Additional arguments to pass to
         [](:meth:`~matplotlib.figure.Figure.savefig`).
@@ -896,6 +1051,7 @@ def save_as_pdf_pages(
     save_as_pdf_pages([plot + theme(figure_size=(8, 6))])
     ```
     """
+    import matplotlib as mpl
     from matplotlib.backends.backend_pdf import PdfPages
 
     # as in ggplot.save()
@@ -921,9 +1077,114 @@ def save_as_pdf_pages(
         warn(f"Filename: {filename}", PlotnineWarning)
 
     with PdfPages(filename) as pdf:
-        # Re-add the first element to the iterator, if it was removed
-        for plot in plots:
-            fig = plot.draw()
-            with plot_context(plot).rc_context:
+        # The plots are drawn in order (maybe in other processes) and
+        # the pages are rendered into the file as they become ready
+        for fig, rc in ordered_map(_draw_page, plots, workers):
+            with mpl.rc_context(rc):
                 # Save as a page in the PDF file
                 pdf.savefig(fig, **fig_kwargs)
+
+
+def _draw_page(plot: ggplot) -> tuple[Figure, dict[str, Any]]:
+    """
+    Draw and layout a plot for save_as_pdf_pages
+
+    Returns the figure and the matplotlib rcParams with which it
+    should be saved.
+
+    The figure is laid out with the text sizes of the pdf backend,
+    then it is detached from the plot. When the figure comes from
+    a worker process, the plot and its data are not pickled with it.
+    """
+    import matplotlib as mpl
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_pdf import FigureCanvasPdf
+
+    figure = plot.draw()
+    rc = plot.theme.rcParams
+    plt.close(figure)
+    FigureCanvasPdf(figure)
+    with mpl.rc_context(rc):
+        figure.draw_without_rendering()
+    figure.set_layout_engine("none")
+    return figure, rc
+
+
+def _save_one(args: tuple[ggplot, str | Path, dict[str, Any]]) -> str | Path:
+    """
+    Save a plot for save_many
+    """
+    plot, filename, kwargs = args
+    plot.save(filename, verbose=False, **kwargs)
+    return filename
+
+
+def save_many(
+    plots: Iterable[ggplot],
+    filenames: Iterable[str | Path],
+    path: str = "",
+    workers: Optional[int] = 1,
+    verbose: bool = True,
+    **kwargs: Any,
+):
+    """
+    Save multiple [](`~plotnine.ggplot`) objects, each to its own file
+
+    With `workers` greater than `1`, the plots are drawn and saved in
+    parallel, by a pool of worker processes.
+
+    Parameters
+    ----------
+    plots :
+        Plot objects to save. As with
+        [](:func:`~plotnine.save_as_pdf_pages`), this can be a
+        generator; only a few more plots than there are workers are
+        held in memory at any one time.
+    filenames :
+        File names to write the plots to, one for each plot. The
+        format of each file is determined by its extension. If
+        there are more or fewer file names than plots, a
+        [](:class:`ValueError`) is raised.
+    path :
+        Path to save the plots to.
+    workers :
+        Number of worker processes. If `1`, the plots are saved one
+        after the other in the current process. If `None`, use as
+        many as there are CPUs.
+    verbose :
+        If `True`, print the name of each file after it is saved.
+    kwargs :
+        Additional arguments to pass to
+        [](:meth:`~plotnine.ggplot.save`) for each plot, e.g.
+        `width`, `height`, `units` and `dpi`.
+
+    Notes
+    -----
+    When `workers > 1`, the plots are sent to the worker processes,
+    so they must be picklable; e.g. they cannot contain lambda
+    functions or functions defined in a notebook. The worker
+    processes use the same plotnine options as the calling process.
+    They are started fresh and import the main module, so in a script
+    the call must be under an `if __name__ == "__main__":` guard.
+
+    ```python
+    from plotnine import aes, geom_point, ggplot, save_many
+    from plotnine.data import mtcars
+
+    if __name__ == "__main__":
+        groups = mtcars.groupby("cyl")
+        plots = (
+            ggplot(group_data, aes("wt", "mpg")) + geom_point()
+            for _, group_data in groups
+        )
+        filenames = (f"mpg-cyl-{label}.png" for label, _ in groups)
+        save_many(plots, filenames, workers=4, width=6, height=4)
+    ```
+    """
+    if path:
+        filenames = (Path(path) / fn for fn in filenames)
+
+    items = ((p, fn, kwargs) for p, fn in zip(plots, filenames, strict=True))
+    for filename in ordered_map(_save_one, items, workers):
+        if verbose:
+            warn(f"Filename: {filename}", PlotnineWarning)
@@ -7,11 +7,17 @@ from typing import Iterable, List, cast, overload
 
 import pandas as pd
 
-from ._utils import array_kind, check_required_aesthetics, ninteraction
+from ._utils import (
+    array_kind,
+    check_required_aesthetics,
+    ninteraction,
+    to_pandas,
+)
+from ._utils.profile import profile_stage
 from ._utils.registry import Registry
 from .exceptions import PlotnineError
 from .mapping.aes import NO_GROUP, aes, make_labels
-from .mapping.evaluation import evaluate, stage
+from .mapping.evaluation import evaluate, expression_variables, stage
 
 if typing.TYPE_CHECKING:
     from typing import Any, Sequence, SupportsIndex
@@ -200,18 +206,64 @@ class layer:
 
         return result
 
-    def setup(self, plot: ggplot):
+    def setup(self, plot: ggplot, plot_data: DataLike | None = None):
         """
         Prepare layer for the plot building
 
         Give the layer access to the data, mapping and environment
+
+        Parameters
+        ----------
+        plot :
+            ggplot object
+        plot_data :
+            The data of the plot, if it has already been converted
+            to a dataframe. If `None`, `plot.data` is used.
         """
-        self._make_layer_data(plot.data)
+        if plot_data is None:
+            plot_data = plot.data
+
+        self._make_layer_data(plot_data, self._data_columns(plot))
         self._make_layer_mapping(plot.mapping)
         self._make_layer_environments(plot.environment)
         self._share_layer_params()
 
-    def _make_layer_data(self, plot_data: DataLike | None):
+    def _data_columns(self, plot: ggplot) -> set[str]:
+        """
+        Return the names of the columns the layer may use from its data
+
+        They are the variables in the starting aesthetic expressions
+        and in the facet specification. Once the aesthetics have been
+        evaluated, no other column is used.
+
+        Parameters
+        ----------
+        plot :
+            ggplot object
+        """
+        mapping = (
+            self.mapping.inherit(plot.mapping)
+            if self.inherit_aes
+            else self.mapping
+        )
+        facet = plot.facet
+        exprs = [
+            *getattr(facet, "vars", ()),
+            *getattr(facet, "rows", ()),
+            *getattr(facet, "cols", ()),
+        ]
+        for value in mapping.values():
+            if isinstance(value, stage):
+                value = value.start
+            if isinstance(value, str):
+                exprs.append(value)
+        return set().union(*(expression_variables(e) for e in exprs))
+
+    def _make_layer_data(
+        self,
+        plot_data: DataLike | None,
+        columns: set[str] | None = None,
+    ):
         """
         Generate data to be used by this layer
 
@@ -219,20 +271,28 @@ class layer:
         ----------
         plot_data :
             ggplot object data
+        columns :
+            Columns used by the layer. The layer gets a copy of the
+            data with only these columns. If `None`, it gets all the
+            columns.
         """
+        # A function gets all the data of the plot
+        plot_columns = None if callable(self._data) else columns
         if plot_data is None:
             data = pd.DataFrame()
         elif hasattr(plot_data, "to_pandas"):
-            data = cast("DataFrameConvertible", plot_data).to_pandas()
+            data = to_pandas(
+                cast("DataFrameConvertible", plot_data), plot_columns
+            )
         else:
             data = cast("pd.DataFrame", plot_data)
 
-        # Each layer that does not have data gets a copy of
-        # of the ggplot.data. If it has data it is replaced
-        # by copy so that we do not alter the users data
+        # Each layer that does not have data gets a copy of the
+        # columns it uses from the ggplot.data. If it has data it
+        # is replaced by copy so that we do not alter the users data
         if self._data is None:
             try:
-                self.data = copy(data)
+                self.data = _select_columns(data, columns)
             except AttributeError as e:
                 _geom_name = self.geom.__class__.__name__
                 _data_name = data.__class__.__name__
@@ -247,14 +307,15 @@ class layer:
                 raise PlotnineError(
                     "Data function must return a Pandas dataframe"
                 )
+            self.data = _select_columns(self.data, columns)
         else:
             # Recognise polars dataframes
             if hasattr(self._data, "to_pandas"):
-                self.data = cast(
-                    "DataFrameConvertible", self._data
-                ).to_pandas()
+                self.data = to_pandas(
+                    cast("DataFrameConvertible", self._data), columns
+                )
             elif isinstance(self._data, pd.DataFrame):
-                self.data = self._data.copy()
+                self.data = _select_columns(self._data, columns)
             else:
                 raise TypeError(f"Data has a bad type: {type(self.data)}")
 
@@ -515,54 +576,89 @@ class Layers(List[layer]):
         return [l.data for l in self]
 
     def setup(self, plot: ggplot):
+        # Data that is not a pandas dataframe is converted once for
+        # all the layers, and only with the columns that they use.
+        plot_data = plot.data
+        if plot_data is not None and hasattr(plot_data, "to_pandas"):
+            plot_data = to_pandas(
+                cast("DataFrameConvertible", plot_data),
+                self._plot_data_columns(plot),
+            )
+
         # If zorder is 0, it is left to MPL
         for i, l in enumerate(self, start=1):
             l.zorder = i
-            l.setup(plot)
+            with profile_stage("layers_setup", layer=i - 1):
+                l.setup(plot, plot_data)
 
-    def setup_data(self):
+    def _plot_data_columns(self, plot: ggplot) -> set[str] | None:
+        """
+        Return the columns of the plot data used by the layers
+
+        If `None`, all the columns may be used.
+        """
+        columns = set()
         for l in self:
-            l.setup_data()
+            if callable(l._data):
+                return None
+            elif l._data is None:
+                columns |= l._data_columns(plot)
+        return columns
+
+    def setup_data(self):
+        for i, l in enumerate(self):
+            with profile_stage("setup_data", layer=i):
+                l.setup_data()
 
     def draw(self, layout: Layout, coord: coord):
-        for l in self:
-            l.draw(layout, coord)
+        for i, l in enumerate(self):
+            with profile_stage("draw_layer", layer=i):
+                l.draw(layout, coord)
 
     def compute_aesthetics(self, plot: ggplot):
-        for l in self:
-            l.compute_aesthetics(plot)
+        for i, l in enumerate(self):
+            with profile_stage("compute_aesthetics", layer=i):
+                l.compute_aesthetics(plot)
 
     def compute_statistic(self, layout: Layout):
-        for l in self:
-            l.compute_statistic(layout)
+        for i, l in enumerate(self):
+            with profile_stage("compute_statistic", layer=i):
+                l.compute_statistic(layout)
 
     def map_statistic(self, plot: ggplot):
-        for l in self:
-            l.map_statistic(plot)
+        for i, l in enumerate(self):
+            with profile_stage("map_statistic", layer=i):
+                l.map_statistic(plot)
 
     def compute_position(self, layout: Layout):
-        for l in self:
-            l.compute_position(layout)
+        for i, l in enumerate(self):
+            with profile_stage("compute_position", layer=i):
+                l.compute_position(layout)
 
     def use_defaults_after_scale(self, scales: Scales):
-        for l in self:
-            l.data = l.use_defaults(l.data, l.mapping._scaled, scales)
+        for i, l in enumerate(self):
+            with profile_stage("use_defaults_after_scale", layer=i):
+                l.data = l.use_defaults(l.data, l.mapping._scaled, scales)
 
     def transform(self, scales: Scales):
-        for l in self:
-            l.data = scales.transform_df(l.data)
+        for i, l in enumerate(self):
+            with profile_stage("transform", layer=i):
+                l.data = scales.transform_df(l.data)
 
     def train(self, scales: Scales):
-        for l in self:
-            scales.train_df(l.data)
+        for i, l in enumerate(self):
+            with profile_stage("train_non_position", layer=i):
+                scales.train_df(l.data)
 
     def map(self, scales: Scales):
-        for l in self:
-            l.data = scales.map_df(l.data)
+        for i, l in enumerate(self):
+            with profile_stage("map_non_position", layer=i):
+                l.data = scales.map_df(l.data)
 
     def finish_statistics(self):
-        for l in self:
-            l.finish_statistics()
+        for i, l in enumerate(self):
+            with profile_stage("finish_statistics", layer=i):
+                l.finish_statistics()
 
     def update_labels(self, plot: ggplot):
         for l in self:
@@ -783,6 +879,33 @@ def _resolve_position(
     return klass()
 
 
+def _select_columns(
+    data: pd.DataFrame, columns: set[str] | None
+) -> pd.DataFrame:
+    """
+    Return a copy of the data with only some of the columns
+
+    Parameters
+    ----------
+    data :
+        Dataframe
+    columns :
+        Names of the columns to keep. Names that are not in the data
+        are ignored. If `None`, all the columns are kept.
+
+    Notes
+    -----
+    With copy-on-write, the copy shares the memory of the columns
+    with the data until either of them is modified. Without it, only
+    the selected columns are copied.
+    """
+    if columns is not None:
+        selected = [name for name in data.columns if name in columns]
+        if len(selected) < len(data.columns):
+            return data[selected]
+    return copy(data)
+
+
 def _decimal_columns_to_float(data: pd.DataFrame) -> pd.DataFrame:
     """
     Cast columns of decimal.Decimal values to float
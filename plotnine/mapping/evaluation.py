@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import ast
 import numbers
+from contextlib import suppress
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -198,6 +200,36 @@ def evaluate(
     return evaled
 
 
+def expression_variables(expr: str) -> set[str]:
+    """
+    Return the names that an expression may lookup in the data
+
+    Parameters
+    ----------
+    expr :
+        Expression of an aesthetic or facet variable,
+        e.g. `"np.log(x + y)"`.
+
+    Returns
+    -------
+    out :
+        The expression itself, which may be the name of a column,
+        and the names of all the variables in it.
+
+    Examples
+    --------
+    >>> sorted(expression_variables("np.log(x + y)"))
+    ['np', 'np.log(x + y)', 'x', 'y']
+    """
+    names = {expr}
+    with suppress(SyntaxError, ValueError):
+        tree = ast.parse(expr, mode="eval")
+        names.update(
+            node.id for node in ast.walk(tree) if isinstance(node, ast.Name)
+        )
+    return names
+
+
 def is_known_scalar(value):
     """
     Return True if value is a type we expect in a dataframe
@@ -65,6 +65,52 @@ be drawn or saved. This is to  prevent the common error of specifying
 dimensions in pixels.
 """
 
+build_cache: int = 0
+"""
+Maximum number of built plots to keep in memory for reuse.
+
+Building a plot computes the statistics, trains the scales and sets up
+the panels. If this option is greater than `0`, the result of the
+build is kept and reused when the same plot is rendered again with
+changes to only the theme, labels, guides, watermarks or size.
+e.g. saving a plot at different sizes and in different formats.
+
+Changes made to the data (or any other component) in place, instead of
+adding a new component to the plot, are not detected.
+"""
+
+smooth_cache: float = 0
+"""
+Maximum memory, in megabytes, of smoothed lines to keep for reuse.
+
+If this option is greater than `0`, the predictions of the model that
+[](:class:`~plotnine.stat_smooth`) fits to a group are kept, and reused
+when the same group (the same `x`, `y` & `weight` values) is smoothed
+with the same method, formula and arguments. The least recently used
+predictions are discarded to stay within the memory.
+"""
+
+munch_limit: Optional[int] = None
+"""
+Maximum number of points into which the paths drawn together (e.g.
+those of a layer in a panel) are subdivided in a non-linear coordinate
+system, e.g. [](:class:`~plotnine.coord_trans`).
+
+The paths are subdivided into short segments so that they follow the
+curves of the coordinate system. If this option is set and the paths
+would be subdivided into more points, the segments are made longer.
+Use it to bound the memory used by layers with very many vertices.
+"""
+
+profile: bool = False
+"""
+If `True`, record the time and peak memory of every stage of building
+and drawing a plot. The report is available as
+[](:attr:`~plotnine.ggplot.profile`) after the plot has been drawn.
+Profiling slows down the rendering, so use it only when diagnosing
+where the time goes.
+"""
+
 
 def get_option(name: str) -> Any:
     """
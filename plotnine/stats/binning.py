@@ -9,9 +9,11 @@ from ..exceptions import PlotnineError
 from ..scales.scale_discrete import scale_discrete
 
 if typing.TYPE_CHECKING:
-    from typing import Literal, Optional
+    from typing import Any, Callable, Iterable, Literal, Optional
 
-    from plotnine.typing import FloatArray, FloatArrayLike
+    import numpy.typing as npt
+
+    from plotnine.typing import FloatArray, FloatArrayLike, IntArray
 
 
 __all__ = (
@@ -19,7 +21,12 @@ __all__ = (
     "breaks_from_bins",
     "breaks_from_binwidth",
     "assign_bins",
+    "bin_index",
+    "bin_count",
+    "bin_count_2d",
     "fuzzybreaks",
+    "bin_chunks",
+    "bin_chunks_2d",
 )
 
 
@@ -135,6 +142,7 @@ def assign_bins(
     weight: Optional[FloatArrayLike] = None,
     pad: bool = False,
     closed: Literal["right", "left"] = "right",
+    group_idx: Optional[IntArray] = None,
 ):
     """
     Assign value in x to bins demacated by the break points
@@ -153,66 +161,187 @@ def assign_bins(
     closed :
         Whether the right or left edges of the bins are part of the
         bin.
+    group_idx :
+        Index (0, 1, ..., ngroups-1) of the group of each value in
+        `x`. If given, the values in each group are counted
+        separately and the result has the bins of the first group,
+        then those of the second group, and so on.
 
     Returns
     -------
     out : dataframe
         Bin count and density information.
     """
-    right = closed == "right"
-    # If weight not supplied to, use one (no weight)
-    if weight is None:
-        weight = np.ones(len(x))
-    else:
-        # If weight is a dtype that isn't writeable
-        # and does not own it's memory. Using a list
-        # as an intermediate easily solves this.
-        weight = np.array(list(weight))
-        weight[np.isnan(weight)] = 0
-
-    bin_idx = pd.cut(
-        x,
-        bins=breaks,  # type: ignore
-        labels=False,
-        right=right,
-        include_lowest=True,
-    )
+    breaks = np.asarray(breaks)
     bin_widths = np.diff(breaks)
-    bin_x = (breaks[:-1] + breaks[1:]) * 0.5  # type: ignore
-
-    # Create a dataframe with two columns:
-    #   - the bins to which each x is assigned
-    #   - the weight of each x value
-    # Then create a weighted frequency table
-    bins_long = pd.DataFrame({"bin_idx": bin_idx, "weight": weight})
-    wftable = bins_long.pivot_table(
-        "weight", index=["bin_idx"], aggfunc="sum"
-    )["weight"]
-
-    # Empty bins get no value in the computed frequency table.
-    # We need to add the zeros and since frequency table is a
-    # Series object, we need to keep it ordered
-    if len(wftable) < len(bin_x):
-        empty_bins = set(range(len(bin_x))) - set(bin_idx)
-        for b in empty_bins:
-            wftable.loc[b] = 0  # pyright: ignore
-        wftable = wftable.sort_index()
-    bin_count = wftable.tolist()
+    bin_x = (breaks[:-1] + breaks[1:]) * 0.5
+    nbins = len(bin_x)
+
+    # A weighted frequency table, with a row for each group
+    bin_idx = bin_index(x, breaks, closed=closed)
+    if group_idx is None:
+        counts = bin_count(bin_idx, nbins, weight)[np.newaxis, :]
+    else:
+        ngroups = group_idx.max(initial=-1) + 1
+        counts = bin_count(
+            group_idx * nbins + bin_idx,
+            ngroups * nbins,
+            weight,
+            inside=bin_idx >= 0,
+        ).reshape(ngroups, nbins)
 
     if pad:
         bw0 = bin_widths[0]
         bwn = bin_widths[-1]
-        bin_count = np.hstack([0, bin_count, 0])
+        zeros = np.zeros((len(counts), 1))
+        counts = np.hstack([zeros, counts, zeros])
         bin_widths = np.hstack([bw0, bin_widths, bwn])
         bin_x = np.hstack([bin_x[0] - bw0, bin_x, bin_x[-1] + bwn])
 
-    return result_dataframe(bin_count, bin_x, bin_widths)
+    return result_dataframe(counts, bin_x, bin_widths)
+
+
+def bin_index(
+    x: FloatArrayLike,
+    breaks: FloatArrayLike,
+    closed: Literal["right", "left"] = "right",
+    include_lowest: bool = True,
+) -> IntArray:
+    """
+    Return the bin of each value
+
+    It is equivalent to `pandas.cut(x, breaks, labels=False)`, but
+    values that are not in any bin get `-1` instead of `NaN`.
+
+    Parameters
+    ----------
+    x :
+        Values to be binned.
+    breaks :
+        Sequence of break points, in increasing order.
+    closed :
+        Whether the right or left edges of the bins are part of the
+        bin.
+    include_lowest :
+        Whether the first break is part of the first bin, when the
+        bins are closed on the right.
+
+    Returns
+    -------
+    out :
+        Index (0, 1, ..., nbins-1) of the bin of each value.
+    """
+    x = np.asarray(x)
+    breaks = np.asarray(breaks)
+    nbins = len(breaks) - 1
+
+    # NaNs sort after all the breaks so they end up outside the bins
+    if closed == "right":
+        idx = np.searchsorted(breaks, x, side="left") - 1
+        if include_lowest:
+            idx[x == breaks[0]] = 0
+    else:
+        idx = np.searchsorted(breaks, x, side="right") - 1
+
+    idx[(idx < 0) | (idx >= nbins)] = -1
+    return idx
+
+
+def bin_count(
+    bin_idx: IntArray,
+    nbins: int,
+    weight: Optional[FloatArrayLike] = None,
+    inside: Optional[npt.NDArray[np.bool_]] = None,
+) -> FloatArray:
+    """
+    Weighted count of the values in each bin
+
+    Parameters
+    ----------
+    bin_idx :
+        Bin of each value.
+    nbins :
+        Number of bins.
+    weight :
+        Weight of each value. Missing weights count as 0. If `None`,
+        each value has a weight of 1.
+    inside :
+        Whether each value is in a bin. If `None`, the values with
+        a negative `bin_idx` are not in any bin.
+
+    Returns
+    -------
+    out :
+        Count in each bin.
+    """
+    if inside is None:
+        inside = bin_idx >= 0
+
+    if weight is not None:
+        weight = np.asarray(weight, dtype=float)
+        if np.isnan(weight).any():
+            weight = np.where(np.isnan(weight), 0, weight)
+
+    if not inside.all():
+        bin_idx = bin_idx[inside]
+        if weight is not None:
+            weight = weight[inside]
+
+    return np.bincount(bin_idx, weights=weight, minlength=nbins).astype(float)
+
+
+def bin_count_2d(
+    x: FloatArrayLike,
+    y: FloatArrayLike,
+    xbreaks: FloatArrayLike,
+    ybreaks: FloatArrayLike,
+    weight: Optional[FloatArrayLike] = None,
+    include_lowest: bool = True,
+) -> tuple[FloatArray, IntArray]:
+    """
+    Weighted count of the values in each cell of a grid of bins
+
+    The bins are closed on the right.
+
+    Parameters
+    ----------
+    x, y :
+        Values to be binned.
+    xbreaks, ybreaks :
+        Break points along x and y.
+    weight :
+        Weight of each value. If `None`, each value has a weight of 1.
+    include_lowest :
+        Whether the first break is part of the first bin.
+
+    Returns
+    -------
+    count :
+        `(ny, nx)` array of the weighted count in each cell.
+    n :
+        `(ny, nx)` array of the number of values in each cell.
+    """
+    nx, ny = len(xbreaks) - 1, len(ybreaks) - 1
+    xidx = bin_index(x, xbreaks, include_lowest=include_lowest)
+    yidx = bin_index(y, ybreaks, include_lowest=include_lowest)
+    inside = (xidx >= 0) & (yidx >= 0)
+    idx = yidx * nx + xidx
+    count = bin_count(idx, nx * ny, weight, inside)
+    n = np.bincount(idx[inside], minlength=nx * ny)
+    return count.reshape(ny, nx), n.reshape(ny, nx)
 
 
 def result_dataframe(count, x, width, xmin=None, xmax=None):
     """
     Create a dataframe to hold bin information
+
+    If count is 2-dimensional, each row has the counts of a group
+    and the dataframe has the bins of all the groups, one after the
+    other.
     """
+    count = np.atleast_2d(count)
+    ngroups = len(count)
+
     if xmin is None:
         xmin = x - width / 2
 
@@ -222,19 +351,24 @@ def result_dataframe(count, x, width, xmin=None, xmax=None):
     # Eliminate any numerical roundoff discrepancies
     # between the edges
     xmin[1:] = xmax[:-1]
-    density = (count / width) / np.sum(np.abs(count))
+    total = np.sum(np.abs(count), axis=1, keepdims=True)
+    density = (count / width) / total
 
     out = pd.DataFrame(
         {
-            "count": count,
-            "x": x,
-            "xmin": xmin,
-            "xmax": xmax,
-            "width": width,
-            "density": density,
-            "ncount": count / np.max(np.abs(count)),
-            "ndensity": density / np.max(np.abs(density)),
-            "ngroup:": np.sum(np.abs(count)),
+            "count": count.ravel(),
+            "x": np.tile(x, ngroups),
+            "xmin": np.tile(xmin, ngroups),
+            "xmax": np.tile(xmax, ngroups),
+            "width": np.tile(width, ngroups),
+            "density": density.ravel(),
+            "ncount": (
+                count / np.max(np.abs(count), axis=1, keepdims=True)
+            ).ravel(),
+            "ndensity": (
+                density / np.max(np.abs(density), axis=1, keepdims=True)
+            ).ravel(),
+            "ngroup:": np.repeat(total.ravel(), count.shape[1]),
         }
     )
     return out
@@ -320,3 +454,272 @@ def _adjust_breaks(breaks: FloatArray, right: bool) -> FloatArray:
     fuzzy = np.nextafter(breaks, limit)
     fuzzy[idx] = np.nextafter(breaks[idx], -limit)
     return fuzzy
+
+
+def bin_chunks(
+    chunks: Iterable[Any] | Callable[[], Iterable[Any]],
+    x: str = "x",
+    weight: Optional[str] = None,
+    bins: Optional[int] = 30,
+    binwidth: Optional[float] = None,
+    breaks: Optional[FloatArrayLike] = None,
+    center: Optional[float] = None,
+    boundary: Optional[float] = None,
+    closed: Literal["right", "left"] = "right",
+    pad: bool = False,
+    limits: Optional[tuple[float, float]] = None,
+) -> pd.DataFrame:
+    """
+    Bin data that comes in chunks, as [](`~plotnine.stats.stat_bin`) does
+
+    The data is never all in memory, the memory used depends on the
+    number of bins. The first pass over the chunks computes the range
+    of the values and the second pass counts them. For the same range
+    and parameters, the bins & counts are those of `stat_bin`.
+
+    Parameters
+    ----------
+    chunks :
+        The chunks of data. A chunk is any object whose columns can
+        be got with `chunk[name]`{.py} e.g. a pandas or polars
+        dataframe, or a pyarrow record batch. If the data has to be
+        read twice, `chunks` should be a function that returns a new
+        iterable of the chunks each time it is called, or an iterable
+        that can be iterated over more than once e.g. a list.
+    x :
+        Name of the column with the values to bin.
+    weight :
+        Name of the column with the weight of each value.
+    bins :
+        Number of bins. Overridden by binwidth. Unlike `stat_bin`,
+        the number of bins is not computed from the data, that needs
+        all the values at once.
+    binwidth :
+        The width of the bins.
+    breaks :
+        Bin boundaries. This supersedes the `binwidth`, `bins`,
+        `center` and `boundary`. The data is read once.
+    center :
+        The center of one of the bins.
+    boundary :
+        A boundary between two bins.
+    closed :
+        Which edge of the bins is included.
+    pad :
+        If `True`{.py}, adds empty bins at either side of x.
+    limits :
+        The range of the values. If given, the data is read once.
+
+    Returns
+    -------
+    out :
+        Bin count and density information. Plot it with
+        `geom_col` or `geom_rect`.
+
+    Examples
+    --------
+    ```python
+    import pyarrow.parquet as pq
+
+    def chunks():
+        return pq.ParquetFile("telemetry.parquet").iter_batches(
+            columns=["latency"]
+        )
+
+    data = bin_chunks(chunks, x="latency", binwidth=5)
+    ggplot(data, aes("x", "count")) + geom_col(width=5)
+    ```
+    """
+    if closed not in ("right", "left"):
+        raise PlotnineError("`closed` should either 'right' or 'left'")
+
+    if breaks is not None:
+        breaks = np.asarray(breaks, dtype=float)
+    else:
+        if limits is None:
+            limits = _chunks_range(chunks, x)
+        if binwidth is not None:
+            breaks = breaks_from_binwidth(limits, binwidth, center, boundary)
+        elif bins is not None:
+            breaks = breaks_from_bins(limits, bins, center, boundary)
+        else:
+            raise PlotnineError(
+                "Chunked binning needs one of 'bins', 'binwidth' or 'breaks'."
+            )
+
+    nbins = len(breaks) - 1
+    counts = np.zeros(nbins)
+    for chunk in _iter_chunks(chunks):
+        bin_idx = bin_index(_chunk_column(chunk, x), breaks, closed=closed)
+        w = None if weight is None else _chunk_column(chunk, weight)
+        counts += bin_count(bin_idx, nbins, w)
+
+    # Same as assign_bins, but for the accumulated counts
+    bin_widths = np.diff(breaks)
+    bin_x = (breaks[:-1] + breaks[1:]) * 0.5
+    if pad:
+        bw0, bwn = bin_widths[0], bin_widths[-1]
+        counts = np.hstack([0, counts, 0])
+        bin_widths = np.hstack([bw0, bin_widths, bwn])
+        bin_x = np.hstack([bin_x[0] - bw0, bin_x, bin_x[-1] + bwn])
+
+    return result_dataframe(counts, bin_x, bin_widths)
+
+
+def bin_chunks_2d(
+    chunks: Iterable[Any] | Callable[[], Iterable[Any]],
+    x: str = "x",
+    y: str = "y",
+    weight: Optional[str] = None,
+    bins: int | tuple[int, int] = 30,
+    binwidth: Optional[float | tuple[float, float]] = None,
+    breaks: Optional[FloatArrayLike | tuple[FloatArrayLike, ...]] = None,
+    drop: bool = True,
+    xlimits: Optional[tuple[float, float]] = None,
+    ylimits: Optional[tuple[float, float]] = None,
+) -> pd.DataFrame:
+    """
+    Bin 2D data that comes in chunks, as `stat_bin_2d` does
+
+    The data is read in two passes, the first trains the x & y
+    scales on the range of the values and the second counts them.
+    The breaks are computed with the same `fuzzybreaks` as
+    [](`~plotnine.stats.stat_bin_2d`), so the rectangles & counts
+    are the same.
+
+    Parameters
+    ----------
+    chunks :
+        The chunks of data. See [](`~plotnine.stats.binning.bin_chunks`).
+    x, y :
+        Names of the columns with the values to bin.
+    weight :
+        Name of the column with the weight of each value.
+    bins :
+        Number of bins in both directions, or a tuple with the
+        number of bins along x & y.
+    binwidth :
+        The width of the bins. It overrides `bins`. Give a tuple
+        for a different width along x & y.
+    breaks :
+        Bin boundaries, along both x & y or a tuple with the breaks
+        along x & y. They supersede `binwidth` and `bins`.
+    drop :
+        If `True`{.py}, leave out the bins that have no values.
+    xlimits, ylimits :
+        The range of the values. If both (or the breaks) are given,
+        the data is read once.
+
+    Returns
+    -------
+    out :
+        The rectangles, counts and densities. Plot them with
+        `geom_rect`.
+    """
+    from ..scales import scale_x_continuous, scale_y_continuous
+    from .stat_bin_2d import dual_param
+
+    bins = dual_param(bins)
+    binwidth = dual_param(binwidth)
+    breaks = dual_param(breaks)
+
+    # The scales are trained on the range of the values, as they
+    # would be if the data were all in memory
+    scale_x, scale_y = scale_x_continuous(), scale_y_continuous()
+    need_x = breaks.x is None and xlimits is None
+    need_y = breaks.y is None and ylimits is None
+    if need_x or need_y:
+        xlimits_, ylimits_ = _chunks_range(chunks, x, y)
+        xlimits = xlimits_ if need_x else xlimits
+        ylimits = ylimits_ if need_y else ylimits
+    scale_x.train(np.asarray(xlimits if xlimits is not None else []))
+    scale_y.train(np.asarray(ylimits if ylimits is not None else []))
+
+    xbreaks = np.asarray(
+        fuzzybreaks(scale_x, breaks=breaks.x, binwidth=binwidth.x, bins=bins.x)
+    )
+    ybreaks = np.asarray(
+        fuzzybreaks(scale_y, breaks=breaks.y, binwidth=binwidth.y, bins=bins.y)
+    )
+
+    shape = (len(ybreaks) - 1, len(xbreaks) - 1)
+    count, n = np.zeros(shape), np.zeros(shape, dtype=int)
+    for chunk in _iter_chunks(chunks):
+        c, m = bin_count_2d(
+            _chunk_column(chunk, x),
+            _chunk_column(chunk, y),
+            xbreaks,
+            ybreaks,
+            None if weight is None else _chunk_column(chunk, weight),
+            include_lowest=False,
+        )
+        count += c
+        n += m
+
+    # Same as stat_bin_2d
+    ybreaks[0] -= np.diff(np.diff(ybreaks))[0]
+    xbreaks[0] -= np.diff(np.diff(xbreaks))[0]
+    j, i = np.indices(count.shape).reshape(2, -1)
+    count = count.ravel()
+    if drop:
+        keep = n.ravel() > 0
+        i, j, count = i[keep], j[keep], count[keep]
+
+    data = pd.DataFrame(
+        {
+            "xmin": xbreaks[i],
+            "xmax": xbreaks[i + 1],
+            "ymin": ybreaks[j],
+            "ymax": ybreaks[j + 1],
+            "count": count,
+        }
+    )
+    data["density"] = data["count"] / data["count"].sum()
+    return data
+
+
+def _iter_chunks(chunks: Iterable[Any] | Callable[[], Iterable[Any]]):
+    """
+    Return a new iterator over the chunks
+    """
+    return iter(chunks() if callable(chunks) else chunks)
+
+
+def _chunk_column(chunk: Any, name: str) -> FloatArray:
+    """
+    Get a column of a chunk as an array of floats
+    """
+    return np.asarray(chunk[name], dtype=float)
+
+
+def _chunks_range(
+    chunks: Iterable[Any] | Callable[[], Iterable[Any]], *names: str
+) -> tuple[tuple[float, float], ...] | tuple[float, float]:
+    """
+    Compute the range of the finite values in columns of the chunks
+
+    This is the first of two passes over the chunks, so the chunks
+    must be able to be read again.
+    """
+    if not callable(chunks) and iter(chunks) is chunks:
+        raise PlotnineError(
+            "The chunks are read twice, first to compute the range "
+            "of the values then to count them. Pass a function that "
+            "returns the chunks, or give the limits."
+        )
+
+    lo = np.full(len(names), np.inf)
+    hi = np.full(len(names), -np.inf)
+    for chunk in _iter_chunks(chunks):
+        for k, name in enumerate(names):
+            values = _chunk_column(chunk, name)
+            values = values[np.isfinite(values)]
+            if len(values):
+                lo[k] = min(lo[k], values.min())
+                hi[k] = max(hi[k], values.max())
+
+    if not np.isfinite(lo).all():
+        raise PlotnineError("The chunks have no finite values to bin.")
+
+    ranges = tuple((float(a), float(b)) for a, b in zip(lo, hi))
+    return ranges[0] if len(ranges) == 1 else ranges
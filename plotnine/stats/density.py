@@ -15,6 +15,7 @@ import typing
 import numpy as np
 
 from .._utils import array_kind
+from ..exceptions import PlotnineError
 
 if typing.TYPE_CHECKING:
     from typing import Any, Literal
@@ -145,6 +146,9 @@ def kde_count(data: FloatArray, grid: FloatArray, **kwargs: Any) -> FloatArray:
     """
     Kernel Density Estimation via count within radius
 
+    The data points are put in a KD-tree, then the tree is queried
+    for the number of points within the radius of each grid point.
+
     Parameters
     ----------
     data :
@@ -155,24 +159,174 @@ def kde_count(data: FloatArray, grid: FloatArray, **kwargs: Any) -> FloatArray:
         Data points at which the desity will be estimated. It
         has `m x p` dimensions, representing m points and p
         variables.
+    **kwargs :
+        `radius` : The radius within which to count the points.
+        The default is a tenth of the range of the data.
+
+        `workers` : Number of threads with which to query the tree.
+        If `-1`, all the CPUs are used. Default is 1.
 
     Returns
     -------
     out :
         Density estimate. Has `m x 1` dimensions
     """
-    r = kwargs.get("radius", np.ptp(data) / 10)
+    from scipy.spatial import cKDTree
 
-    # Get the number of data points within the radius r of each grid point
-    iter = (np.sum(np.linalg.norm(data - g, axis=1) < r) for g in grid)
-    count = np.fromiter(iter, float, count=data.shape[0])
+    data = np.asarray(data, dtype=float).reshape(len(data), -1)
+    grid = np.asarray(grid, dtype=float).reshape(len(grid), -1)
+    n = data.shape[0]
+    data = data[np.isfinite(data).all(axis=1)]
+    r = kwargs.get("radius", np.ptp(data) / 10)
+    workers = kwargs.get("workers", 1)
+
+    # Get the number of data points within the radius r of each grid
+    # point. The tree includes the points at a distance of r.
+    count = np.zeros(len(grid))
+    finite = np.isfinite(grid).all(axis=1)
+    if len(data) and r > 0:
+        tree = cKDTree(data)
+        count[finite] = tree.query_ball_point(
+            grid[finite],
+            np.nextafter(r, 0),
+            return_length=True,
+            workers=workers,
+        )
 
     # Get fraction of data within radius
-    density = count / data.shape[0]
+    density = count / n
 
     return density
 
 
+def kde_fft(data: FloatArray, grid: FloatArray, **kwargs: Any) -> FloatArray:
+    """
+    Kernel Density Estimation by binning and FFT convolution
+
+    The data is binned onto a regular grid with linear binning, the
+    counts are convolved with a gaussian kernel using the FFT and the
+    density at the grid points is interpolated (linearly) from the
+    nodes of that grid. The time it takes grows with the number of
+    data points only through the binning, so it is fit for millions
+    of points.
+
+    The kernel is a product of gaussians with a bandwidth for each
+    variable i.e. unlike [](`~scipy.stats.gaussian_kde`) the correlation
+    between the variables is ignored.
+
+    Parameters
+    ----------
+    data :
+        Data points used to compute a density estimator. It
+        has `n x p` dimensions, representing n points and p
+        variables.
+    grid :
+        Data points at which the desity will be estimated. It
+        has `m x p` dimensions, representing m points and p
+        variables.
+    **kwargs :
+        `bw` : The bandwidth. One of `"scott"` (the default),
+        `"silverman"`, a number or a sequence with a number for
+        each variable.
+
+        `gridsize` : The number of nodes along each variable of the
+        binning grid. The default is 4096 for one variable and 512
+        for two.
+
+        `cut` : How far (in bandwidths) the binning grid extends
+        beyond the data. The density further than that from all the
+        data is 0. Default is 4.
+
+        `weights` : Weight of each data point.
+
+    Returns
+    -------
+    out :
+        Density estimate. Has `m x 1` dimensions
+    """
+    from functools import reduce
+    from itertools import product
+
+    from scipy.fft import irfftn, next_fast_len, rfftn
+    from scipy.ndimage import map_coordinates
+
+    data = np.asarray(data, dtype=float).reshape(len(data), -1)
+    grid = np.asarray(grid, dtype=float).reshape(len(grid), -1)
+    weights = kwargs.get("weights")
+    bw = kwargs.get("bw", "scott")
+    cut = kwargs.get("cut", 4)
+    n, p = data.shape
+    gridsize = kwargs.get("gridsize", {1: 4096, 2: 512}.get(p, 32))
+
+    weights = np.ones(n) if weights is None else np.asarray(weights, float)
+    finite = np.isfinite(data).all(axis=1) & np.isfinite(weights)
+    data, weights = data[finite], weights[finite]
+    total = weights.sum()
+    if total <= 0:
+        return np.zeros(len(grid))
+
+    # Bandwidth of each variable
+    if isinstance(bw, str):
+        neff = total**2 / np.sum(weights**2)
+        if bw == "scott":
+            factor = neff ** (-1 / (p + 4))
+        elif bw == "silverman":
+            factor = (neff * (p + 2) / 4) ** (-1 / (p + 4))
+        else:
+            raise PlotnineError(f"Unknown bandwidth method {bw!r}.")
+        mean = np.average(data, axis=0, weights=weights)
+        var = np.average((data - mean) ** 2, axis=0, weights=weights)
+        var *= neff / max(neff - 1, 1)
+        h = np.sqrt(var) * factor
+    else:
+        h = np.broadcast_to(np.asarray(bw, dtype=float), (p,))
+
+    if not (h > 0).all():
+        raise PlotnineError(
+            "The bandwidth of the kernel density is zero, "
+            "all the values of a variable are the same."
+        )
+
+    # The binning grid
+    lo = data.min(axis=0) - cut * h
+    hi = data.max(axis=0) + cut * h
+    delta = (hi - lo) / (gridsize - 1)
+    shape = (gridsize,) * p
+
+    # Linear binning, each point is shared by the corners of
+    # the cell in which it falls
+    pos = (data - lo) / delta
+    i0 = np.clip(np.floor(pos).astype(np.intp), 0, gridsize - 2)
+    frac = pos - i0
+    counts = np.zeros(gridsize**p)
+    for corner in product((0, 1), repeat=p):
+        c = np.array(corner)
+        idx = np.ravel_multi_index((i0 + c).T, shape)
+        w = weights * np.prod(np.where(c, frac, 1 - frac), axis=1)
+        counts += np.bincount(idx, w, minlength=counts.size)
+
+    # Convolution with the gaussian kernel, truncated at the cut
+    kernels = []
+    for hk, dk in zip(h, delta):
+        m = min(int(np.ceil(cut * hk / dk)), gridsize - 1)
+        u = np.arange(-m, m + 1) * dk / hk
+        kernels.append(np.exp(-0.5 * u**2) / (hk * np.sqrt(2 * np.pi)))
+    kernel = reduce(np.multiply.outer, kernels)
+    full = [gridsize + len(k) - 1 for k in kernels]
+    fshape = [next_fast_len(n, real=True) for n in full]
+    nodes = irfftn(
+        rfftn(counts.reshape(shape), fshape) * rfftn(kernel, fshape),
+        fshape,
+    )
+    # The kernels are centered, trim the overhang of the convolution
+    trim = tuple(slice(len(k) // 2, len(k) // 2 + gridsize) for k in kernels)
+    nodes = nodes[trim]
+    nodes = np.maximum(nodes, 0) / total
+
+    coords = ((grid - lo) / delta).T
+    return map_coordinates(nodes, coords, order=1, mode="constant", cval=0)
+
+
 KDE_FUNCS = {
     "statsmodels-u": kde_statsmodels_u,
     "statsmodels-m": kde_statsmodels_m,
@@ -180,6 +334,7 @@ KDE_FUNCS = {
     "scikit-learn": kde_sklearn,
     "sklearn": kde_sklearn,
     "count": kde_count,
+    "fft": kde_fft,
 }
 
 
@@ -194,7 +349,8 @@ def kde(
     package :
         Package whose kernel density estimation to use.
         Should be one of
-        `['statsmodels-u', 'statsmodels-m', 'scipy', 'sklearn']`.
+        `['statsmodels-u', 'statsmodels-m', 'scipy', 'sklearn', 'count',
+        'fft']`.
     data :
         Data points used to compute a density estimator. It
         has `n x p` dimensions, representing n points and p
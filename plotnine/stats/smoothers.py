@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import pickle
 import warnings
 from contextlib import suppress
 from typing import TYPE_CHECKING, Callable, cast
@@ -11,6 +13,8 @@ from .._utils import get_valid_kwargs
 from ..exceptions import PlotnineError, PlotnineWarning
 
 if TYPE_CHECKING:
+    from typing import Hashable, Literal, Optional
+
     import statsmodels.api as sm
 
     from plotnine.typing import FloatArray
@@ -55,6 +59,116 @@ def predictdf(data, xseq, params) -> pd.DataFrame:
     return method(data, xseq, params)
 
 
+def predictdf_key(data, xseq, params) -> Optional[Hashable]:
+    """
+    Return a key that identifies a prediction made by predictdf
+
+    The key is made from the values of the `x`, `y` & `weight`
+    columns (all the columns if there is a formula), the points of
+    the prediction and the parameters of the method. Returns `None`
+    if the method arguments cannot be hashed, then the prediction
+    should not be cached.
+    """
+    if params["formula"]:
+        columns = list(data.columns)
+    else:
+        columns = [c for c in ("x", "y", "weight") if c in data]
+
+    try:
+        method_args = pickle.dumps(params["method_args"])
+    except Exception:
+        return None
+
+    h = hashlib.blake2b(digest_size=16)
+    h.update(pd.util.hash_pandas_object(data[columns], index=False).to_numpy())
+    h.update(np.asarray(xseq, dtype=float).tobytes())
+    h.update(method_args)
+    return (
+        params["method"],
+        params["formula"],
+        params["se"],
+        params["level"],
+        params["span"],
+        tuple(columns),
+        h.hexdigest(),
+    )
+
+
+def reduce_points(
+    data: pd.DataFrame,
+    strategy: Literal["bin", "sample"],
+    max_n: int,
+) -> pd.DataFrame:
+    """
+    Reduce the points of a group to at most max_n weighted points
+
+    Parameters
+    ----------
+    data :
+        The points of a group, sorted by `x`. It may have a `weight`
+        column.
+    strategy :
+        How to reduce the points. With `"bin"`, the range of `x` is
+        split into `max_n` equal bins and the points in each bin are
+        replaced by their weighted mean at the center of the bin.
+        If all the points have the same `x`, they are not reduced.
+        With `"sample"`, the points are split into `max_n` strata of
+        consecutive points and one point is chosen at random from each
+        stratum. The first and last points are always chosen.
+    max_n :
+        Maximum number of points.
+
+    Returns
+    -------
+    out :
+        The points with columns `x`, `y` and `weight`. The weight of
+        a point is the total weight of the points it replaces.
+    """
+    from .binning import bin_index
+
+    n = len(data)
+    x = data["x"].to_numpy(dtype=float)
+    y = data["y"].to_numpy(dtype=float)
+    w = (
+        data["weight"].to_numpy(dtype=float)
+        if "weight" in data
+        else np.ones(n)
+    )
+
+    if strategy == "bin" and x[0] == x[-1]:
+        # All the points are at the same x, there is nothing to bin
+        wsum = w
+    elif strategy == "bin":
+        # The centers of the outer bins are at the ends of the range,
+        # the model then does not extrapolate to get there.
+        centers = np.linspace(x[0], x[-1], max_n)
+        half = (centers[1] - centers[0]) / 2
+        breaks = np.append(centers - half, centers[-1] + half)
+        idx = bin_index(x, breaks)
+        wsum = np.bincount(idx, w, max_n)
+        keep = wsum > 0
+        wsum = wsum[keep]
+        x = centers[keep]
+        y = np.bincount(idx, w * y, max_n)[keep] / wsum
+    elif strategy == "sample":
+        # Stratum of each point, they have (almost) equal sizes
+        strata = np.arange(n) * max_n // n
+        starts = np.flatnonzero(np.diff(strata, prepend=-1))
+        sizes = np.diff(starts, append=n)
+        # A fixed seed, the smooth does not change when the plot
+        # is drawn again
+        rng = np.random.default_rng(123)
+        pick = starts + (rng.random(len(starts)) * sizes).astype(np.intp)
+        pick[[0, -1]] = 0, n - 1
+        wsum = np.add.reduceat(w, starts)
+        x, y = x[pick], y[pick]
+    else:
+        msg = f"Unknown large_n strategy {strategy!r}, use 'bin' or 'sample'."
+        raise PlotnineError(msg)
+
+    return pd.DataFrame({"x": x, "y": y, "weight": wsum})
+
+
 def lm(data, xseq, params) -> pd.DataFrame:
     """
     Fit OLS / WLS if data has weight
@@ -446,6 +560,12 @@ def gpr(data, xseq, params):
             PlotnineWarning,
         )
 
+    # The weights are the precisions of the points, e.g. a point that
+    # is the mean of many others has less noise.
+    if "weight" in data:
+        alpha = kwargs.get("alpha", 1e-10)
+        kwargs = {**kwargs, "alpha": alpha / data["weight"].to_numpy()}
+
     regressor = gaussian_process.GaussianProcessRegressor(**kwargs)
     X = np.atleast_2d(data["x"]).T
     n = len(data)
@@ -4,15 +4,19 @@ import typing
 from copy import deepcopy
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 
 from .._utils import (
     check_required_aesthetics,
     data_mapping_as_kwargs,
+    group_bounds,
+    group_uniquecols,
     groupby_apply,
     remove_missing,
     uniquecols,
 )
+from .._utils.profile import profile_stage
 from .._utils.registry import Register, _MergedDefaultParams
 from ..layer import layer
 from ..mapping import aes
@@ -24,7 +28,7 @@ if typing.TYPE_CHECKING:
     from plotnine.facets.layout import Layout
     from plotnine.iapi import pos_scales
     from plotnine.mapping import Environment
-    from plotnine.typing import DataLike
+    from plotnine.typing import DataLike, IntArray
 
 from abc import ABC
 
@@ -280,8 +284,10 @@ class stat(ABC, metaclass=Register):
             # that does the real computation
             if len(pdata) == 0:
                 return pdata
-            pscales = layout.get_scales(pdata["PANEL"].iloc[0])
-            return self.compute_panel(pdata, pscales)
+            panel = pdata["PANEL"].iloc[0]
+            pscales = layout.get_scales(panel)
+            with profile_stage("compute_panel", panel=int(panel)):
+                return self.compute_panel(pdata, pscales)
 
         return groupby_apply(data, "PANEL", fn)
 
@@ -313,6 +319,29 @@ class stat(ABC, metaclass=Register):
         if not len(data):
             return type(data)()
 
+        if self._computes_groups():
+            stats = self._compute_groups_panel(data, scales)
+        else:
+            stats = self._compute_group_panel(data, scales)
+
+        dropped = data.columns.difference(
+            stats.columns.union(self.DROPPED_AES)
+        ).to_list()
+        if dropped:
+            warn(DROPPED_TPL.format(dropped=dropped))
+        # Note: If the data coming in has columns with non-unique
+        # values with-in group(s), this implementation loses the
+        # columns. Individual stats may want to do some preparation
+        # before then fall back on this implementation or override
+        # it completely.
+        return stats
+
+    def _compute_group_panel(
+        self, data: pd.DataFrame, scales: pos_scales
+    ) -> pd.DataFrame:
+        """
+        Compute the statistics one group at a time
+        """
         stats = []
         for _, old in data.groupby("group"):
             new = self.compute_group(old, scales)
@@ -329,18 +358,45 @@ class stat(ABC, metaclass=Register):
             group_result = pd.concat([new, u], axis=1)
             stats.append(group_result)
 
-        stats = pd.concat(stats, axis=0, ignore_index=True)
-        dropped = data.columns.difference(
-            stats.columns.union(self.DROPPED_AES)
-        ).to_list()
-        if dropped:
-            warn(DROPPED_TPL.format(dropped=dropped))
-        # Note: If the data coming in has columns with non-unique
-        # values with-in group(s), this implementation loses the
-        # columns. Individual stats may want to do some preparation
-        # before then fall back on this implementation or override
-        # it completely.
-        return stats
+        return pd.concat(stats, axis=0, ignore_index=True)
+
+    def _compute_groups_panel(
+        self, data: pd.DataFrame, scales: pos_scales
+    ) -> pd.DataFrame:
+        """
+        Compute the statistics for all the groups in one call
+        """
+        group = data["group"].to_numpy()
+        if (group[1:] < group[:-1]).any():
+            order = np.argsort(group, kind="stable")
+            data = data.take(order)
+        data = data.reset_index(drop=True)
+
+        bounds = group_bounds(data["group"])
+        new = self.compute_groups(data, bounds, scales)
+        new.reset_index(drop=True, inplace=True)
+
+        # Columns that are constant within the groups are carried
+        # over to the computed rows of those groups
+        unique = group_uniquecols(data, bounds)
+        missing = unique.columns.difference(new.columns)
+        idx = np.searchsorted(unique["group"].to_numpy(), new["group"])
+        u = unique.loc[idx, missing].reset_index(drop=True)
+        return pd.concat([new, u], axis=1)
+
+    def _computes_groups(self) -> bool:
+        """
+        Return True if the statistics are computed by compute_groups
+
+        The method that is closest to the stat in the class hierarchy,
+        i.e. compute_group or compute_groups, is used.
+        """
+        for klass in type(self).__mro__:
+            if "compute_groups" in vars(klass):
+                return klass is not stat
+            if "compute_group" in vars(klass):
+                return False
+        return False
 
     def compute_group(
         self, data: pd.DataFrame, scales: pos_scales
@@ -368,6 +424,37 @@ class stat(ABC, metaclass=Register):
         msg = "{} should implement this method."
         raise NotImplementedError(msg.format(self.__class__.__name__))
 
+    def compute_groups(
+        self, data: pd.DataFrame, bounds: IntArray, scales: pos_scales
+    ) -> pd.DataFrame:
+        """
+        Calculate statistics for all the groups in a panel
+
+        Stats that can compute the statistics of all the groups
+        together (e.g. using vectorised numpy operations) should
+        implement this method instead of `compute_group`. It avoids
+        the cost of splitting the panel into many small dataframes.
+
+        Parameters
+        ----------
+        data :
+            Data for a panel, sorted by group.
+        bounds :
+            Boundaries of the groups in the data. The rows of the
+            `i`th group are `data.iloc[bounds[i]:bounds[i+1]]`.
+        scales :
+            x (``scales.x``) and y (``scales.y``) scale objects.
+
+        Returns
+        -------
+        out :
+            The computed statistics, with a `group` column. The
+            columns that are constant within each group need not
+            be included, they are added after.
+        """
+        msg = "{} should implement this method."
+        raise NotImplementedError(msg.format(self.__class__.__name__))
+
     def __radd__(self, other: ggplot) -> ggplot:
         """
         Add layer representing stat object on the right
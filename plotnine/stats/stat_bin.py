@@ -111,7 +111,7 @@ class stat_bin(stat):
             )
             warn(msg.format(params["bins"]), PlotnineWarning)
 
-    def compute_group(self, data, scales):
+    def compute_groups(self, data, bounds, scales):
         params = self.params
         if params["breaks"] is not None:
             breaks = np.asarray(params["breaks"])
@@ -132,11 +132,16 @@ class stat_bin(stat):
                 params["boundary"],
             )
 
+        # The breaks are the same for all groups
+        sizes = np.diff(bounds)
         new_data = assign_bins(
             data["x"],
             breaks,
             data.get("weight"),
             params["pad"],
             params["closed"],
+            group_idx=np.repeat(np.arange(len(sizes)), sizes),
         )
+        groups = data["group"].to_numpy()[bounds[:-1]]
+        new_data["group"] = np.repeat(groups, len(new_data) // len(groups))
         return new_data
@@ -1,4 +1,3 @@
-import itertools
 import types
 
 import numpy as np
@@ -7,7 +6,7 @@ import pandas as pd
 from .._utils import is_scalar
 from ..doctools import document
 from ..mapping.evaluation import after_stat
-from .binning import fuzzybreaks
+from .binning import bin_count_2d, fuzzybreaks
 from .stat import stat
 
 
@@ -81,19 +80,6 @@ class stat_bin_2d(stat):
         drop = self.params["drop"]
         weight = data.get("weight")
 
-        if weight is None:
-            weight = np.ones(len(data["x"]))
-
-        # The bins will be over the dimension(full size) of the
-        # trained x and y scales
-        range_x = scales.x.dimension()
-        range_y = scales.y.dimension()
-
-        # Trick pd.cut into creating cuts over the range of
-        # the scale
-        x = np.append(data["x"], range_x)
-        y = np.append(data["y"], range_y)
-
         # create the cutting parameters
         xbreaks = fuzzybreaks(
             scales.x, breaks=breaks.x, binwidth=binwidth.x, bins=bins.x
@@ -101,64 +87,36 @@ class stat_bin_2d(stat):
         ybreaks = fuzzybreaks(
             scales.y, breaks.y, binwidth=binwidth.y, bins=bins.y
         )
-
-        xbins = pd.cut(
-            x,
-            bins=xbreaks,  # pyright: ignore
-            labels=False,
-            right=True,
-        )
-        ybins = pd.cut(
-            y,
-            bins=ybreaks,  # pyright: ignore
-            labels=False,
-            right=True,
+        xbreaks, ybreaks = np.asarray(xbreaks), np.asarray(ybreaks)
+        count, n = bin_count_2d(
+            data["x"],
+            data["y"],
+            xbreaks,
+            ybreaks,
+            weight,
+            include_lowest=False,
         )
 
-        # Remove the spurious points
-        xbins = xbins[:-2]
-        ybins = ybins[:-2]
-
         # Because we are graphing, we want to see equal breaks
         # The original breaks have an extra room to the left
         ybreaks[0] -= np.diff(np.diff(ybreaks))[0]
         xbreaks[0] -= np.diff(np.diff(xbreaks))[0]
 
-        bins_grid_long = pd.DataFrame(
-            {
-                "xbins": xbins,
-                "ybins": ybins,
-                "weight": weight,
-            }
-        )
-        table = bins_grid_long.pivot_table(
-            "weight", index=["xbins", "ybins"], aggfunc="sum"
-        )["weight"]
-
-        # create rectangles
-        rects = []
-        keys = itertools.product(
-            range(len(ybreaks) - 1), range(len(xbreaks) - 1)
-        )
-        for j, i in keys:
-            try:
-                cval = table[(i, j)]
-            except KeyError:
-                if drop:
-                    continue
-                cval = 0
-            # xmin, xmax, ymin, ymax, count
-            row = [
-                xbreaks[i],
-                xbreaks[i + 1],
-                ybreaks[j],
-                ybreaks[j + 1],
-                cval,
-            ]
-            rects.append(row)
+        # create rectangles, the cells are in row-major order
+        j, i = np.indices(count.shape).reshape(2, -1)
+        count = count.ravel()
+        if drop:
+            keep = n.ravel() > 0
+            i, j, count = i[keep], j[keep], count[keep]
 
         new_data = pd.DataFrame(
-            rects, columns=["xmin", "xmax", "ymin", "ymax", "count"]
+            {
+                "xmin": xbreaks[i],
+                "xmax": xbreaks[i + 1],
+                "ymin": ybreaks[j],
+                "ymax": ybreaks[j + 1],
+                "count": count,
+            }
         )
         new_data["density"] = new_data["count"] / new_data["count"].sum()
         return new_data
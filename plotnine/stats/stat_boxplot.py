@@ -92,42 +92,57 @@ class stat_boxplot(stat):
             x = data.get("x", 0)
             self.params["width"] = resolution(x, False) * 0.75
 
-    def compute_group(self, data, scales):
-        n = len(data)
+    def compute_groups(self, data, bounds, scales):
+        starts = bounds[:-1]
         y = data["y"].to_numpy()
         if "weight" in data:
-            weights = data["weight"]
-            total_weight = np.sum(weights)
+            weights = data["weight"].to_numpy()
+            total_weight = np.add.reduceat(weights, starts)
         else:
             weights = None
-            total_weight = len(y)
-        res = weighted_boxplot_stats(
-            y, weights=weights, whis=self.params["coef"]
-        )
+            total_weight = np.diff(bounds)
 
-        if len(np.unique(data["x"])) > 1:
-            width = np.ptp(data["x"]) * 0.9
-        else:
-            width = self.params["width"]
+        res = [
+            weighted_boxplot_stats(
+                y[i:j],
+                weights=None if weights is None else weights[i:j],
+                whis=self.params["coef"],
+            )
+            for i, j in zip(bounds[:-1], bounds[1:])
+        ]
 
         if isinstance(data["x"].dtype, pd.CategoricalDtype):
-            x = data["x"].iloc[0]
+            x = data["x"].iloc[starts].to_numpy()
+            _x = data["x"].cat.codes.to_numpy()
         else:
-            x = np.mean([data["x"].min(), data["x"].max()])
+            _x = data["x"].to_numpy()
+            x = None
+
+        xmin = np.minimum.reduceat(_x, starts)
+        xmax = np.maximum.reduceat(_x, starts)
+        width = np.where(
+            xmax > xmin, (xmax - xmin) * 0.9, self.params["width"]
+        )
+        if x is None:
+            x = (xmin + xmax) / 2
+
+        def get(key):
+            return [r[key] for r in res]
 
         d = {
-            "ymin": res["whislo"],
-            "lower": res["q1"],
-            "middle": [res["med"]],
-            "upper": res["q3"],
-            "ymax": res["whishi"],
-            "outliers": [res["fliers"]],
-            "notchupper": res["cihi"],
-            "notchlower": res["cilo"],
+            "ymin": get("whislo"),
+            "lower": get("q1"),
+            "middle": get("med"),
+            "upper": get("q3"),
+            "ymax": get("whishi"),
+            "outliers": pd.Series(get("fliers"), dtype=object),
+            "notchupper": get("cihi"),
+            "notchlower": get("cilo"),
             "x": x,
             "width": width,
             "relvarwidth": np.sqrt(total_weight),
-            "n": n,
+            "n": np.diff(bounds),
+            "group": data["group"].to_numpy()[starts],
         }
         return pd.DataFrame(d)
 
@@ -53,26 +53,29 @@ class stat_count(stat):
         if self.params["width"] is None:
             self.params["width"] = resolution(data["x"], False) * 0.9
 
-    def compute_group(self, data, scales):
-        x = data["x"]
+    def compute_groups(self, data, bounds, scales):
         if ("y" in data) or ("y" in self.params):
             msg = "stat_count() must not be used with a y aesthetic"
             raise PlotnineError(msg)
 
-        weight = data.get("weight", [1] * len(x))
-        width = self.params["width"]
-        xdata_long = pd.DataFrame({"x": x, "weight": weight})
-        # weighted frequency count
-        count = xdata_long.pivot_table("weight", index=["x"], aggfunc="sum")[
+        weight = data.get("weight", 1)
+        xdata_long = pd.DataFrame(
+            {"group": data["group"], "x": data["x"], "weight": weight}
+        )
+        # weighted frequency count at each x position of each group
+        count = xdata_long.groupby(["group", "x"], observed=True)[
             "weight"
-        ]
-        x = count.index
+        ].sum()
+        group = count.index.get_level_values("group")
+        x = count.index.get_level_values("x")
         count = count.to_numpy()
+        total = pd.Series(np.abs(count)).groupby(group).transform("sum")
         return pd.DataFrame(
             {
                 "count": count,
-                "prop": count / np.abs(count).sum(),
+                "prop": count / total.to_numpy(),
                 "x": x,
-                "width": width,
+                "width": self.params["width"],
+                "group": group,
             }
         )
@@ -32,8 +32,15 @@ class stat_density_2d(stat):
     levels : int | array_like, default=5
         Contour levels. If an integer, it specifies the maximum number
         of levels, if array_like it is the levels themselves.
-    package : Literal["statsmodels", "scipy", "sklearn"], default="statsmodels"
-        Package whose kernel density estimation to use.
+    package : Literal["statsmodels", "scipy", "sklearn", "count", "fft"], \
+default="statsmodels"
+        Package whose kernel density estimation to use. `"fft"`{.py}
+        is not a package, it bins the data and convolves the counts
+        with a gaussian kernel. Use it for large data. Its `kde_params`
+        are `bw` (`"scott"`{.py}, `"silverman"`{.py} or a number),
+        `gridsize` and `cut`. `"count"`{.py} is the fraction of the
+        points within a `radius` (in `kde_params`), a `workers`
+        parameter sets the number of threads that count them.
     kde_params : dict
         Keyword arguments to pass on to the kde class.
 
@@ -1,6 +1,7 @@
 import numpy as np
 import pandas as pd
 
+from .._utils import group_bounds
 from ..doctools import document
 from ..mapping.evaluation import after_stat
 from .stat import stat
@@ -45,20 +46,82 @@ class stat_ecdf(stat):
     CREATES = {"ecdf"}
     DROPPED_AES = ["weight"]
 
-    def compute_group(self, data, scales):
-        from statsmodels.distributions.empirical_distribution import ECDF
-
+    def compute_groups(self, data, bounds, scales):
         n, pad = self.params["n"], self.params["pad"]
+        sizes = np.diff(bounds)
+        group_idx = np.repeat(np.arange(len(sizes)), sizes)
+        x = data["x"].to_numpy()
 
+        # The points at which to evaluate the ECDF of each group.
         # If n is None, use raw values; otherwise interpolate
         if n is None:
-            x = np.unique(data["x"])
+            order = np.lexsort((x, group_idx))
+            xs, gs = x[order], group_idx[order]
+            starts = group_bounds(gs, xs)[:-1]
+            qx, qgroup_idx = xs[starts], gs[starts]
         else:
-            x = np.linspace(data["x"].min(), data["x"].max(), n)
+            xmin = np.minimum.reduceat(x, bounds[:-1])
+            xmax = np.maximum.reduceat(x, bounds[:-1])
+            qx = np.linspace(xmin, xmax, n, axis=1).ravel()
+            qgroup_idx = np.repeat(np.arange(len(sizes)), n)
 
         if pad:
-            x = np.hstack([-np.inf, x, np.inf])
+            idx = np.arange(len(sizes))
+            inf = np.full(len(sizes), np.inf)
+            qx = np.hstack([-inf, qx, inf])
+            qgroup_idx = np.hstack([idx, qgroup_idx, idx])
+            order = np.lexsort((qx, qgroup_idx))
+            qx, qgroup_idx = qx[order], qgroup_idx[order]
+
+        ecdf = ecdf_within_groups(x, group_idx, qx, qgroup_idx)
+        return pd.DataFrame(
+            {
+                "x": qx,
+                "ecdf": ecdf,
+                "group": data["group"].to_numpy()[bounds[:-1]][qgroup_idx],
+            }
+        )
+
+
+def ecdf_within_groups(x, group_idx, qx, qgroup_idx):
+    """
+    Evaluate the empirical CDF of each group at points of the group
+
+    Parameters
+    ----------
+    x : array_like
+        Values from which to compute the empirical CDFs.
+    group_idx : array_like[int]
+        Index (0, 1, ..., ngroups-1) of the group of each value in `x`.
+    qx : array_like
+        Points at which to evaluate the empirical CDFs.
+    qgroup_idx : array_like[int]
+        Index of the group of each point in `qx`.
+
+    Returns
+    -------
+    out : array_like
+        Proportion of the values in the group that are less than
+        or equal to each point in `qx`.
+    """
+    ngroups = max(group_idx.max(initial=-1), qgroup_idx.max(initial=-1)) + 1
+    sizes = np.bincount(group_idx, minlength=ngroups)
+
+    # Sort the data values and the query points together, within
+    # their groups, with the data values first where they are equal.
+    # Then the number of data values that are <= a query point is
+    # the number of data values before it in the group.
+    values = np.hstack([x, qx])
+    groups = np.hstack([group_idx, qgroup_idx])
+    is_query = np.hstack(
+        [np.zeros(len(x), dtype=bool), np.ones(len(qx), dtype=bool)]
+    )
+    order = np.lexsort((is_query, values, groups))
+    ndata = np.cumsum(~is_query[order])
+    ndata_before_group = np.hstack([0, np.cumsum(sizes)])[groups[order]]
+    count = ndata - ndata_before_group
 
-        ecdf = ECDF(data["x"].to_numpy())(x)
-        res = pd.DataFrame({"x": x, "ecdf": ecdf})
-        return res
+    result = np.empty(len(qx))
+    qorder = order[is_query[order]] - len(x)
+    result[qorder] = count[is_query[order]]
+    return result / sizes[qgroup_idx]
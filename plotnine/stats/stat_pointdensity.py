@@ -22,8 +22,15 @@ class stat_pointdensity(stat):
     Parameters
     ----------
     {common_parameters}
-    package : Literal["statsmodels", "scipy", "sklearn"], default="statsmodels"
-        Package whose kernel density estimation to use.
+    package : Literal["statsmodels", "scipy", "sklearn", "count", "fft"], \
+default="statsmodels"
+        Package whose kernel density estimation to use. `"fft"`{.py}
+        is not a package, it bins the data and convolves the counts
+        with a gaussian kernel. Use it for large data. Its `kde_params`
+        are `bw` (`"scott"`{.py}, `"silverman"`{.py} or a number),
+        `gridsize` and `cut`. `"count"`{.py} is the fraction of the
+        points within a `radius` (in `kde_params`), a `workers`
+        parameter sets the number of threads that count them.
     kde_params : dict, default=None
         Keyword arguments to pass on to the kde class.
 
@@ -1,11 +1,21 @@
+from __future__ import annotations
+
+import os
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from warnings import warn
 
+import numpy as np
 import pandas as pd
 
 from ..doctools import document
 from ..exceptions import PlotnineWarning
 from .stat import stat
 
+if typing.TYPE_CHECKING:
+    from plotnine.typing import FloatArray
+
 
 # method_args are any of the keyword args (other than q) for
 # statsmodels.regression.quantile_regression.QuantReg.fit
@@ -26,6 +36,10 @@ class stat_quantile(stat):
     method_args : dict, default=None
         Extra arguments passed on to the model fitting method,
         [](`~statsmodels.regression.quantile_regression.QuantReg.fit`).
+    workers : int, default=1
+        Number of threads with which to fit the models of the
+        quantiles (of all the groups). If `None`{.py}, the number
+        of CPUs is used.
 
     See Also
     --------
@@ -53,6 +67,7 @@ class stat_quantile(stat):
         "quantiles": (0.25, 0.5, 0.75),
         "formula": "y ~ x",
         "method_args": {},
+        "workers": 1,
     }
     CREATES = {"quantile", "group"}
     DROPPED_AES = ["weight"]
@@ -70,31 +85,92 @@ class stat_quantile(stat):
         except TypeError:
             params["quantiles"] = (params["quantiles"],)
 
-    def compute_group(self, data, scales):
-        res = [
-            quant_pred(q, data, self.params) for q in self.params["quantiles"]
+    def compute_panel(self, data, scales):
+        data = super().compute_panel(data, scales)
+        # Each quantile line is a group
+        if len(data):
+            data["group"] = (
+                data["group"].astype(str) + "-" + data["quantile"].astype(str)
+            )
+        return data
+
+    def compute_groups(self, data, bounds, scales):
+        params = self.params
+        quantiles = params["quantiles"]
+        workers = params["workers"] or os.cpu_count() or 1
+
+        # The design matrices of a group are created once, for
+        # all the quantiles
+        designs = [
+            quant_design(data.iloc[i:j], params)
+            for i, j in zip(bounds[:-1], bounds[1:])
         ]
-        return pd.concat(res, axis=0, ignore_index=True)
+        tasks = [(design, q) for design in designs for q in quantiles]
+
+        def fit(task):
+            design, q = task
+            return quant_fit(design, q, params)
+
+        if workers > 1 and len(tasks) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                predictions = list(executor.map(fit, tasks))
+        else:
+            predictions = [fit(task) for task in tasks]
+
+        nq = len(quantiles)
+        groups = data["group"].to_numpy()[bounds[:-1]]
+        return pd.DataFrame(
+            {
+                "x": np.hstack([design.xrange for design, _ in tasks]),
+                "quantile": np.repeat([q for _, q in tasks], 2),
+                "group": np.repeat(groups, 2 * nq),
+                "y": np.hstack(predictions),
+            }
+        )
+
+
+@dataclass
+class QuantDesign:
+    """
+    The design matrices with which to fit & predict the quantiles
+    """
+
+    y: FloatArray
+    X: FloatArray
+    Xpred: FloatArray
+    xrange: FloatArray
 
 
-def quant_pred(q, data, params):
+def quant_design(data, params) -> QuantDesign:
     """
-    Quantile precitions
+    Create the design matrices of a group
     """
-    import statsmodels.formula.api as smf
+    from patsy import build_design_matrices, dmatrices
 
-    mod = smf.quantreg(
+    y, X = dmatrices(
         params["formula"],
         data,
-        eval_env=params.get("eval_env"),
+        eval_env=params.get("eval_env", 0),
+        return_type="dataframe",
     )
-    reg_res = mod.fit(q=q, **params["method_args"])
-    out = pd.DataFrame(
-        {
-            "x": [data["x"].min(), data["x"].max()],
-            "quantile": q,
-            "group": f"{data['group'].iloc[0]}-{q}",
-        }
+    xrange = np.array([data["x"].min(), data["x"].max()])
+    (Xpred,) = build_design_matrices(
+        [X.design_info], pd.DataFrame({"x": xrange})
     )
-    out["y"] = reg_res.predict(out)
-    return out
+    return QuantDesign(
+        y.to_numpy().ravel(),
+        X.to_numpy(),
+        np.asarray(Xpred),
+        xrange,
+    )
+
+
+def quant_fit(design: QuantDesign, q: float, params) -> FloatArray:
+    """
+    Predict the quantile at the ends of the range of x
+    """
+    from statsmodels.regression.quantile_regression import QuantReg
+
+    model = QuantReg(design.y, design.X)
+    result = model.fit(q=q, **params["method_args"])
+    return design.Xpred @ result.params
@@ -1,17 +1,21 @@
+from __future__ import annotations
+
 from typing import TYPE_CHECKING, cast
 
 import numpy as np
-import pandas as pd
 
 from .._utils import array_kind, jitter, nextafter_range, resolution
 from ..doctools import document
 from ..exceptions import PlotnineError
 from ..mapping.aes import has_groups
-from .binning import breaks_from_bins, breaks_from_binwidth
+from .binning import bin_index, breaks_from_bins, breaks_from_binwidth
 from .stat import stat
 from .stat_density import compute_density
 
 if TYPE_CHECKING:
+    from typing import Any
+
+    from plotnine.iapi import pos_scales
     from plotnine.typing import FloatArray, IntArray
 
 
@@ -53,7 +57,8 @@ class stat_sina(stat):
         If the samples within the same y-axis bin are more
         than `bin_limit`, the samples's X coordinates will be adjusted.
         This parameter is effective only when `method="counts"`{.py}
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator | \
+~numpy.random.RandomState, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
     scale : Literal["area", "count", "width"], default="area"
@@ -190,65 +195,57 @@ class stat_sina(stat):
 
         return data
 
-    def compute_group(self, data, scales):
-        binwidth = self.params["binwidth"]
-        maxwidth = self.params["maxwidth"]
-        bin_limit = self.params["bin_limit"]
-        weight = None
-        y = data["y"]
-
-        if len(data) == 0:
-            return pd.DataFrame()
-
-        elif len(data) < 3:
-            data["density"] = 0
-            data["scaled"] = 1
-        elif len(np.unique(y)) < 2:
-            data["density"] = 1
-            data["scaled"] = 1
-        elif self.params["method"] == "density":
-            from scipy.interpolate import interp1d
-
-            # density kernel estimation
-            range_y = y.min(), y.max()
-            dens = compute_density(y, weight, range_y, self.params)
-            densf = interp1d(
-                dens["x"],
-                dens["density"],
-                bounds_error=False,
-                fill_value="extrapolate",  # pyright: ignore
-            )
-            data["density"] = densf(y)
-            data["scaled"] = data["density"] / dens["density"].max()
-        else:
-            expanded_y_range = nextafter_range(scales.y.dimension())
-            if binwidth is not None:
-                bins = breaks_from_binwidth(expanded_y_range, binwidth)
+    def compute_groups(self, data, bounds, scales):
+        params = self.params
+        maxwidth = params["maxwidth"]
+        bin_limit = params["bin_limit"]
+        starts = bounds[:-1]
+        sizes = np.diff(bounds)
+        group_idx = np.repeat(np.arange(len(sizes)), sizes)
+        x = data["x"].to_numpy(dtype=float)
+        y = data["y"].to_numpy(dtype=float)
+
+        # Groups with fewer than 3 points have no density, and groups
+        # with only one y value have a uniform density
+        ymin = np.minimum.reduceat(y, starts)
+        ymax = np.maximum.reduceat(y, starts)
+        small = sizes < 3
+        flat = ~small & (ymin == ymax)
+        estimate = ~small & ~flat
+        dtype = float if params["method"] == "density" else int
+        density = np.where(flat, 1, 0).astype(dtype)[group_idx]
+        scaled = np.ones(len(data))
+
+        rows = estimate[group_idx]
+        if rows.any():
+            if params["method"] == "density":
+                _density, max_density = density_within_groups(
+                    y, bounds, np.flatnonzero(estimate), ymin, ymax, params
+                )
             else:
-                bins = breaks_from_bins(expanded_y_range, self.params["bins"])
-
-            # bin based estimation
-            bin_index = pd.cut(y, bins, include_lowest=True, labels=False)  # pyright: ignore[reportCallIssue,reportArgumentType]
-            data["density"] = (
-                pd.Series(bin_index)
-                .groupby(bin_index)
-                .apply(len)[bin_index]
-                .to_numpy()
-            )
-            data.loc[data["density"] <= bin_limit, "density"] = 0
-            data["scaled"] = data["density"] / data["density"].max()
-
-        # Compute width if x has multiple values
-        if len(data["x"].unique()) > 1:
-            width = np.ptp(data["x"]) * maxwidth
-        else:
-            width = maxwidth
-
-        data["width"] = width
-        data["n"] = len(data)
-        data["x"] = np.mean([data["x"].max(), data["x"].min()])
-
-        return data
+                _density = count_within_groups(
+                    y, group_idx, len(sizes), scales, params
+                )
+                _density[_density <= bin_limit] = 0
+                max_density = np.maximum.reduceat(_density, starts)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                _scaled = _density / max_density[group_idx]
+            density[rows] = _density[rows]
+            scaled[rows] = _scaled[rows]
+
+        # The width of a group spans its x values
+        xmin = np.minimum.reduceat(x, starts)
+        xmax = np.maximum.reduceat(x, starts)
+        width = np.where(xmax > xmin, (xmax - xmin) * maxwidth, maxwidth)
+
+        return data.assign(
+            x=((xmax + xmin) / 2)[group_idx],
+            density=density,
+            scaled=scaled,
+            width=width[group_idx],
+            n=sizes[group_idx],
+        )
 
     def finish_layer(self, data):
         # Rescale x in case positions have been adjusted
@@ -277,3 +274,98 @@ class stat_sina(stat):
                 mirror_x(even & (x_mean < x) | ~even & (x < x_mean))
 
         return data
+
+
+def density_within_groups(
+    y: FloatArray,
+    bounds: IntArray,
+    groups: IntArray,
+    ymin: FloatArray,
+    ymax: FloatArray,
+    params: dict[str, Any],
+) -> tuple[FloatArray, FloatArray]:
+    """
+    Evaluate the density of each group at the values of the group
+
+    Parameters
+    ----------
+    y :
+        Values of all the groups, sorted by group.
+    bounds :
+        Boundaries of the groups in `y`.
+    groups :
+        Indices of the groups whose density to compute. The
+        density of the other groups is `0`.
+    ymin, ymax :
+        Range of the values of each group.
+    params :
+        Parameters for `compute_density`.
+
+    Returns
+    -------
+    density :
+        Density at each value in `y`.
+    max_density :
+        Largest value of the density of each group.
+    """
+    ngroups = len(bounds) - 1
+    density = np.zeros(len(y))
+    max_density = np.zeros(ngroups)
+    if not len(groups):
+        return density, max_density
+
+    # The density grids of the groups are mapped onto disjoint
+    # intervals, [2*i, 2*i+1] for the ith group, so that the
+    # values of all the groups are interpolated in one call
+    grid_x, grid_y = [], []
+    for i in groups:
+        lo, hi = bounds[i], bounds[i + 1]
+        dens = compute_density(y[lo:hi], None, (ymin[i], ymax[i]), params)
+        grid_x.append(_offset(dens["x"].to_numpy(), ymin[i], ymax[i], i))
+        grid_y.append(dens["density"].to_numpy())
+        max_density[i] = grid_y[-1].max()
+
+    sizes = np.diff(bounds)
+    group_idx = np.repeat(np.arange(ngroups), sizes)
+    rows = np.isin(group_idx, groups)
+    gidx = group_idx[rows]
+    density[rows] = np.interp(
+        _offset(y[rows], ymin[gidx], ymax[gidx], gidx),
+        np.hstack(grid_x),
+        np.hstack(grid_y),
+    )
+    return density, max_density
+
+
+def _offset(y, ymin, ymax, i):
+    """
+    Map values in the range [ymin, ymax] onto [2*i, 2*i+1]
+    """
+    return (y - ymin) / (ymax - ymin) + 2 * i
+
+
+def count_within_groups(
+    y: FloatArray,
+    group_idx: IntArray,
+    ngroups: int,
+    scales: pos_scales,
+    params: dict[str, Any],
+) -> IntArray:
+    """
+    Count the values that are in the same bin as each value
+
+    All the groups are binned with the same breaks, and counted with
+    one bincount over the (group, bin) pairs.
+    """
+    expanded_y_range = nextafter_range(scales.y.dimension())
+    if params["binwidth"] is not None:
+        bins = breaks_from_binwidth(expanded_y_range, params["binwidth"])
+    else:
+        bins = breaks_from_bins(expanded_y_range, params["bins"])
+
+    nbins = len(bins)
+    bin_idx = bin_index(y, bins)
+    inside = bin_idx >= 0
+    key = np.where(inside, group_idx * nbins + bin_idx, 0)
+    counts = np.bincount(key[inside], minlength=ngroups * nbins)
+    return np.where(inside, counts[key], 0)
@@ -3,9 +3,11 @@ import warnings
 import numpy as np
 import pandas as pd
 
+from .._utils.cache import SMOOTH_CACHE
 from ..doctools import document
-from ..exceptions import PlotnineWarning
-from .smoothers import predictdf
+from ..exceptions import PlotnineError, PlotnineWarning
+from ..options import get_option
+from .smoothers import predictdf, predictdf_key, reduce_points
 from .stat import stat
 
 
@@ -103,6 +105,24 @@ class stat_smooth(stat):
         `(0, 1)` range.
     method_args : dict, default={}
         Additional arguments passed on to the modelling method.
+    large_n : Literal["bin", "sample"], default=None
+        How to smooth a group with more than `max_n` points with the
+        *loess* and *gpr* methods. They take too long with many
+        points, so the points are reduced to at most `max_n` weighted
+        points and the model is fit to those.
+        With `"bin"`{.py}, the range of `x` is split into `max_n`
+        bins and the points in a bin are replaced by their (weighted)
+        mean. With `"sample"`{.py}, the points are split into `max_n`
+        strata of points next to each other and one point from each
+        stratum is chosen at random. The weight of a point is the
+        total weight of the points it replaces.
+        The smooth of the binned means is closer to that of all the
+        points, but its confidence band is narrower. With a sample
+        the confidence band is about as wide.
+        If `None`{.py}, the model is fit to all the points.
+    max_n : int, default=1000
+        Maximum number of points to fit the *loess* and *gpr* models
+        to, if `large_n` is not `None`{.py}.
 
     See Also
     --------
@@ -151,6 +171,8 @@ class stat_smooth(stat):
         "level": 0.95,
         "span": 0.75,
         "method_args": {},
+        "large_n": None,
+        "max_n": 1000,
     }
     CREATES = {"se", "ymin", "ymax"}
     DROPPED_AES = ["weight"]
@@ -193,6 +215,17 @@ class stat_smooth(stat):
             )
             params["method_args"]["window"] = window
 
+        if params["large_n"] not in (None, "bin", "sample"):
+            raise PlotnineError(
+                "large_n should be one of None, 'bin' or 'sample'. "
+                f"Got {params['large_n']!r}."
+            )
+
+        if params["large_n"] is not None and params["max_n"] < 2:
+            raise PlotnineError(
+                f"max_n should be at least 2. Got {params['max_n']!r}."
+            )
+
         if params["formula"]:
             allowed = {"lm", "ols", "wls", "glm", "rlm", "gls"}
             if params["method"] not in allowed:
@@ -231,4 +264,24 @@ class stat_smooth(stat):
                 rangee = [data["x"].min(), data["x"].max()]
             xseq = np.linspace(rangee[0], rangee[1], n)
 
-        return predictdf(data, xseq, self.params)
+        if (
+            self.params["large_n"] is not None
+            and self.params["method"] in ("loess", "gpr")
+            and len(data) > self.params["max_n"]
+        ):
+            data = reduce_points(
+                data, self.params["large_n"], self.params["max_n"]
+            )
+
+        if not get_option("smooth_cache"):
+            return predictdf(data, xseq, self.params)
+
+        SMOOTH_CACHE.maxbytes = int(get_option("smooth_cache") * 2**20)
+        key = predictdf_key(data, xseq, self.params)
+        if key is not None and (cached := SMOOTH_CACHE.get(key)) is not None:
+            return cached.copy()
+
+        new_data = predictdf(data, xseq, self.params)
+        if key is not None:
+            SMOOTH_CACHE.put(key, new_data.copy())
+        return new_data
@@ -1,13 +1,15 @@
-from typing import cast
-
 import numpy as np
 import pandas as pd
 
-from .._utils import get_valid_kwargs, uniquecols
+from .._utils import get_valid_kwargs, group_bounds, group_uniquecols
 from ..doctools import document
 from ..exceptions import PlotnineError
 from .stat import stat
 
+# The most values that are resampled at a time when bootstrapping.
+# It bounds the memory used, for any size of data & number of samples.
+BOOTSTRAP_CHUNK_SIZE = 2**22
+
 
 def bootstrap_statistics(
     series,
@@ -23,15 +25,27 @@ def bootstrap_statistics(
     if random_state is None:
         random_state = np.random
 
+    if isinstance(random_state, np.random.Generator):
+        draw = random_state.integers
+    else:
+        draw = random_state.randint
+
+    # The samples are drawn in chunks, the statistics of one chunk
+    # are computed before the next chunk is drawn
     alpha = 1 - confidence_interval
-    size = (n_samples, len(series))
-    inds = random_state.randint(0, len(series), size=size)
-    samples = series.to_numpy()[inds]
-    means = np.sort(statistic(samples, axis=1))
+    values = series.to_numpy()
+    n = len(values)
+    chunk = max(BOOTSTRAP_CHUNK_SIZE // max(n, 1), 1)
+    stats = np.empty(n_samples)
+    for i in range(0, n_samples, chunk):
+        size = (min(chunk, n_samples - i), n)
+        stats[i : i + size[0]] = statistic(values[draw(0, n, size)], axis=1)
+
+    stats.sort()
     return pd.DataFrame(
         {
-            "ymin": means[int((alpha / 2) * n_samples)],
-            "ymax": means[int((1 - alpha / 2) * n_samples)],
+            "ymin": stats[int((alpha / 2) * n_samples)],
+            "ymax": stats[int((1 - alpha / 2) * n_samples)],
             "y": [statistic(series)],
         }
     )
@@ -51,10 +65,14 @@ def mean_cl_boot(
         Number of sample to draw.
     confidence_interval : float
         Confidence interval in the range (0, 1).
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator | \
+~numpy.random.RandomState, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
     """
+    if isinstance(random_state, int):
+        random_state = np.random.RandomState(random_state)
+
     return bootstrap_statistics(
         series,
         np.mean,
@@ -64,6 +82,88 @@ def mean_cl_boot(
     )
 
 
+def mean_cl_boot_groups(
+    y, bounds, n_samples=1000, confidence_interval=0.95, random_state=None
+):
+    """
+    Bootstrapped means with confidence intervals of many groups
+
+    With a [](`~numpy.random.Generator`) (or `None`), the samples of
+    all the groups are drawn together. Otherwise the groups are sampled
+    in turn with [](`~plotnine.stats.stat_summary.mean_cl_boot`), so
+    that a seed or a [](`~numpy.random.RandomState`) gives the same
+    intervals as it always has.
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Values of all the groups. The values of a group are
+        contiguous.
+    bounds : numpy.ndarray
+        Where each group starts, and where the last one ends.
+    n_samples : int, default=1000
+        Number of sample to draw.
+    confidence_interval : float
+        Confidence interval in the range (0, 1).
+    random_state : int | ~numpy.random.Generator | \
+~numpy.random.RandomState, default=None
+        Seed or Random number generator to use. If `None`, then
+        a generator seeded from the numpy global generator
+        [](`numpy.random`) is used.
+
+    Returns
+    -------
+    out : pandas.DataFrame
+        A row with `ymin`, `ymax` and `y` for each group.
+    """
+    if random_state is None:
+        # Seeded from the global generator, so that np.random.seed
+        # still makes the samples reproducible
+        seed = np.random.randint(2**31)  # noqa: NPY002
+        random_state = np.random.default_rng(seed)
+    elif isinstance(random_state, int):
+        random_state = np.random.RandomState(random_state)
+
+    if not isinstance(random_state, np.random.Generator):
+        summaries = [
+            mean_cl_boot(
+                pd.Series(y[i:j]), n_samples, confidence_interval, random_state
+            )
+            for i, j in zip(bounds[:-1], bounds[1:])
+        ]
+        return pd.concat(summaries, axis=0, ignore_index=True)
+
+    y = np.asarray(y, dtype=float)
+    starts = bounds[:-1]
+    sizes = np.diff(bounds)
+    if not len(sizes):
+        return pd.DataFrame({"ymin": [], "ymax": [], "y": []})
+
+    # Each value is replaced by one from its group, and the sums of
+    # the groups in a sample come from a single reduceat. A sample
+    # of all the groups has len(y) values, a chunk has many samples.
+    row_starts = np.repeat(starts, sizes)
+    row_sizes = np.repeat(sizes, sizes)
+    chunk = max(BOOTSTRAP_CHUNK_SIZE // len(y), 1)
+    means = np.empty((n_samples, len(sizes)))
+    for i in range(0, n_samples, chunk):
+        size = (min(chunk, n_samples - i), len(y))
+        offsets = (random_state.random(size) * row_sizes).astype(np.intp)
+        samples = y[row_starts + offsets]
+        means[i : i + size[0]] = np.add.reduceat(samples, starts, axis=1)
+    means /= sizes
+
+    means.sort(axis=0)
+    alpha = 1 - confidence_interval
+    return pd.DataFrame(
+        {
+            "ymin": means[int((alpha / 2) * n_samples)],
+            "ymax": means[int((1 - alpha / 2) * n_samples)],
+            "y": np.add.reduceat(y, starts) / sizes,
+        }
+    )
+
+
 def mean_cl_normal(series, confidence_interval=0.95):
     """
     Mean with confidence interval assuming normal distribution
@@ -86,6 +186,31 @@ def mean_cl_normal(series, confidence_interval=0.95):
     return pd.DataFrame({"y": [m], "ymin": m - h, "ymax": m + h})
 
 
+def mean_cl_normal_groups(y, bounds, confidence_interval=0.95):
+    """
+    Means with confidence intervals of many groups, assuming normality
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Values of all the groups. The values of a group are
+        contiguous.
+    bounds : numpy.ndarray
+        Where each group starts, and where the last one ends.
+    confidence_interval : float
+        Confidence interval in the range (0, 1).
+    """
+    import scipy.stats as stats
+
+    agg = _groupby(y, bounds).agg(["mean", "sem", "size"])
+    m = agg["mean"].to_numpy()
+    n = agg["size"].to_numpy()
+    h = agg["sem"].to_numpy() * stats.t.ppf(
+        (1 + confidence_interval) / 2, n - 1
+    )
+    return pd.DataFrame({"y": m, "ymin": m - h, "ymax": m + h})
+
+
 def mean_sdl(series, mult=2):
     """
     Mean +/- a constant times the standard deviation
@@ -102,6 +227,26 @@ def mean_sdl(series, mult=2):
     return pd.DataFrame({"y": [m], "ymin": m - mult * s, "ymax": m + mult * s})
 
 
+def mean_sdl_groups(y, bounds, mult=2):
+    """
+    Means +/- a constant times the standard deviations of many groups
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Values of all the groups. The values of a group are
+        contiguous.
+    bounds : numpy.ndarray
+        Where each group starts, and where the last one ends.
+    mult : float
+        Multiplication factor.
+    """
+    agg = _groupby(y, bounds).agg(["mean", "std"])
+    m = agg["mean"].to_numpy()
+    s = agg["std"].to_numpy()
+    return pd.DataFrame({"y": m, "ymin": m - mult * s, "ymax": m + mult * s})
+
+
 def median_hilow(series, confidence_interval=0.95):
     """
     Median and a selected pair of outer quantiles having equal tail areas
@@ -123,6 +268,26 @@ def median_hilow(series, confidence_interval=0.95):
     )
 
 
+def median_hilow_groups(y, bounds, confidence_interval=0.95):
+    """
+    Medians and pairs of outer quantiles of many groups
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Values of all the groups. The values of a group are
+        contiguous.
+    bounds : numpy.ndarray
+        Where each group starts, and where the last one ends.
+    confidence_interval : float
+        Confidence interval in the range (0, 1).
+    """
+    tail = (1 - confidence_interval) / 2
+    quantiles = _groupby(y, bounds).quantile([0.5, tail, 1 - tail])
+    q = quantiles.to_numpy().reshape(-1, 3)
+    return pd.DataFrame({"y": q[:, 0], "ymin": q[:, 1], "ymax": q[:, 2]})
+
+
 def mean_se(series, mult=1):
     """
     Calculate mean and standard errors on either side
@@ -139,6 +304,36 @@ def mean_se(series, mult=1):
     return pd.DataFrame({"y": [m], "ymin": m - se, "ymax": m + se})
 
 
+def mean_se_groups(y, bounds, mult=1):
+    """
+    Means and standard errors on either side of many groups
+
+    Parameters
+    ----------
+    y : numpy.ndarray
+        Values of all the groups. The values of a group are
+        contiguous.
+    bounds : numpy.ndarray
+        Where each group starts, and where the last one ends.
+    mult : float
+        Multiplication factor.
+    """
+    grouped = _groupby(y, bounds)
+    m = grouped.mean().to_numpy()
+    var = grouped.var(ddof=0).to_numpy()
+    n = grouped.size().to_numpy()
+    se = mult * np.sqrt(var / n)
+    return pd.DataFrame({"y": m, "ymin": m - se, "ymax": m + se})
+
+
+def _groupby(y, bounds):
+    """
+    Group contiguous values
+    """
+    ids = np.repeat(np.arange(len(bounds) - 1), np.diff(bounds))
+    return pd.Series(y).groupby(ids, sort=False)
+
+
 function_dict = {
     "mean_cl_boot": mean_cl_boot,
     "mean_cl_normal": mean_cl_normal,
@@ -147,6 +342,16 @@ function_dict = {
     "mean_se": mean_se,
 }
 
+# Functions that summarise all the groups at once. They take the
+# values of all the groups and the bounds of the groups.
+groups_function_dict = {
+    "mean_cl_boot": mean_cl_boot_groups,
+    "mean_cl_normal": mean_cl_normal_groups,
+    "mean_sdl": mean_sdl_groups,
+    "median_hilow": median_hilow_groups,
+    "mean_se": mean_se_groups,
+}
+
 
 def make_summary_fun(fun_data, fun_y, fun_ymin, fun_ymax, fun_args):
     """
@@ -238,9 +443,13 @@ class stat_summary(stat):
         arguments will be assigned to the right functions. If there is
         a conflict, create a wrapper function that resolves the
         ambiguity in the argument names.
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator | \
+~numpy.random.RandomState, default=None
         Seed or Random number generator to use. If `None`, then
-        numpy global generator [](`numpy.random`) is used.
+        numpy global generator [](`numpy.random`) is used. A seed
+        creates a [](`~numpy.random.RandomState`). Unless it is a
+        [](`~numpy.random.RandomState`), `"mean_cl_boot"`{.py}
+        resamples all the groups at once.
 
     Notes
     -----
@@ -300,28 +509,44 @@ class stat_summary(stat):
             self.params["fun_args"]["random_state"] = random_state
 
     def compute_panel(self, data, scales):
-        func = make_summary_fun(
-            self.params["fun_data"],
-            self.params["fun_y"],
-            self.params["fun_ymin"],
-            self.params["fun_ymax"],
-            self.params["fun_args"],
-        )
-
-        # break a dataframe into pieces, summarise each piece,
-        # and join the pieces back together, retaining original
-        # columns unaffected by the summary.
-        summaries = []
-        for (group, x), df in data.groupby(["group", "x"]):
-            summary = func(df)
-            summary["x"] = x  # pyright: ignore[reportCallIssue,reportArgumentType]
-            summary["group"] = cast("int", group)
-            summary["n"] = len(df)
-            unique = uniquecols(df)
-            if "y" in unique:
-                unique = unique.drop("y", axis=1)
-            merged = summary.merge(unique, on=["group", "x"])
-            summaries.append(merged)
-
-        new_data = pd.concat(summaries, axis=0, ignore_index=True)
-        return new_data
+        params = self.params
+
+        # Summarise each piece (the y values at an x position of
+        # a group), and join the pieces back together, retaining
+        # the original columns that are constant within the piece.
+        data = data.sort_values(["group", "x"], kind="mergesort")
+        data = data.reset_index(drop=True)
+        bounds = group_bounds(data["group"], data["x"])
+
+        fun_data = params["fun_data"]
+        if (
+            isinstance(fun_data, str)
+            and fun_data in groups_function_dict
+            and not any(params[k] for k in ("fun_y", "fun_ymin", "fun_ymax"))
+        ):
+            # The summary of each piece is a single row
+            func = groups_function_dict[fun_data]
+            kwargs = get_valid_kwargs(func, params["fun_args"])
+            new_data = func(data["y"].to_numpy(), bounds, **kwargs)
+            idx = np.arange(len(new_data))
+        else:
+            func = make_summary_fun(
+                fun_data,
+                params["fun_y"],
+                params["fun_ymin"],
+                params["fun_ymax"],
+                params["fun_args"],
+            )
+            ydata = data[["y"]]
+            summaries = [
+                func(ydata.iloc[i:j]) for i, j in zip(bounds[:-1], bounds[1:])
+            ]
+            repeats = [len(summary) for summary in summaries]
+            idx = np.repeat(np.arange(len(summaries)), repeats)
+            new_data = pd.concat(summaries, axis=0, ignore_index=True)
+
+        unique = group_uniquecols(data.drop("y", axis=1), bounds)
+        unique["n"] = np.diff(bounds)
+        missing = unique.columns.difference(new_data.columns)
+        u = unique.loc[idx, missing].reset_index(drop=True)
+        return pd.concat([new_data, u], axis=1)
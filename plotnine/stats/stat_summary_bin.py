@@ -7,7 +7,7 @@ from .._utils import groupby_apply
 from ..doctools import document
 from ..exceptions import PlotnineWarning
 from ..scales.scale_discrete import scale_discrete
-from .binning import fuzzybreaks
+from .binning import bin_index, fuzzybreaks
 from .stat import stat
 from .stat_summary import make_summary_fun
 
@@ -56,7 +56,8 @@ class stat_summary_bin(stat):
         arguments will be assigned to the right functions. If there is
         a conflict, create a wrapper function that resolves the
         ambiguity in the argument names.
-    random_state : int | ~numpy.random.RandomState, default=None
+    random_state : int | ~numpy.random.Generator | \
+~numpy.random.RandomState, default=None
         Seed or Random number generator to use. If `None`, then
         numpy global generator [](`numpy.random`) is used.
 
@@ -142,12 +143,8 @@ class stat_summary_bin(stat):
 
         breaks = fuzzybreaks(scales.x, breaks, boundary, binwidth, bins)
         bins = len(breaks) - 1
-        data["bin"] = pd.cut(
-            data["x"],
-            bins=breaks,  # pyright: ignore
-            labels=False,
-            include_lowest=True,
-        )
+        data["bin"] = bin_index(data["x"], breaks)
+        data = data[data["bin"] >= 0]
 
         def func_wrapper(data: pd.DataFrame) -> pd.DataFrame:
             """
@@ -1,8 +1,16 @@
 import numpy as np
+import pandas as pd
+import pytest
 
+from plotnine import aes, geom_bin_2d, geom_histogram, ggplot
+from plotnine.exceptions import PlotnineError
 from plotnine.scales import scale_x_continuous, scale_x_discrete
 from plotnine.stats.binning import (
     _adjust_breaks,
+    bin_chunks,
+    bin_chunks_2d,
+    bin_count_2d,
+    bin_index,
     breaks_from_bins,
     breaks_from_binwidth,
     fuzzybreaks,
@@ -129,3 +137,98 @@ def test_adjust_breaks_right_False():
     a = np.linspace(-2, -1, 11)
     b = _adjust_breaks(a, right=False)
     _test(a, b)
+
+
+@pytest.mark.parametrize(
+    "closed, include_lowest",
+    [("right", True), ("right", False), ("left", True)],
+)
+def test_bin_index(closed, include_lowest):
+    breaks = np.array([0, 1, 2, 3])
+    x = np.array([-1, 0, 0.5, 1, 1.5, 2, 3, 4, np.nan])
+    result = bin_index(x, breaks, closed, include_lowest)
+    expected = pd.cut(
+        x,
+        breaks,  # pyright: ignore[reportArgumentType]
+        right=closed == "right",
+        include_lowest=include_lowest,
+        labels=False,
+    )
+    expected = np.nan_to_num(expected, nan=-1).astype(int)
+    assert result.tolist() == expected.tolist()
+
+
+def test_bin_count_2d():
+    x = [0.5, 0.5, 1.5, 2.5, 5]
+    y = [0.5, 0.5, 0.5, 1.5, 1]
+    weight = [1, 2, 3, np.nan, 1]
+    count, n = bin_count_2d(x, y, [0, 1, 2, 3], [0, 1, 2], weight)
+    assert count.tolist() == [[3, 3, 0], [0, 0, 0]]
+    assert n.tolist() == [[2, 1, 0], [0, 0, 1]]
+
+
+def _chunked_data():
+    rng = np.random.default_rng(123)
+    n = 1000
+    data = pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.uniform(-3, 5, size=n),
+            "w": rng.integers(1, 4, size=n).astype(float),
+        }
+    )
+    chunks = [data.iloc[i : i + 300] for i in range(0, n, 300)]
+    return data, chunks
+
+
+@pytest.mark.parametrize(
+    "params",
+    [
+        {"bins": 10},
+        {"binwidth": 0.3, "closed": "left", "pad": True},
+        {"breaks": [-4, -1, 0, 0.5, 4]},
+    ],
+)
+def test_bin_chunks(params):
+    data, chunks = _chunked_data()
+    p = ggplot(data, aes("x", weight="w")) + geom_histogram(**params)
+    expected = p.layer_data()
+    result = bin_chunks(lambda: iter(chunks), "x", "w", **params)
+    for col in ("xmin", "xmax", "count", "density"):
+        np.testing.assert_allclose(result[col], expected[col])
+
+    # One pass when the range is known
+    limits = data["x"].min(), data["x"].max()
+    result = bin_chunks(iter(chunks), "x", "w", limits=limits, **params)
+    np.testing.assert_allclose(result["count"], expected["count"])
+
+    # An iterator cannot be read twice
+    if "breaks" not in params:
+        with pytest.raises(PlotnineError):
+            bin_chunks(iter(chunks), "x", **params)
+
+
+@pytest.mark.parametrize(
+    "params",
+    [{}, {"bins": (8, 12), "drop": False}, {"binwidth": 0.5}],
+)
+def test_bin_chunks_2d(params):
+    data, chunks = _chunked_data()
+    p = ggplot(data, aes("x", "y", weight="w")) + geom_bin_2d(**params)
+    expected = p.layer_data()
+    result = bin_chunks_2d(chunks, "x", "y", "w", **params)
+    assert len(result) == len(expected)
+    for col in ("xmin", "xmax", "ymin", "ymax", "count", "density"):
+        np.testing.assert_allclose(result[col], expected[col])
+
+
+def test_bin_chunks_arrow_and_polars():
+    pa = pytest.importorskip("pyarrow")
+    pl = pytest.importorskip("polars")
+    data, chunks = _chunked_data()
+    expected = bin_chunks(chunks, "x", "w", bins=10)
+    batches = [pa.RecordBatch.from_pandas(c) for c in chunks]
+    frames = [pl.from_pandas(c) for c in chunks]
+    for _chunks in (batches, frames):
+        result = bin_chunks(_chunks, "x", "w", bins=10)
+        np.testing.assert_allclose(result["count"], expected["count"])
@@ -115,6 +115,42 @@ def test_munch_interpolates_every_position_aesthetic():
         assert np.all(np.diff(values) > 0), f"{column} was not interpolated"
 
 
+def test_munch_matches_linspace():
+    data = pd.DataFrame(
+        {
+            "x": [0, 1, 3, 10, 11],
+            "y": [0.0, 2.0, 2.0, -1.0, 5.0],
+            "color": ["a", "b", "c", "d", "e"],
+            "group": [1, 1, 1, 2, 2],
+        }
+    )
+    dist = np.array([0.05, 0.021, np.nan, 0.001])
+    munched = munch_data(data, dist)
+
+    extra = [5, 2, 1, 1]
+    for col in ("x", "y"):
+        values = data[col].to_numpy()
+        expected = np.hstack(
+            [
+                *[
+                    np.linspace(a, b, n, endpoint=False)
+                    for a, b, n in zip(values[:-1], values[1:], extra)
+                ],
+                values[-1:],
+            ]
+        )
+        np.testing.assert_array_equal(munched[col], expected)
+
+    expected_color = np.repeat(data["color"], [*extra, 1])
+    np.testing.assert_array_equal(munched["color"], expected_color)
+
+    # With a limit, the segments are subdivided more coarsely
+    limited = munch_data(data, dist, max_points=20)
+    assert len(limited) <= 20
+    assert limited["x"].is_monotonic_increasing
+    np.testing.assert_array_equal(limited["x"].iloc[[0, -1]], [0, 11])
+
+
 def test_coord_trans_ribbon_edges_curve():
     # A smooth transformed ribbon exposes piecewise-constant `ymin` and
     # `ymax` values as stepped edges.
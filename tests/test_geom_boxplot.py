@@ -104,3 +104,24 @@ def test_weight():
     )
     p = ggplot(data, aes(x="x", y="y", weight="weight")) + geom_boxplot()
     assert p == "weight"
+
+
+def test_collections_per_panel():
+    from matplotlib.collections import (
+        LineCollection,
+        PathCollection,
+        PolyCollection,
+    )
+
+    # All the boxes of a panel are drawn with one collection for
+    # the outliers, one for the boxes and one for the lines
+    p = ggplot(data, aes("x", "y", linetype="x")) + geom_boxplot()
+    ax = p.draw().axes[0]
+    boxes, lines = ax.collections[-2:]
+    assert len(ax.collections) == 3
+    assert isinstance(ax.collections[0], PathCollection)
+    assert isinstance(boxes, PolyCollection)
+    assert isinstance(lines, LineCollection)
+    assert len(boxes.get_paths()) == n
+    assert len(lines.get_segments()) == 3 * n
+    assert len(set(map(str, boxes.get_linestyle()))) == n
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 
 from plotnine import (
@@ -43,3 +44,16 @@ def test_points():
 def test_polygon():
     p = p0 + stat_density_2d(aes(fill=after_stat("level")), geom="polygon")
     assert p == "polygon"
+
+
+def test_fft_package():
+    rng = np.random.default_rng(123)
+    data = pd.DataFrame({"x": rng.normal(size=500), "y": rng.normal(size=500)})
+    p = ggplot(data, aes("x", "y"))
+
+    def density(package):
+        p2 = p + stat_density_2d(contour=False, package=package, n=32)
+        return p2.layer_data()["density"].to_numpy()
+
+    fft, scipy = density("fft"), density("scipy")
+    np.testing.assert_allclose(fft, scipy, atol=0.01 * scipy.max())
@@ -1,3 +1,5 @@
+from io import BytesIO
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -141,3 +143,85 @@ def test_groups_less_that_two_points():
         aes(x="A", y="C", group="B", color="D"), size=2
     )
     p.draw_test()
+
+
+def test_aggregate():
+    data = pd.DataFrame(
+        {"x": [0, 1, 0, 1], "y": [0, 1, 1, 0], "g": [1, 1, 2, 2]}
+    )
+    p = ggplot(data, aes("x", "y", group="g")) + geom_line(
+        aggregate=True, color="red"
+    )
+    fig = p.draw()
+    ax = fig.axes[0]
+    assert len(ax.lines) == 0
+    assert len(ax.collections) == 0
+
+    # Two diagonal lines, one pixel wide
+    fig.savefig(BytesIO(), format="png")
+    image = ax.images[0].get_array()
+    filled = image[:, :, 3] > 0
+    assert 0 < filled.sum() <= 2 * max(image.shape[:2]) + 2
+    assert np.allclose(image[filled, :3], [1, 0, 0])
+
+
+def test_step_aggregate():
+    def image(p):
+        fig = p.draw()
+        fig.savefig(BytesIO(), format="png")
+        (im,) = fig.axes[0].images
+        return im.get_array()
+
+    data = pd.DataFrame(
+        {
+            "x": [0, 1, 2, 0, 1, 2],
+            "y": [0, 2, 1, 3, 4, 3],
+            "g": [1] * 3 + [2] * 3,
+        }
+    )
+    # The steps drawn by hand, direction="hv"
+    steps = pd.DataFrame(
+        {
+            "x": [0, 1, 1, 2, 2, 0, 1, 1, 2, 2],
+            "y": [0, 0, 2, 2, 1, 3, 3, 4, 4, 3],
+            "g": [1] * 5 + [2] * 5,
+        }
+    )
+    mapping = aes("x", "y", group="g")
+    step_image = image(ggplot(data, mapping) + geom_step(aggregate=True))
+    path_image = image(ggplot(steps, mapping) + geom_path(aggregate=True))
+    line_image = image(ggplot(data, mapping) + geom_line(aggregate=True))
+    assert np.array_equal(step_image, path_image)
+    assert not np.array_equal(step_image, line_image)
+
+
+def test_segments():
+    from matplotlib.collections import LineCollection
+    from matplotlib.colors import to_rgba_array
+
+    # Two interleaved paths with a color gradient, and a path with
+    # a single point that is not drawn
+    data = pd.DataFrame(
+        {
+            "x": [0, 10, 1, 11, 2, 12, 20],
+            "y": [0, 1, 2, 3, 4, 5, 6],
+            "g": ["a", "b", "a", "b", "a", "b", "c"],
+            "c": np.arange(7),
+        }
+    )
+    p = ggplot(data, aes("x", "y", group="g", color="c")) + geom_path()
+    ax = p.draw().axes[0]
+    (coll,) = [c for c in ax.collections if isinstance(c, LineCollection)]
+    segments = np.array(coll.get_segments())
+
+    expected = [[0, 2], [2, 4], [1, 3], [3, 5]]
+    xy = data[["x", "y"]].to_numpy()
+    assert segments.shape == (4, 2, 2)
+    for seg, (i, j) in zip(segments, expected):
+        np.testing.assert_allclose(seg, xy[[i, j]])
+
+    # A segment has the color of its start
+    start_colors = p.layer_data()["color"].iloc[[0, 2, 1, 3]]
+    np.testing.assert_allclose(
+        coll.get_edgecolor(), to_rgba_array(list(start_colors))
+    )
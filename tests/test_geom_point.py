@@ -1,4 +1,5 @@
 import string
+from io import BytesIO
 
 import numpy as np
 import pandas as pd
@@ -145,3 +146,41 @@ def test_custom_shapes():
         + coord_equal()
     )
     assert p == "custom_shapes"
+
+
+def test_aggregate():
+    n = 100
+    data = pd.DataFrame({"x": np.arange(n) % 10, "y": np.arange(n) % 5})
+    p = ggplot(data, aes("x", "y")) + geom_point(aggregate=True, alpha=0.2)
+    fig = p.draw()
+    ax = fig.axes[0]
+    assert len(ax.collections) == 0
+    assert len(ax.images) == 1
+
+    # The image is made when the figure is drawn
+    fig.savefig(BytesIO(), format="png")
+    image = ax.images[0].get_array()
+    height, width = np.ceil(ax.bbox.height), np.ceil(ax.bbox.width)
+    assert image.shape[:2] == (height, width)
+
+    # 10 locations, each with 10 points stacked on top of each other
+    alpha = image[:, :, 3]
+    assert (alpha > 0).sum() == 10
+    assert np.allclose(alpha[alpha > 0], 1 - 0.8**10)
+
+
+def test_aggregate_vector_backends():
+    data = pd.DataFrame({"x": np.arange(10), "y": np.arange(10)})
+    dpi = 150
+    for fmt in ("pdf", "svg"):
+        p = ggplot(data, aes("x", "y")) + geom_point(aggregate=True)
+        fig = p.draw()
+        ax = fig.axes[0]
+        fig.savefig(BytesIO(), format=fmt, dpi=dpi)
+
+        # The vector backends measure the axes at 72 dpi, the image
+        # has the resolution at which the figure is saved
+        image = ax.images[0].get_array()
+        height = np.ceil(ax.bbox.height * dpi / 72)
+        width = np.ceil(ax.bbox.width * dpi / 72)
+        assert image.shape[:2] == (height, width)
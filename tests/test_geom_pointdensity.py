@@ -33,3 +33,31 @@ def test_points():
     )
 
     assert p == "points"
+
+
+def test_fft_package():
+    rng = np.random.default_rng(123)
+    data = pd.DataFrame({"x": rng.normal(size=500), "y": rng.normal(size=500)})
+    p = ggplot(data, aes("x", "y"))
+
+    def density(package):
+        p2 = p + geom_pointdensity(package=package)
+        return p2.layer_data()["density"].to_numpy()
+
+    fft, scipy = density("fft"), density("scipy")
+    np.testing.assert_allclose(fft, scipy, atol=0.01 * scipy.max())
+
+
+def test_count_package():
+    rng = np.random.default_rng(123)
+    data = pd.DataFrame({"x": rng.normal(size=300), "y": rng.normal(size=300)})
+    xy = data[["x", "y"]].to_numpy()
+    radius = 0.5
+    p = ggplot(data, aes("x", "y")) + geom_pointdensity(
+        package="count", kde_params={"radius": radius}
+    )
+    result = p.layer_data()["density"]
+
+    distances = np.linalg.norm(xy[:, None, :] - xy[None, :, :], axis=2)
+    expected = (distances < radius).sum(axis=1) / len(xy)
+    np.testing.assert_allclose(result, expected)
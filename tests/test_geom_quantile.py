@@ -33,3 +33,26 @@ def test_lines():
     # through middle (approximately).
     assert p == "lines"
     assert p2 == "lines"
+
+
+def test_groups_and_workers():
+    import statsmodels.formula.api as smf
+
+    quantiles = (0.1, 0.5, 0.9)
+    data2 = data.assign(g=np.tile(["a", "b"], n // 2))
+    p = ggplot(data2, aes("x", "y", color="g")) + geom_quantile(
+        quantiles=quantiles
+    )
+    p2 = ggplot(data2, aes("x", "y", color="g")) + geom_quantile(
+        quantiles=quantiles, workers=2
+    )
+    result = p.layer_data()
+    pd.testing.assert_frame_equal(result, p2.layer_data())
+
+    for i, (_, df) in enumerate(data2.groupby("g"), start=1):
+        xrange = pd.DataFrame({"x": [df["x"].min(), df["x"].max()]})
+        for q in quantiles:
+            expected = smf.quantreg("y ~ x", df).fit(q=q).predict(xrange)
+            line = result[result["group"] == f"{i}-{q}"]
+            np.testing.assert_allclose(line["y"], expected)
+            np.testing.assert_allclose(line["x"], xrange["x"])
@@ -1,5 +1,6 @@
 import numpy as np
 import pandas as pd
+import pytest
 
 from plotnine import (
     aes,
@@ -10,6 +11,7 @@ from plotnine import (
     ggplot,
     labs,
 )
+from plotnine.exceptions import PlotnineWarning
 
 n = 4
 
@@ -165,3 +167,95 @@ def test_coord_trans_groups():
         + coord_trans()
     )
     assert p == "coord-trans-groups"
+
+
+def test_coord_trans_one_collection():
+    from matplotlib.collections import PolyCollection
+
+    data = pd.DataFrame(
+        {
+            "x": np.tile(np.arange(1, 11), 10),
+            "y": np.repeat(np.arange(1, 11), 10),
+            "z": np.arange(100),
+        }
+    )
+    p = (
+        ggplot(data, aes("x", "y", fill="z"))
+        + geom_tile()
+        + coord_trans(x="log10", y="log10")
+    )
+    ax = p.draw().axes[0]
+    (coll,) = ax.collections
+    assert isinstance(coll, PolyCollection)
+
+    # Each tile is a closed polygon, with none of its vertices
+    # running off towards the next tile
+    paths = coll.get_paths()
+    assert len(paths) == 100
+    assert len(np.unique(coll.get_facecolor(), axis=0)) == 100
+    ld = p.layer_data()
+    for path, (_, row) in zip(paths, ld.iterrows()):
+        x, y = path.vertices.T
+        assert np.isclose(x.min(), np.log10(row["xmin"]))
+        assert np.isclose(x.max(), np.log10(row["xmax"]))
+        assert np.isclose(y.min(), np.log10(row["ymin"]))
+        assert np.isclose(y.max(), np.log10(row["ymax"]))
+
+
+def test_tile_image():
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba_array
+    from matplotlib.image import AxesImage
+
+    def artists(p):
+        ax = p.draw().axes[0]
+        return [
+            c
+            for c in ax.get_children()
+            if isinstance(c, (AxesImage, PolyCollection))
+        ]
+
+    # Large borderless grids are drawn as an image
+    n = 100
+    data = pd.DataFrame(
+        {
+            "x": np.tile(np.arange(n), n),
+            "y": np.repeat(np.arange(n), n),
+            "z": np.arange(n * n),
+        }
+    )
+    p = ggplot(data, aes("x", "y", fill="z"))
+    (im,) = artists(p + geom_tile())
+    assert isinstance(im, AxesImage)
+    assert np.allclose(im.get_extent(), [-0.5, n - 0.5, -0.5, n - 0.5])
+
+    # One pixel per tile, with the fill of the tile
+    ld = p.layer_data()
+    fills = to_rgba_array(ld["fill"])
+    X = im.get_array()
+    assert X.shape == (n, n, 4)
+    assert np.allclose(X[ld["y"], ld["x"]], fills)
+
+    (coll,) = artists(p + geom_tile(image=False))
+    assert isinstance(coll, PolyCollection)
+
+    (coll,) = artists(p + geom_tile(color="white"))
+    assert isinstance(coll, PolyCollection)
+
+    # Small grids on request, with missing cells left transparent
+    small = data.iloc[[0, 1, 2, 3, n, n + 1, n + 2]]
+    p = ggplot(small, aes("x", "y", fill="z"))
+    (im,) = artists(p + geom_tile(image=True))
+    assert isinstance(im, AxesImage)
+    X = im.get_array()
+    assert X.shape == (2, 4, 4)
+    assert X[1, 3, 3] == 0
+
+    (coll,) = artists(p + geom_tile())
+    assert isinstance(coll, PolyCollection)
+
+    # Irregular tiles fall back to rectangles
+    p = ggplot(small, aes("x", "y", fill="z", width="z+1"))
+    with pytest.warns(PlotnineWarning, match="as an image"):
+        (coll,) = artists(p + geom_tile(image=True))
+    assert isinstance(coll, PolyCollection)
@@ -1,7 +1,14 @@
 import numpy as np
 import pandas as pd
 
-from plotnine import aes, coord_flip, geom_sina, geom_violin, ggplot
+from plotnine import (
+    aes,
+    coord_flip,
+    geom_sina,
+    geom_violin,
+    ggplot,
+    scale_y_continuous,
+)
 
 n = 50
 random_state = np.random.RandomState(123)
@@ -78,3 +85,34 @@ def test_style():
     )
 
     assert p == "style"
+
+
+def test_groups_computed_together():
+    # The density of each group is the same as when the group is
+    # computed alone. The y limits are fixed, the bins of the
+    # counts depend on them.
+    ylim = scale_y_continuous(limits=(3, 7))
+    for method in ("density", "counts"):
+        sina = geom_sina(method=method, scale="width", random_state=123)
+        result = (
+            ggplot(data, aes("dist", "value")) + sina + ylim
+        ).layer_data()
+        for i, cat in enumerate(cats, start=1):
+            data1 = data[data["dist"] == cat]
+            expected = (
+                ggplot(data1, aes("dist", "value")) + sina + ylim
+            ).layer_data()
+            group = result[result["group"] == i]
+            np.testing.assert_allclose(group["density"], expected["density"])
+            np.testing.assert_allclose(group["scaled"], expected["scaled"])
+            assert (group["n"] == len(data1)).all()
+
+
+def test_generator_random_state():
+    def layer_data():
+        p = ggplot(data, aes("dist", "value")) + geom_sina(
+            random_state=np.random.default_rng(123)
+        )
+        return p.layer_data()
+
+    pd.testing.assert_frame_equal(layer_data(), layer_data())
@@ -11,7 +11,7 @@ from plotnine import (
     ggplot,
     stat_smooth,
 )
-from plotnine.exceptions import PlotnineWarning
+from plotnine.exceptions import PlotnineError, PlotnineWarning
 
 random_state = np.random.RandomState(1234567890)
 n = 100
@@ -290,3 +290,85 @@ class TestFormula:
             method="gls", formula="y ~ np.sin(x)", fill="red", se=True
         )
         assert p == "gls_formula"
+
+
+@pytest.mark.parametrize("large_n", ["bin", "sample"])
+@pytest.mark.parametrize("method", ["loess", "gpr"])
+def test_large_n(method, large_n):
+    rng = np.random.default_rng(123)
+    x = np.sort(rng.uniform(0, 10, 2000))
+    data = pd.DataFrame({"x": x, "y": np.sin(x) + rng.normal(0, 0.1, 2000)})
+    method_args = {}
+    if method == "gpr":
+        from sklearn.gaussian_process.kernels import RBF, WhiteKernel
+
+        method_args = {"kernel": RBF() + WhiteKernel(0.01)}
+
+    p = ggplot(data, aes("x", "y"))
+    full = (
+        p + geom_smooth(method=method, method_args=method_args.copy())
+    ).layer_data()
+    reduced = (
+        p
+        + geom_smooth(
+            method=method,
+            method_args=method_args.copy(),
+            large_n=large_n,
+            max_n=200,
+        )
+    ).layer_data()
+    np.testing.assert_allclose(reduced["x"], full["x"])
+    # The sample is noisier than the binned means
+    atol = 0.05 if large_n == "bin" else 0.1
+    np.testing.assert_allclose(reduced["y"], full["y"], atol=atol)
+
+    with pytest.raises(PlotnineError):
+        (p + geom_smooth(method=method, large_n="thin")).layer_data()
+
+    with pytest.raises(PlotnineError):
+        (p + geom_smooth(method=method, large_n=large_n, max_n=1)).layer_data()
+
+
+def test_reduce_points_zero_range():
+    from plotnine.stats.smoothers import reduce_points
+
+    data = pd.DataFrame({"x": [2.0] * 5, "y": np.arange(5.0)})
+    for strategy in ("bin", "sample"):
+        out = reduce_points(data, strategy, 2)
+        assert np.all(out["x"] == 2)
+        assert out["weight"].sum() == 5
+
+    out = reduce_points(data, "bin", 2)
+    np.testing.assert_array_equal(out["y"], data["y"])
+
+
+def test_smooth_cache():
+    from plotnine._utils.cache import SMOOTH_CACHE
+    from plotnine.options import set_option
+
+    SMOOTH_CACHE.clear()
+    old = set_option("smooth_cache", 1)
+    try:
+        p = ggplot(linear_data, aes("x", "y_noisy")) + geom_smooth(method="lm")
+        expected = p.layer_data()
+        assert (SMOOTH_CACHE.hits, SMOOTH_CACHE.misses) == (0, 1)
+
+        # Same group, same fit
+        result = (p + geom_point()).layer_data()
+        assert (SMOOTH_CACHE.hits, SMOOTH_CACHE.misses) == (1, 1)
+        pd.testing.assert_frame_equal(result, expected)
+
+        # Different parameters or data
+        (p + stat_smooth(method="lm", level=0.5)).layer_data(1)
+        p2 = ggplot(linear_data, aes("x", "y")) + geom_smooth(method="lm")
+        p2.layer_data()
+        assert (SMOOTH_CACHE.hits, SMOOTH_CACHE.misses) == (2, 3)
+
+        # The least recently used predictions are evicted to make
+        # room for new ones
+        set_option("smooth_cache", 1.5 * SMOOTH_CACHE.nbytes / 3 / 2**20)
+        (p2 + stat_smooth(method="lm", level=0.8)).layer_data(1)
+        assert len(SMOOTH_CACHE) == 1
+    finally:
+        set_option("smooth_cache", old)
+        SMOOTH_CACHE.clear()
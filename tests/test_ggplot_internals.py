@@ -11,6 +11,7 @@ from plotnine import (
     annotate,
     coord_trans,
     facet_null,
+    facet_wrap,
     geom_bar,
     geom_col,
     geom_histogram,
@@ -367,6 +368,64 @@ def test_to_pandas():
     assert p2 == "to_pandas"
 
 
+def test_to_pandas_column_projection():
+    import polars as pl
+
+    data = pl.DataFrame(
+        {
+            "x": [1, 2, 3],
+            "y": [1, 2, 3],
+            "z": ["a", "b", "c"],
+            "unused": [0, 0, 0],
+        }
+    )
+    p = (
+        ggplot(data, aes("x", "y"))
+        + geom_point(aes(color="factor(z)"))
+        + geom_line(aes(y="y * 2"), inherit_aes=False)
+        + facet_wrap("z")
+    )
+    p.layers.setup(p)
+    assert set(p.layers[0].data.columns) == {"x", "y", "z"}
+
+    # No columns, but all the rows
+    p = ggplot(data.to_arrow()) + geom_point(aes(x=1, y=2))
+    p.layers.setup(p)
+    assert p.layers[0].data.shape == (3, 0)
+
+    # Functions get all the columns
+    columns = []
+
+    def fn(d):
+        columns.extend(d.columns)
+        return d
+
+    p = ggplot(data, aes("x", "y")) + geom_point(data=fn)
+    p.layers.setup(p)
+    assert columns == ["x", "y", "z", "unused"]
+
+
+def test_layer_data_column_projection():
+    data = pd.DataFrame(
+        {
+            "x": [1, 2, 3],
+            "y": [1, 2, 3],
+            "g": ["a", "b", "c"],
+            "unused": [0, 0, 0],
+        }
+    )
+    layer_data = data.rename(columns={"x": "x2"})
+    p = (
+        ggplot(data, aes("x", "y"))
+        + geom_point(aes(group="g"))
+        + geom_line(aes("x2"), data=layer_data)
+    )
+    p.layers.setup(p)
+    assert list(p.layers[0].data.columns) == ["x", "y", "g"]
+    assert list(p.layers[1].data.columns) == ["x2", "y"]
+    assert "unused" in data
+
+
 def test_decimal_columns():
     # A pandas object column of decimal.Decimal values (e.g. from polars'
     # to_pandas()) would otherwise be treated as discrete and rejected by a
@@ -421,7 +480,47 @@ def test_pickle_ggplot():
     pickle_and_unpickle(p)
 
 
+def test_pickle_saved_ggplot():
+    import io
+
+    p = ggplot(data, aes("x", "y")) + geom_point()
+    p.save(io.BytesIO(), format="png", verbose=False)
+    pickle_and_unpickle(p)
+
+
 def test_pickle_matplotlib_figure():
     p = ggplot(data, aes("x", "y")) + geom_point()
     fig = p.draw()
     pickle_and_unpickle(fig)
+
+
+def test_build_cache():
+    from plotnine._utils.cache import BUILD_CACHE
+    from plotnine.options import set_option
+
+    BUILD_CACHE.clear()
+    old = set_option("build_cache", 4)
+    try:
+        p = ggplot(data, aes("x")) + geom_histogram(bins=5)
+        (p + theme_gray()).draw()
+        assert (BUILD_CACHE.hits, BUILD_CACHE.misses) == (0, 1)
+
+        # Rendering changes do not require a new build
+        p2 = p + labs(title="Title")
+        fig = p2.draw()
+        assert (BUILD_CACHE.hits, BUILD_CACHE.misses) == (1, 1)
+        assert p2.labels.title == "Title"
+        assert len(fig.axes[0].collections) == 1
+
+        # Other changes do
+        (p + geom_point(aes(y="y"))).draw()
+        (p + xlim(-5, 20)).draw()
+        assert (BUILD_CACHE.hits, BUILD_CACHE.misses) == (1, 3)
+
+        # So does replacing the data
+        p3 = p + labs()
+        p3.data = data.assign(x=data["x"] * 10)
+        assert p3.layer_data()["xmax"].max() > data["x"].max() * 5
+    finally:
+        set_option("build_cache", old)
+        BUILD_CACHE.clear()
@@ -12,6 +12,8 @@ from plotnine import (
     geom_text,
     ggplot,
     ggsave,
+    ggtitle,
+    save_many,
     theme_xkcd,
 )
 from plotnine.data import mtcars
@@ -108,6 +110,29 @@ class TestArguments:
         p.save(fn2, dpi=72, verbose=False)
         assert_exist_and_clean(fn2, "Saving with theme_xkcd and dpi (2)")
 
+    def test_save_many(self):
+        filenames = ["save_many-01.png", "save_many-02.svg"]
+        plots = (p + ggtitle(fn) for fn in filenames)
+        with pytest.warns(PlotnineWarning) as record:
+            save_many(plots, filenames, workers=2, width=4, height=3)
+
+        for fn in filenames:
+            assert_exist_and_clean(fn, "save_many")
+
+        res = ["filename" in str(item.message).lower() for item in record]
+        assert sum(res) == len(filenames)
+
+    def test_save_many_mismatched_lengths(self):
+        filenames = ["save_many_mismatched-01.png"]
+        plots = [p, p + ggtitle("2")]
+        with pytest.raises(ValueError):
+            save_many(plots, filenames, workers=1, verbose=False)
+        assert_exist_and_clean(filenames[0], "save_many")
+
+        with pytest.raises(ValueError):
+            save_many(plots[:1], filenames * 2, workers=1, verbose=False)
+        assert_exist_and_clean(filenames[0], "save_many")
+
 
 class TestExceptions:
     def test_unknown_format(self):
@@ -0,0 +1,78 @@
+from io import BytesIO
+
+import pytest
+
+from plotnine import aes, facet_wrap, geom_point, ggplot, stat_smooth
+from plotnine.data import mtcars
+from plotnine.options import set_option
+
+
+@pytest.fixture
+def profile_option():
+    old = set_option("profile", True)
+    yield
+    set_option("profile", old)
+
+
+p = (
+    ggplot(mtcars, aes("wt", "mpg"))
+    + geom_point()
+    + stat_smooth(method="lm")
+    + facet_wrap("am")
+)
+
+
+def test_no_profile_by_default():
+    _p = p + geom_point()
+    _p.draw()
+    assert _p.profile is None
+
+
+def test_profile_report(profile_option):
+    _p = p + geom_point()
+    _p.save(BytesIO(), format="png", verbose=False)
+    report = _p.profile
+    assert report is not None
+
+    stages = {t.stage for t in report.timings}
+    expected = {
+        "layers_setup",
+        "layout_setup",
+        "compute_aesthetics",
+        "transform",
+        "train_position",
+        "map_position",
+        "compute_statistic",
+        "compute_panel",
+        "compute_position",
+        "use_defaults_after_scale",
+        "finish_data",
+        "build",
+        "facet_setup",
+        "draw_layers",
+        "draw_panel",
+        "draw_breaks_and_labels",
+        "guides_draw",
+        "theme_apply",
+        "layout_engine",
+    }
+    assert expected <= stages
+
+    df = report.to_frame()
+    assert list(df.columns) == [
+        "stage",
+        "layer",
+        "panel",
+        "seconds",
+        "peak_memory",
+    ]
+    assert (df["seconds"] >= 0).all()
+    assert (df["peak_memory"] >= 0).all()
+
+    # Per layer and per panel stages, 3 layers & 2 panels
+    panels = df[df["stage"] == "compute_panel"]
+    assert set(panels["layer"]) == {0, 1, 2}
+    assert set(panels["panel"]) == {1, 2}
+
+    # The build contains the stages within it
+    assert report.total("build") >= report.total("compute_statistic")
@@ -73,6 +73,11 @@ class TestArguments:
             save_as_pdf_pages(plots, fn)
         # assert False, "Check %s" % fn  # Uncomment to check
 
+    def test_workers(self):
+        fn = "workers.pdf"
+        save_as_pdf_pages(p(), fn, verbose=False, workers=2)
+        assert_exist_and_clean(fn, "workers")
+
 
 class TestExceptions:
     def test_plot_exception(self):
@@ -91,6 +96,19 @@ class TestExceptions:
         assert not fn_path.exists()
 
 
+def test_draw_page_is_detached_from_plot():
+    import pickle
+
+    from plotnine._mpl.layout_manager import PlotnineLayoutEngine
+    from plotnine.ggplot import _draw_page
+
+    # The figure sent back by a worker process does not carry the plot
+    fig, _ = _draw_page(next(p()))
+    assert not isinstance(fig.get_layout_engine(), PlotnineLayoutEngine)
+    assert b"ggplot" not in pickle.dumps(fig)
+    assert plt.get_fignums() == []
+
+
 # This should be the last function in the file since it can catch
 # "leakages" due to the tests in this test module.
 def test_save_as_pdf_pages_closes_plots():
@@ -1,4 +1,5 @@
 import numpy as np
+import pandas as pd
 import pytest
 
 from plotnine import aes, geom_bar, ggplot
@@ -88,6 +89,39 @@ def test_stat_extending():
     p.draw_test()  # pyright: ignore[reportAttributeAccessIssue]
 
 
+def test_stat_compute_groups():
+    class stat_xyz(stat):
+        REQUIRED_AES = {"x", "y"}
+
+        def compute_groups(self, data, bounds, scales):
+            # The number of rows in each group
+            return pd.DataFrame(
+                {
+                    "group": data["group"].iloc[bounds[:-1]],
+                    "n": np.diff(bounds),
+                    "x": 1,
+                    "y": 1,
+                }
+            )
+
+    p = ggplot(mtcars, aes("wt", "mpg", color="factor(cyl)")) + stat_xyz(
+        geom="point"
+    )
+    data = p.layer_data()
+    assert data["n"].tolist() == [11, 7, 14]
+    # Columns that are constant within the groups are kept
+    assert data["PANEL"].tolist() == [1, 1, 1]
+
+    # A subclass that overrides compute_group does not use the
+    # compute_groups of its parent
+    class stat_xyz2(stat_xyz):
+        def compute_group(self, data, scales):
+            return data
+
+    p = ggplot(mtcars, aes("wt", "mpg")) + stat_xyz2(geom="point")
+    assert len(p.layer_data()) == len(mtcars)
+
+
 def test_calculated_expressions():
     p = ggplot(mtcars, aes(x="factor(cyl)", y="..count..+1")) + geom_bar()
     # No exception
@@ -1,3 +1,5 @@
+import importlib
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -78,3 +80,72 @@ def test_stat_summary_raises_on_invalid_parameters():
         geom_point(stat_summary(funy=np.mean))
     with pytest.raises(TypeError):
         geom_point(stat_summary(does_not_exist=1))
+
+
+def test_bootstrap_in_chunks(monkeypatch):
+    # The module, the package exports the stat by the same name
+    stat_summary_module = importlib.import_module(
+        "plotnine.stats.stat_summary"
+    )
+
+    series = pd.Series(np.arange(50.0))
+    expected = stat_summary_module.mean_cl_boot(
+        series, random_state=np.random.RandomState(123)
+    )
+    monkeypatch.setattr(stat_summary_module, "BOOTSTRAP_CHUNK_SIZE", 500)
+    result = stat_summary_module.mean_cl_boot(
+        series, random_state=np.random.RandomState(123)
+    )
+    pd.testing.assert_frame_equal(result, expected)
+
+
+def test_mean_cl_boot_groups():
+    rng = np.random.default_rng(123)
+    n = 2000
+    df = pd.DataFrame({"x": rng.integers(0, 300, n), "y": rng.normal(size=n)})
+    p = ggplot(df, aes("x", "y")) + stat_summary(
+        random_state=np.random.default_rng(42)
+    )
+    result = p.layer_data()
+    expected = df.groupby("x")["y"].agg(["mean", "sem"])
+
+    np.testing.assert_allclose(result["y"], expected["mean"])
+    assert (result["ymin"] <= result["y"]).all()
+    assert (result["y"] <= result["ymax"]).all()
+
+    # About 95% of the intervals have a width of 2*1.96 standard errors
+    ratio = (result["ymax"] - result["ymin"]) / (2 * 1.96 * expected["sem"])
+    assert 0.7 < ratio.median() < 1.1
+
+    # Same seed, same intervals
+    result2 = p.layer_data()
+    np.testing.assert_array_equal(result["ymin"], result2["ymin"])
+
+    # An integer seed is a RandomState, as it has always been
+    p1 = ggplot(df, aes("x", "y")) + stat_summary(random_state=42)
+    p2 = ggplot(df, aes("x", "y")) + stat_summary(
+        random_state=np.random.RandomState(42)
+    )
+    pd.testing.assert_frame_equal(p1.layer_data(), p2.layer_data())
+
+
+@pytest.mark.parametrize(
+    "fun_data", ["mean_cl_normal", "mean_sdl", "median_hilow", "mean_se"]
+)
+def test_summary_groups_functions(fun_data):
+    # The summaries of all the groups at once are those of
+    # each group in turn
+    stat_summary_module = importlib.import_module(
+        "plotnine.stats.stat_summary"
+    )
+    func = stat_summary_module.function_dict[fun_data]
+    rng = np.random.default_rng(123)
+    n = 1000
+    df = pd.DataFrame({"x": rng.integers(0, 100, n), "y": rng.normal(size=n)})
+    p = ggplot(df, aes("x", "y")) + stat_summary(fun_data=fun_data)
+    result = p.layer_data()
+    expected = pd.concat(
+        [func(g["y"]) for _, g in df.groupby("x")], ignore_index=True
+    )
+    for col in ("y", "ymin", "ymax"):
+        np.testing.assert_allclose(result[col], expected[col])
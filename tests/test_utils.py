@@ -9,11 +9,15 @@ import pandas as pd
 from plotnine._utils import (
     _margins,
     add_margins,
+    group_bounds,
+    group_uniquecols,
     join_keys,
     match,
     ninteraction,
     pivot_apply,
     remove_missing,
+    to_rgba,
+    to_rgba_array,
     uniquecols,
 )
 from plotnine.data import mtcars
@@ -102,7 +106,7 @@ def test_ninteraction():
         data = pd.DataFrame(case)
         rank = data.rank(method="min")
         rank = rank[0].astype(int).tolist()
-        rank_data = ninteraction(data)
+        rank_data = ninteraction(data).tolist()
         assert rank == rank_data
 
     # duplicates are numbered sequentially
@@ -111,24 +115,28 @@ def test_ninteraction():
     for case in simple_vectors:
         rank = pd.DataFrame(case).rank(method="min")
         rank = rank[0].astype(int).repeat(2).tolist()
-        rank_data = ninteraction(pd.DataFrame(np.array(case).repeat(2)))
+        rank_data = ninteraction(
+            pd.DataFrame(np.array(case).repeat(2))
+        ).tolist()
         assert rank == rank_data
 
     # grids are correctly ranked
     data = pd.DataFrame(list(itertools.product([1, 2], range(1, 11))))
-    assert ninteraction(data) == list(range(1, len(data) + 1))
-    assert ninteraction(data, drop=True) == list(range(1, len(data) + 1))
+    assert ninteraction(data).tolist() == list(range(1, len(data) + 1))
+    assert ninteraction(data, drop=True).tolist() == list(
+        range(1, len(data) + 1)
+    )
 
     # zero length dataframe
     data = pd.DataFrame()
-    assert ninteraction(data) == []
+    assert ninteraction(data).tolist() == []
 
     # dataframe with single variable
     data = pd.DataFrame({"a": ["a"]})
-    assert ninteraction(data) == [1]
+    assert ninteraction(data).tolist() == [1]
 
     data = pd.DataFrame({"a": ["b"]})
-    assert ninteraction(data) == [1]
+    assert ninteraction(data).tolist() == [1]
 
 
 def test_ninteraction_drops_unused_categorical_levels_with_missing():
@@ -141,7 +149,7 @@ def test_ninteraction_drops_unused_categorical_levels_with_missing():
         }
     )
 
-    assert ninteraction(data, drop=True) == [1, 2, 3, 1]
+    assert ninteraction(data, drop=True).tolist() == [1, 2, 3, 1]
 
 
 def test_ninteraction_categorical_missing_values_get_highest_id():
@@ -154,7 +162,7 @@ def test_ninteraction_categorical_missing_values_get_highest_id():
         }
     )
 
-    assert ninteraction(data, drop=False) == [1, 3, 4, 1]
+    assert ninteraction(data, drop=False).tolist() == [1, 3, 4, 1]
 
 
 def test_ninteraction_datetime_series():
@@ -175,7 +183,24 @@ def test_ninteraction_datetime_series():
         }
     )
 
-    assert ninteraction(data1) == ninteraction(data2)
+    assert ninteraction(data1).tolist() == ninteraction(data2).tolist()
+
+
+def test_ninteraction_missing_values_and_overflow():
+    # Missing values in non-categorical columns get the highest id
+    data = pd.DataFrame({"a": [3.0, np.nan, 1.0, 3.0]})
+    assert ninteraction(data).tolist() == [2, 3, 1, 2]
+
+    data = pd.DataFrame({"a": ["b", None, "a"], "b": [1, 1, 2]})
+    assert ninteraction(data, drop=True).tolist() == [2, 3, 1]
+
+    # The cartesian product of the levels does not fit in an int64
+    rng = np.random.default_rng(123)
+    data = pd.DataFrame(rng.integers(0, 2**14, size=(2**14, 5)))
+    rows = list(map(tuple, data.to_numpy()))
+    order = {row: i for i, row in enumerate(sorted(set(rows)), start=1)}
+    expected = [order[row] for row in rows]
+    assert ninteraction(data, drop=True).tolist() == expected
 
 
 def test_join_keys():
@@ -232,6 +257,38 @@ def test_uniquecols():
     assert result.equals(data2)
 
 
+def test_group_bounds():
+    g = np.array([1, 1, 2, 2, 2, 5])
+    x = np.array([1, 2, 3, 3, 3, 4])
+    assert list(group_bounds(g)) == [0, 2, 5, 6]
+    assert list(group_bounds(g, x)) == [0, 1, 2, 5, 6]
+    assert list(group_bounds(np.array([]))) == [0]
+
+
+def test_group_uniquecols():
+    data = pd.DataFrame(
+        {
+            "group": [1, 1, 2, 2, 3],
+            "x": [1, 2, 3, 4, 5],
+            "y": ["a", "a", "b", "c", "d"],
+            "z": [8] * 5,
+        }
+    )
+    bounds = group_bounds(data["group"])
+    result = group_uniquecols(data, bounds)
+    for i, (start, end) in enumerate(zip(bounds[:-1], bounds[1:])):
+        expected = uniquecols(data.iloc[start:end])
+        row = result.iloc[[i]].dropna(axis=1).reset_index(drop=True)
+        pd.testing.assert_frame_equal(
+            row[expected.columns], expected, check_dtype=False
+        )
+
+    # "x" is constant in the single row group 3
+    assert result["x"].isna().tolist() == [True, True, False]
+    # "y" is constant in groups 1 & 3 but not in group 2
+    assert result["y"].isna().tolist() == [False, True, False]
+
+
 def test_remove_missing():
     data = pd.DataFrame({"a": [1.0, np.nan, 3, np.inf], "b": [1, 2, 3, 4]})
     data2 = pd.DataFrame({"a": [1.0, 3, np.inf], "b": [1, 3, 4]})
@@ -264,3 +321,14 @@ def test_pivot_apply():
     assert res1.index.tolist() == list("abc")
     assert res1.index.name == "id"
     assert (res1 + res2 == [12, 24, 36]).all()
+
+
+def test_to_rgba_array():
+    from matplotlib.colors import to_rgba_array as mpl_to_rgba_array
+
+    colors = pd.Series(["red", None, "#00FF0080", (0, 0, 1), "red", "none"])
+    alpha = pd.Series([1, 0.5, 0.3, 0.2, 0.5, 1])
+    result = to_rgba_array(colors, alpha)
+    expected = mpl_to_rgba_array(to_rgba(colors, alpha))
+    assert result.shape == (6, 4)
+    np.testing.assert_array_equal(result, expected)
@@ -0,0 +1,65 @@
+"""
+Time the statistics that bin the data
+
+Usage: python tools/benchmarks/bench_binning.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import (
+    aes,
+    geom_bin_2d,
+    geom_histogram,
+    ggplot,
+    stat_summary_bin,
+)
+
+SIZES = (1_000_000, 10_000_000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.normal(size=n),
+            "w": rng.uniform(size=n),
+        }
+    )
+
+
+def stat_time(p: ggplot) -> float:
+    """
+    Return the time it takes to compute the statistics of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("compute_statistic")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    cases = {
+        "bin": (aes("x", weight="w"), geom_histogram(bins=100)),
+        "bin_2d": (aes("x", "y"), geom_bin_2d(bins=100)),
+        "summary_bin": (aes("x", "y"), stat_summary_bin(bins=100)),
+    }
+    print(f"{'n':>10} {'case':>12} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for name, (mapping, layer) in cases.items():
+            t = stat_time(ggplot(data, mapping) + layer)
+            print(f"{n:>10} {name:>12} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,67 @@
+"""
+Time drawing geom_boxplot with many boxes
+
+Usage: python tools/benchmarks/bench_boxplot.py [n ...]
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, element_blank, geom_boxplot, ggplot, theme
+
+SIZES = (500, 2000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    """
+    Data for n boxes, each with 50 values
+    """
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": np.repeat(np.arange(n), 50).astype(str),
+            "y": rng.standard_t(3, size=n * 50),
+        }
+    )
+
+
+def draw_times(p: ggplot) -> tuple[float, float]:
+    """
+    Return the times to draw the layers and to render the figure
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        fig = p.draw()
+        draw = p.profile.total("draw_layers")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+    start = perf_counter()
+    fig.savefig(io.BytesIO(), format="png")
+    return draw, perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'n':>8} {'draw_layers':>12} {'render':>10}")
+    for n in sizes:
+        # Without the labels of the x-axis, rendering the boxes is
+        # what takes the most time
+        p = (
+            ggplot(make_data(n), aes("x", "y"))
+            + geom_boxplot()
+            + theme(axis_text_x=element_blank())
+        )
+        draw, render = draw_times(p)
+        print(f"{n:>8} {draw:>12.3f} {render:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,59 @@
+"""
+Time the 2D kernel density stats with each kde package
+
+Usage: python tools/benchmarks/bench_density.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_pointdensity, ggplot, stat_density_2d
+
+SIZES = (10_000, 100_000, 1_000_000)
+
+# The O(n*m) packages are only timed for the small sizes
+SLOW_PACKAGES = {"scipy": 10_000, "statsmodels": 10_000}
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame({"x": rng.normal(size=n), "y": rng.normal(size=n) * 2})
+
+
+def stat_time(p: ggplot) -> float:
+    """
+    Return the time it takes to compute the statistics of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("compute_statistic")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    layers = {
+        "density_2d": lambda package: stat_density_2d(package=package),
+        "pointdensity": lambda package: geom_pointdensity(package=package),
+    }
+    print(f"{'n':>10} {'stat':>14} {'package':>12} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for name, make_layer in layers.items():
+            for package in ("fft", *SLOW_PACKAGES):
+                if n > SLOW_PACKAGES.get(package, n):
+                    continue
+                p = ggplot(data, aes("x", "y")) + make_layer(package)
+                t = stat_time(p)
+                print(f"{n:>10} {name:>14} {package:>12} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
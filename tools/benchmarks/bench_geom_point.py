@@ -0,0 +1,59 @@
+"""
+Time the drawing of geom_point layers with many points
+
+Usage: python tools/benchmarks/bench_geom_point.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_point, ggplot
+
+SIZES = (100_000, 1_000_000, 10_000_000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.normal(size=n),
+            "g": rng.choice(list("abcd"), size=n),
+        }
+    )
+
+
+def draw_time(p: ggplot) -> float:
+    """
+    Return the time it takes to draw the layers of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("draw_layers")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    cases = {
+        "constant": aes("x", "y"),
+        "color": aes("x", "y", color="g"),
+        "shape": aes("x", "y", shape="g"),
+    }
+    print(f"{'n':>10} {'case':>10} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for name, mapping in cases.items():
+            t = draw_time(ggplot(data, mapping) + geom_point())
+            print(f"{n:>10} {name:>10} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
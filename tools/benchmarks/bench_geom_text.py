@@ -0,0 +1,60 @@
+"""
+Time the drawing of geom_text and geom_label layers with many labels
+
+Usage: python tools/benchmarks/bench_geom_text.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_label, geom_text, ggplot
+
+SIZES = (1_000, 10_000, 50_000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.normal(size=n),
+            "label": [f"p{i}" for i in range(n)],
+            "g": rng.choice(list("abcd"), size=n),
+        }
+    )
+
+
+def draw_time(p: ggplot) -> float:
+    """
+    Return the time it takes to draw the layers of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("draw_layers")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    cases = {
+        "text": geom_text(aes("x", "y", label="label")),
+        "text-color": geom_text(aes("x", "y", label="label", color="g")),
+        "label": geom_label(aes("x", "y", label="label")),
+    }
+    print(f"{'n':>10} {'case':>12} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for name, layer in cases.items():
+            t = draw_time(ggplot(data) + layer)
+            print(f"{n:>10} {name:>12} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,47 @@
+"""
+Time the count of the neighbours of each point for stat_pointdensity
+
+Usage: python tools/benchmarks/bench_kde_count.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+import numpy as np
+
+from plotnine.stats.density import kde_count
+
+SIZES = (10_000, 50_000, 200_000)
+
+# Counting the neighbours of each point against all the other points
+# takes too long beyond this size
+MAX_BRUTE_FORCE = 20_000
+
+
+def brute_force(data, grid, radius):
+    count = [np.sum(np.linalg.norm(data - g, axis=1) < radius) for g in grid]
+    return np.array(count) / len(data)
+
+
+def main(sizes):
+    rng = np.random.default_rng(123)
+    print(f"{'n':>10} {'radius':>8} {'method':>12} {'seconds':>10}")
+    for n in sizes:
+        data = rng.normal(size=(n, 2))
+        for radius in (0.05, np.ptp(data) / 10):
+            methods = {"tree": lambda: kde_count(data, data, radius=radius)}
+            if n <= MAX_BRUTE_FORCE:
+                methods["brute-force"] = lambda: brute_force(
+                    data, data, radius
+                )
+            for name, method in methods.items():
+                t0 = perf_counter()
+                method()
+                t = perf_counter() - t0
+                print(f"{n:>10} {radius:>8.2f} {name:>12} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,63 @@
+"""
+Time the setup of the layer data for wide dataframes
+
+Usage: python tools/benchmarks/bench_layer_data.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_line, geom_point, geom_smooth, ggplot
+
+SIZES = (100_000, 1_000_000)
+NCOLS = 200
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {f"c{i}": rng.normal(size=n) for i in range(NCOLS)}
+        | {"g": rng.choice(list("abcd"), size=n)}
+    )
+
+
+def setup_time(p: ggplot) -> float:
+    """
+    Return the time it takes to give the layers their data
+    """
+    t0 = perf_counter()
+    p.layers.setup(p)
+    return perf_counter() - t0
+
+
+def main(sizes):
+    import polars as pl
+
+    print(f"{'n':>10} {'data':>10} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        kinds = {
+            "pandas": data,
+            "polars": pl.from_pandas(data),
+            "arrow": pl.from_pandas(data).to_arrow(),
+        }
+        for name, df in kinds.items():
+            p = (
+                ggplot(df, aes("c0", "c1", color="g"))
+                + geom_point()
+                + geom_line(aes(y="c2"))
+                + geom_smooth()
+                + geom_point(aes(y="c3"))
+                + geom_line(aes(y="c4"))
+            )
+            t = setup_time(p)
+            print(f"{n:>10} {name:>10} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
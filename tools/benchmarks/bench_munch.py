@@ -0,0 +1,64 @@
+"""
+Time drawing a path with many vertices in a transformed coordinate system
+
+Usage: python tools/benchmarks/bench_munch.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, coord_trans, geom_path, ggplot
+from plotnine.options import set_option
+
+SIZES = (100_000, 500_000)
+LIMITS = (None, 2_000_000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    """
+    A path that zig-zags across the panel
+
+    Each segment is long enough to be subdivided into many points.
+    """
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": np.arange(1, n + 1),
+            "y": rng.uniform(1, 100, size=n),
+        }
+    )
+
+
+def draw_time(p: ggplot) -> float:
+    """
+    Return the time it takes to draw the plot
+    """
+    start = perf_counter()
+    p.draw()
+    return perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'n':>10} {'munch_limit':>12} {'seconds':>10}")
+    for n in sizes:
+        p = (
+            ggplot(make_data(n), aes("x", "y"))
+            + geom_path()
+            + coord_trans(x="log10", y="log10")
+        )
+        for limit in LIMITS:
+            old = set_option("munch_limit", limit)
+            try:
+                t = draw_time(p)
+            finally:
+                set_option("munch_limit", old)
+            print(f"{n:>10} {limit or '-':>12} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
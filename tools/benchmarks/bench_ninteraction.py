@@ -0,0 +1,48 @@
+"""
+Time the computation of the group ids of discrete columns
+
+Usage: python tools/benchmarks/bench_ninteraction.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from plotnine._utils import ninteraction
+
+SIZES = (100_000, 1_000_000, 5_000_000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "str": rng.choice(list("abcdefgh"), size=n),
+            "cat": pd.Categorical(rng.choice(list("wxyz"), size=n)),
+            "int": rng.integers(0, 100, size=n),
+        }
+    )
+
+
+def main(sizes):
+    cases = {
+        "str": ["str"],
+        "cat": ["cat"],
+        "str-cat-int": ["str", "cat", "int"],
+    }
+    print(f"{'n':>10} {'case':>12} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for name, columns in cases.items():
+            t0 = perf_counter()
+            ninteraction(data[columns], drop=True)
+            t = perf_counter() - t0
+            print(f"{n:>10} {name:>12} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
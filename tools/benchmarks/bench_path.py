@@ -0,0 +1,64 @@
+"""
+Time drawing geom_path with colors that vary along the paths
+
+Usage: python tools/benchmarks/bench_path.py [n ...]
+"""
+
+from __future__ import annotations
+
+import io
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, geom_path, ggplot
+
+SIZES = (100_000, 1_000_000)
+NPATHS = 100
+
+
+def make_data(n: int) -> pd.DataFrame:
+    """
+    Random walks, each colored by the time along it
+    """
+    rng = np.random.default_rng(123)
+    m = n // NPATHS
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=(NPATHS, m)).cumsum(axis=1).ravel(),
+            "y": rng.normal(size=(NPATHS, m)).cumsum(axis=1).ravel(),
+            "t": np.tile(np.arange(m), NPATHS),
+            "g": np.repeat(np.arange(NPATHS), m),
+        }
+    )
+
+
+def draw_times(p: ggplot) -> tuple[float, float]:
+    """
+    Return the times to draw the plot and to render the figure
+
+    The draw is not timed with the profile option, tracing the memory
+    of the million matplotlib paths would dominate the time.
+    """
+    start = perf_counter()
+    fig = p.draw()
+    draw = perf_counter() - start
+
+    start = perf_counter()
+    fig.savefig(io.BytesIO(), format="png")
+    return draw, perf_counter() - start
+
+
+def main(sizes):
+    print(f"{'n':>10} {'draw':>10} {'render':>10}")
+    for n in sizes:
+        p = ggplot(make_data(n), aes("x", "y", group="g", color="t"))
+        p += geom_path()
+        draw, render = draw_times(p)
+        print(f"{n:>10} {draw:>10.3f} {render:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,60 @@
+"""
+Time stat_quantile with many quantiles and groups
+
+Usage: python tools/benchmarks/bench_quantile.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, ggplot, stat_quantile
+
+SIZES = (10_000, 100_000)
+QUANTILES = tuple(np.round(np.linspace(0.05, 0.95, 19), 2))
+NGROUPS = 4
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    x = rng.uniform(0, 10, size=n)
+    return pd.DataFrame(
+        {
+            "x": x,
+            "y": x * (1 + rng.uniform(size=n)),
+            "g": rng.integers(NGROUPS, size=n).astype(str),
+        }
+    )
+
+
+def stat_time(p: ggplot) -> float:
+    """
+    Return the time it takes to compute the statistics of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("compute_statistic")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    print(f"{'n':>10} {'workers':>8} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for workers in (1, None):
+            p = ggplot(data, aes("x", "y", color="g")) + stat_quantile(
+                quantiles=QUANTILES, workers=workers
+            )
+            t = stat_time(p)
+            print(f"{n:>10} {workers or 'all':>8} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
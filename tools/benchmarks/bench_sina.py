@@ -0,0 +1,57 @@
+"""
+Time stat_sina with many categories
+
+Usage: python tools/benchmarks/bench_sina.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, ggplot, stat_sina
+
+SIZES = (100_000, 1_000_000)
+NCATEGORIES = 300
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": rng.integers(NCATEGORIES, size=n).astype(str),
+            "y": rng.normal(size=n),
+        }
+    )
+
+
+def stat_time(p: ggplot) -> float:
+    """
+    Return the time it takes to compute the statistics of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("compute_statistic")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    print(f"{'n':>10} {'method':>8} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for method in ("density", "counts"):
+            p = ggplot(data, aes("x", "y")) + stat_sina(
+                method=method, random_state=123
+            )
+            t = stat_time(p)
+            print(f"{n:>10} {method:>8} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,53 @@
+"""
+Time stat_smooth with loess and gpr fit to a reduced number of points
+
+Usage: python tools/benchmarks/bench_smooth.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, ggplot, stat_smooth
+
+SIZES = (100_000, 1_000_000)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    x = rng.uniform(0, 10, size=n)
+    return pd.DataFrame({"x": x, "y": np.sin(x) + rng.normal(size=n)})
+
+
+def stat_time(p: ggplot) -> float:
+    """
+    Return the time it takes to compute the statistics of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("compute_statistic")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    print(f"{'n':>10} {'method':>8} {'large_n':>8} {'seconds':>10}")
+    for n in sizes:
+        data = make_data(n)
+        for method in ("loess", "gpr"):
+            for large_n in ("bin", "sample"):
+                p = ggplot(data, aes("x", "y")) + stat_smooth(
+                    method=method, method_args={}, large_n=large_n
+                )
+                t = stat_time(p)
+                print(f"{n:>10} {method:>8} {large_n:>8} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
@@ -0,0 +1,56 @@
+"""
+Time stat_summary with the built-in summaries for many groups
+
+Usage: python tools/benchmarks/bench_stat_summary.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, ggplot, stat_summary
+
+SIZES = (100_000, 1_000_000)
+NGROUPS = (1, 100, 5000)
+FUNCTIONS = ("mean_cl_boot", "mean_cl_normal", "median_hilow", "mean_se")
+
+
+def make_data(n: int, ngroups: int) -> pd.DataFrame:
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {"x": rng.integers(0, ngroups, size=n), "y": rng.normal(size=n)}
+    )
+
+
+def stat_time(p: ggplot) -> float:
+    """
+    Return the time it takes to compute the statistics of the plot
+    """
+    from plotnine.options import set_option
+
+    old = set_option("profile", True)
+    try:
+        p.draw()
+        return p.profile.total("compute_statistic")  # pyright: ignore
+    finally:
+        set_option("profile", old)
+
+
+def main(sizes):
+    print(f"{'n':>10} {'groups':>8} {'function':>15} {'seconds':>10}")
+    for n in sizes:
+        for ngroups in NGROUPS:
+            data = make_data(n, ngroups)
+            for fun_data in FUNCTIONS:
+                p = ggplot(data, aes("x", "y")) + stat_summary(
+                    fun_data=fun_data, random_state=1
+                )
+                t = stat_time(p)
+                print(f"{n:>10} {ngroups:>8} {fun_data:>15} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)
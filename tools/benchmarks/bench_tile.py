@@ -0,0 +1,59 @@
+"""
+Time drawing a geom_tile heatmap as an image, as rectangles & in a
+transformed coordinate system
+
+Usage: python tools/benchmarks/bench_tile.py [n ...]
+"""
+
+from __future__ import annotations
+
+import sys
+from time import perf_counter
+
+import numpy as np
+import pandas as pd
+
+from plotnine import aes, coord_trans, geom_tile, ggplot
+
+SIZES = (100, 200)
+
+
+def make_data(n: int) -> pd.DataFrame:
+    """
+    An n x n grid of tiles
+    """
+    rng = np.random.default_rng(123)
+    return pd.DataFrame(
+        {
+            "x": np.tile(np.arange(1, n + 1), n),
+            "y": np.repeat(np.arange(1, n + 1), n),
+            "z": rng.normal(size=n * n),
+        }
+    )
+
+
+def draw_time(p: ggplot) -> float:
+    """
+    Return the time it takes to draw the plot
+    """
+    start = perf_counter()
+    p.draw()
+    return perf_counter() - start
+
+
+def main(sizes):
+    cases = {
+        "image": geom_tile(),
+        "rectangles": geom_tile(image=False),
+        "trans": [geom_tile(), coord_trans(x="log10", y="log10")],
+    }
+    print(f"{'n':>6} {'case':>10} {'seconds':>10}")
+    for n in sizes:
+        p = ggplot(make_data(n), aes("x", "y", fill="z"))
+        for name, case in cases.items():
+            t = draw_time(p + case)
+            print(f"{n:>6} {name:>10} {t:>10.3f}")
+
+
+if __name__ == "__main__":
+    main([int(x) for x in sys.argv[1:]] or SIZES)